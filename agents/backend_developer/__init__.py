@@ -1,3 +0,0 @@
-from .agent import BackendDeveloperAgent
-
-__all__ = ['BackendDeveloperAgent']
@@ -1,3 +0,0 @@
-from .agent import BusinessIntelligenceAnalystAgent
-
-__all__ = ['BusinessIntelligenceAnalystAgent']
@@ -1,3 +0,0 @@
-from .agent import CloudArchitectAgent
-
-__all__ = ['CloudArchitectAgent']
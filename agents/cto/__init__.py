@@ -1,3 +0,0 @@
-from .agent import CTOAgent
-
-__all__ = ['CTOAgent']
@@ -1,3 +0,0 @@
-from .agent import DataAnalystAgent
-
-__all__ = ['DataAnalystAgent']
@@ -1,3 +0,0 @@
-from .agent import DataEngineerAgent
-
-__all__ = ['DataEngineerAgent']
@@ -1,3 +0,0 @@
-from .agent import DatabaseAdministratorAgent
-
-__all__ = ['DatabaseAdministratorAgent']
@@ -1,3 +0,0 @@
-from .agent import DevOpsEngineerAgent
-
-__all__ = ['DevOpsEngineerAgent']
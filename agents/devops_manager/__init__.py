@@ -1,3 +0,0 @@
-from .agent import DevOpsManagerAgent
-
-__all__ = ['DevOpsManagerAgent']
@@ -1,3 +0,0 @@
-from .agent import EngineeringManagerAgent
-
-__all__ = ['EngineeringManagerAgent']
@@ -1,3 +0,0 @@
-from .agent import FrontendDeveloperAgent
-
-__all__ = ['FrontendDeveloperAgent']
@@ -1,3 +0,0 @@
-from .agent import FullStackDeveloperAgent
-
-__all__ = ['FullStackDeveloperAgent']
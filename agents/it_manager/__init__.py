@@ -1,3 +0,0 @@
-from .agent import ITManagerAgent
-
-__all__ = ['ITManagerAgent']
@@ -1,3 +0,0 @@
-from .agent import ITSupportL1Agent
-
-__all__ = ['ITSupportL1Agent']
@@ -1,3 +0,0 @@
-from .agent import ITSupportL2Agent
-
-__all__ = ['ITSupportL2Agent']
@@ -1,3 +0,0 @@
-from .agent import ITSupportL3Agent
-
-__all__ = ['ITSupportL3Agent']
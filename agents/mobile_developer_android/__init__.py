@@ -1,3 +0,0 @@
-from .agent import MobileDeveloperAndroidAgent
-
-__all__ = ['MobileDeveloperAndroidAgent']
@@ -1,3 +0,0 @@
-from .agent import MobileDeveloperIOSAgent
-
-__all__ = ['MobileDeveloperIOSAgent']
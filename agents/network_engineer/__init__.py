@@ -1,3 +0,0 @@
-from .agent import NetworkEngineerAgent
-
-__all__ = ['NetworkEngineerAgent']
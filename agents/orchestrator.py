@@ -1,202 +1,62 @@
 from typing import Dict, List, Optional, Any
+import asyncio
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent))
 
-from backend_developer.agent import BackendDeveloperAgent
-from devops_engineer.agent import DevOpsEngineerAgent
-from product_manager.agent import ProductManagerAgent
-from qa_engineer.agent import QAEngineerAgent
-from frontend_developer.agent import FrontendDeveloperAgent
-from data_engineer.agent import DataEngineerAgent
-from project_manager.agent import ProjectManagerAgent
-from scrum_master.agent import ScrumMasterAgent
-from fullstack_developer.agent import FullStackDeveloperAgent
-from mobile_developer_android.agent import MobileDeveloperAndroidAgent
-from mobile_developer_ios.agent import MobileDeveloperIOSAgent
-from security_engineer.agent import SecurityEngineerAgent
-from site_reliability_engineer.agent import SiteReliabilityEngineerAgent
-from database_administrator.agent import DatabaseAdministratorAgent
-from data_analyst.agent import DataAnalystAgent
-from business_intelligence_analyst.agent import BusinessIntelligenceAnalystAgent
-from cloud_architect.agent import CloudArchitectAgent
-from solutions_architect.agent import SolutionsArchitectAgent
-from network_engineer.agent import NetworkEngineerAgent
-from system_administrator.agent import SystemAdministratorAgent
-from it_support_l1.agent import ITSupportL1Agent
-from it_support_l2.agent import ITSupportL2Agent
-from it_support_l3.agent import ITSupportL3Agent
-from engineering_manager.agent import EngineeringManagerAgent
-from devops_manager.agent import DevOpsManagerAgent
-from it_manager.agent import ITManagerAgent
-from cto.agent import CTOAgent
-from ui_ux_designer.agent import UIUXDesignerAgent
-from technical_writer.agent import TechnicalWriterAgent
+from utils.agent_registry import create_agent, list_agent_names
+from utils.cascade import cascade_stats
+from utils.checkpoint import CheckpointedRun, CheckpointStore, StepRecord
+from utils.context_guard import context_metrics
+from utils.fanout import fanout_stats, group_by_prompt
+from utils.ollama_pool import get_ollama_pool
 from utils.meeting import Meeting, MeetingType, MeetingParticipantSelector
 
+MEETING_PROMPT = """You are in the {meeting_type} meeting "{title}".
+{description}
+
+Topic: {topic}
+
+Discussion so far:
+{discussion}
+
+Give your input on this topic from your role's perspective."""
+
 class AgentOrchestrator:
     def __init__(
         self,
         model_name: str = "llama3.2",
         temperature: float = 0.7,
-        role_folder: str = "Role"
+        role_folder: str = "Role",
+        cascade: bool = False,
+        checkpoint_dir: Optional[str] = None,
+        dedupe_prompts: bool = True
     ):
         self.agents: Dict[str, Any] = {}
         self.model_name = model_name
         self.temperature = temperature
         self.role_folder = role_folder
+        # Small model first, escalating to model_name per the manifest's cascade policies.
+        self.cascade = cascade
         self.meetings: List[Meeting] = []
+        # Runs given a run_id are checkpointed here step by step and resumed on re-run.
+        self.checkpoints = CheckpointStore(checkpoint_dir)
+        # Fan-out generates once per distinct effective prompt and shares the answer.
+        self.dedupe_prompts = dedupe_prompts
 
         self._initialize_agents()
     
     def _initialize_agents(self):
         self.agents = {
-            "backend_developer": BackendDeveloperAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "frontend_developer": FrontendDeveloperAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "fullstack_developer": FullStackDeveloperAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "mobile_developer_android": MobileDeveloperAndroidAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "mobile_developer_ios": MobileDeveloperIOSAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "devops_engineer": DevOpsEngineerAgent(
+            agent_name: create_agent(
+                agent_name,
                 model_name=self.model_name,
                 temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "devops_manager": DevOpsManagerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "site_reliability_engineer": SiteReliabilityEngineerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "security_engineer": SecurityEngineerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "product_manager": ProductManagerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "project_manager": ProjectManagerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "scrum_master": ScrumMasterAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "engineering_manager": EngineeringManagerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "it_manager": ITManagerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "cto": CTOAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "qa_engineer": QAEngineerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "data_engineer": DataEngineerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "data_analyst": DataAnalystAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "business_intelligence_analyst": BusinessIntelligenceAnalystAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "database_administrator": DatabaseAdministratorAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "cloud_architect": CloudArchitectAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "solutions_architect": SolutionsArchitectAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "network_engineer": NetworkEngineerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "system_administrator": SystemAdministratorAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "it_support_l1": ITSupportL1Agent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "it_support_l2": ITSupportL2Agent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "it_support_l3": ITSupportL3Agent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "ui_ux_designer": UIUXDesignerAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
-            ),
-            "technical_writer": TechnicalWriterAgent(
-                model_name=self.model_name,
-                temperature=self.temperature,
-                role_folder=self.role_folder
+                role_folder=self.role_folder,
+                cascade=self.cascade
             )
+            for agent_name in list_agent_names()
         }
     
     def get_agent(self, agent_name: str):
@@ -218,26 +78,145 @@ class AgentOrchestrator:
     def multi_agent_consultation(
         self,
         query: str,
-        agent_names: List[str]
-    ) -> Dict[str, str]:
+        agent_names: List[str],
+        min_responses: Optional[int] = None,
+        deadline: Optional[float] = None,
+        with_attribution: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Ask each agent the same query and collect their answers
+
+        With `with_attribution=True` returns {"responses", "shared_from"},
+        where "shared_from" maps each agent that reused a shared generation
+        in this call to the agent whose call produced it.
+        """
+        if min_responses is not None or deadline is not None:
+            report = self.quorum_consultation(query, agent_names, min_responses, deadline)
+            if with_attribution:
+                return {"responses": report["responses"], "shared_from": report["shared_from"]}
+            return report["responses"]
+        
+        names = [name for name in dict.fromkeys(agent_names) if name in self.agents]
         responses = {}
+        shared_from = {}
         
-        for agent_name in agent_names:
-            if agent_name in self.agents:
-                agent = self.agents[agent_name]
-                responses[agent_name] = agent.chat(query)
+        for members in self._prompt_groups(query, names).values():
+            response = self.agents[members[0]].chat(query)
+            self._share_response(query, response, members)
+            responses.update(dict.fromkeys(members, response))
+            shared_from.update(dict.fromkeys(members[1:], members[0]))
         
+        responses = {name: responses[name] for name in names}
+        if with_attribution:
+            return {"responses": responses, "shared_from": shared_from}
         return responses
     
+    def _prompt_groups(self, query: str, names: List[str]) -> Dict[str, List[str]]:
+        """Agents grouped by effective prompt; the first of each group generates for all."""
+        if not self.dedupe_prompts:
+            return {name: [name] for name in names}
+        groups = group_by_prompt({name: self.agents[name] for name in names}, query)
+        fanout_stats.record(groups)
+        return groups
+    
+    def _share_response(self, query: str, response: str, members: List[str]):
+        # The other members keep the exchange in memory as if they had generated it.
+        for name in members[1:]:
+            self.agents[name].restore_history([
+                {"role": "user", "content": query},
+                {"role": "assistant", "content": response}
+            ])
+    
+    def quorum_consultation(
+        self,
+        query: str,
+        agent_names: List[str],
+        min_responses: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Ask agents concurrently and stop at a quorum or a deadline
+
+        Returns once `min_responses` answers have arrived (all agents by
+        default) or `deadline` seconds have passed. Generations still running
+        are cancelled, which disconnects them from Ollama so it stops
+        generating; those agents are listed under "cut_off". Agents that
+        raised are listed under "failed" and do not count towards the quorum.
+        Agents with identical prompts share one generation; "shared_from"
+        maps each of them to the agent whose call produced the answer.
+        
+        This runs its own event loop; from async code await
+        `aquorum_consultation` instead.
+        """
+        return asyncio.run(self.aquorum_consultation(query, agent_names, min_responses, deadline))
+    
+    async def aquorum_consultation(
+        self,
+        query: str,
+        agent_names: List[str],
+        min_responses: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Async `quorum_consultation`, for callers already inside an event loop."""
+        names = [name for name in dict.fromkeys(agent_names) if name in self.agents]
+        quorum = min(min_responses or len(names), len(names))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        end = started + deadline if deadline is not None else None
+        
+        groups = list(self._prompt_groups(query, names).values())
+        tasks = {asyncio.ensure_future(self.agents[members[0]].achat(query)): members for members in groups}
+        pending = set(tasks)
+        responses: Dict[str, str] = {}
+        failed: Dict[str, str] = {}
+        
+        while pending and len(responses) < quorum:
+            timeout = None if end is None else max(0.0, end - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                members = tasks[task]
+                if task.exception() is not None:
+                    failed.update(dict.fromkeys(members, str(task.exception())))
+                else:
+                    self._share_response(query, task.result(), members)
+                    responses.update(dict.fromkeys(members, task.result()))
+        
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        cut_off = {name for task in pending for name in tasks[task]}
+        
+        return {
+            # Keep answers in the order the caller listed the agents.
+            "responses": {name: responses[name] for name in names if name in responses},
+            "cut_off": [name for name in names if name in cut_off],
+            "failed": {name: failed[name] for name in names if name in failed},
+            "shared_from": {
+                name: members[0] for members in groups for name in members[1:] if name in responses
+            },
+            "quorum_met": len(responses) >= quorum,
+            "elapsed_seconds": loop.time() - started
+        }
+    
     def collaborative_task(
         self,
         task_description: str,
-        workflow: List[Dict[str, str]]
+        workflow: List[Dict[str, str]],
+        run_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
+        """
+        Run workflow steps in order, each seeing the previous responses
+
+        With a `run_id` every finished step is checkpointed; calling again
+        with the same run ID resumes from the first incomplete step.
+        """
+        run = CheckpointedRun(self.checkpoints, run_id, "collaborative_task") if run_id else None
         results = []
         context = task_description
         
-        for step in workflow:
+        for index, step in enumerate(workflow):
             agent_name = step.get("agent")
             action = step.get("action", "chat")
             
@@ -250,14 +229,21 @@ class AgentOrchestrator:
             
             agent = self.agents[agent_name]
             
-            if action == "chat":
-                response = agent.chat(context)
-            else:
+            def compute(agent=agent, action=action, step=step, context=context):
+                if action == "chat":
+                    return agent.chat(context)
+                if action in agent.list_skills():
+                    # Skills run statelessly unless the step asks for the agent's history.
+                    return agent.use_skill(action, context, use_history=step.get("use_history"))
                 method = getattr(agent, action, None)
                 if method and callable(method):
-                    response = method(context)
-                else:
-                    response = agent.chat(context)
+                    return method(context)
+                return agent.chat(context)
+            
+            if run is None:
+                response = compute()
+            else:
+                response = run.run_step(index, agent_name, agent, action, context, compute)
             
             results.append({
                 "agent": agent_name,
@@ -269,6 +255,104 @@ class AgentOrchestrator:
         
         return results
     
+    def create_meeting(self, meeting_type: MeetingType, title: str, description: str, **kwargs) -> Meeting:
+        meeting = MeetingParticipantSelector.create_meeting(meeting_type, title, description, **kwargs)
+        self.meetings.append(meeting)
+        return meeting
+    
+    def get_available_meeting_types(self) -> List[str]:
+        return [meeting_type.value for meeting_type in MeetingType]
+    
+    def get_meeting_participants_for_type(self, meeting_type: MeetingType) -> List[str]:
+        return MeetingParticipantSelector.get_participants(meeting_type)
+    
+    def conduct_meeting(
+        self,
+        meeting: Meeting,
+        topics: List[str],
+        run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Go through the topics, asking each participant in turn
+
+        Participants see what was said before them on the same topic. Each
+        contribution is a step; with a `run_id` the meeting is checkpointed
+        and resumed like collaborative_task.
+        """
+        run = CheckpointedRun(self.checkpoints, run_id, "meeting") if run_id else None
+        participants = [name for name in meeting.participants if name in self.agents]
+        discussion: List[Dict[str, str]] = []
+        step = 0
+        
+        for topic in topics:
+            said = []
+            for agent_name in participants:
+                agent = self.agents[agent_name]
+                prompt = MEETING_PROMPT.format(
+                    title=meeting.title,
+                    meeting_type=meeting.meeting_type.value.replace("_", " "),
+                    description=meeting.description,
+                    topic=topic,
+                    discussion="\n\n".join(said) or "(nobody has spoken yet)"
+                )
+                if run is None:
+                    response = agent.chat(prompt)
+                else:
+                    response = run.run_step(step, agent_name, agent, "chat", prompt, lambda a=agent, p=prompt: a.chat(p))
+                step += 1
+                said.append(f"{agent_name}: {response}")
+                discussion.append({"topic": topic, "agent": agent_name, "response": response})
+                meeting.add_note(f"[{topic}] {agent_name}: {response}")
+        
+        return {
+            "meeting": meeting.title,
+            "responses": {
+                name: "\n\n".join(d["response"] for d in discussion if d["agent"] == name)
+                for name in participants
+            },
+            "discussion": discussion,
+            "summary": meeting.get_summary()
+        }
+    
+    def get_meeting_summary(self, meeting: Meeting) -> Dict[str, Any]:
+        return {
+            "summary": meeting.get_summary(),
+            "notes": list(meeting.notes),
+            "action_items": list(meeting.action_items),
+            "decisions": list(meeting.decisions)
+        }
+    
+    def get_checkpoint(self, run_id: str) -> List[StepRecord]:
+        """Checkpointed steps of a run, in step order."""
+        return [record for _, record in sorted(self.checkpoints.load(run_id).items())]
+    
+    def clear_checkpoint(self, run_id: str):
+        self.checkpoints.delete(run_id)
+    
+    def get_context_metrics(self) -> Dict[str, float]:
+        """Prompt sizes, context-window overflows and how they were packed, across all agents."""
+        return context_metrics.report()
+    
+    def get_cascade_report(self) -> Dict[str, Any]:
+        """How often the small model answered, the escalation rate and the latency saved."""
+        return cascade_stats.report()
+    
+    def get_fanout_report(self) -> Dict[str, Any]:
+        """Prompts sent to agents in fan-outs, how many were generated, and who shared whose answer last."""
+        return fanout_stats.report()
+    
+    def get_endpoint_report(self) -> List[Dict[str, Any]]:
+        """Health, requests in flight and loaded models for each Ollama endpoint."""
+        return get_ollama_pool().report()
+    
+    def get_memory_report(self) -> Dict[str, Any]:
+        """Conversation memory per agent (turns and bytes) and the total."""
+        agents = {name: agent.memory_usage() for name, agent in self.agents.items()}
+        return {
+            "agents": agents,
+            "total_bytes": sum(usage["allocated_bytes"] for usage in agents.values())
+        }
+    
     def clear_all_memories(self):
         for agent in self.agents.values():
             agent.clear_memory()
@@ -1,3 +0,0 @@
-from .agent import ProductManagerAgent
-
-__all__ = ['ProductManagerAgent']
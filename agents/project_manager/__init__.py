@@ -1,3 +0,0 @@
-from .agent import ProjectManagerAgent
-
-__all__ = ['ProjectManagerAgent']
@@ -1,3 +0,0 @@
-from .agent import QAEngineerAgent
-
-__all__ = ['QAEngineerAgent']
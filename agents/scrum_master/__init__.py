@@ -1,3 +0,0 @@
-from .agent import ScrumMasterAgent
-
-__all__ = ['ScrumMasterAgent']
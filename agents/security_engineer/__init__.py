@@ -1,3 +0,0 @@
-from .agent import SecurityEngineerAgent
-
-__all__ = ['SecurityEngineerAgent']
@@ -1,3 +0,0 @@
-from .agent import SiteReliabilityEngineerAgent
-
-__all__ = ['SiteReliabilityEngineerAgent']
@@ -1,3 +0,0 @@
-from .agent import SolutionsArchitectAgent
-
-__all__ = ['SolutionsArchitectAgent']
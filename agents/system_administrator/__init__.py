@@ -1,3 +0,0 @@
-from .agent import SystemAdministratorAgent
-
-__all__ = ['SystemAdministratorAgent']
@@ -1,3 +0,0 @@
-from .agent import TechnicalWriterAgent
-
-__all__ = ['TechnicalWriterAgent']
@@ -0,0 +1,91 @@
+import inspect
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain.schema import AIMessage
+
+from utils import agent_registry
+from utils.agent_registry import RoleAgent, agent_class, create_agent, list_agent_names
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = []
+
+    def invoke(self, messages):
+        self.calls.append(messages)
+        return AIMessage(content=f"answer {len(self.calls)}")
+
+class TestAgentRegistry(unittest.TestCase):
+    def test_manifest_lists_all_agents(self):
+        names = list_agent_names()
+        self.assertEqual(len(names), 29)
+        self.assertIn("backend_developer", names)
+        self.assertIn("technical_writer", names)
+
+    def test_class_names_importable(self):
+        from utils.agent_registry import BackendDeveloperAgent
+        self.assertEqual(BackendDeveloperAgent.__name__, "BackendDeveloperAgent")
+        self.assertTrue(issubclass(BackendDeveloperAgent, RoleAgent))
+        self.assertIs(BackendDeveloperAgent, agent_class("backend_developer"))
+        with self.assertRaises(AttributeError):
+            agent_registry.NoSuchAgent
+
+    def test_skill_methods_keep_signatures(self):
+        signature = inspect.signature(agent_class("backend_developer").review_code)
+        self.assertEqual(list(signature.parameters), ["self", "code", "language", "use_history"])
+        self.assertEqual(signature.parameters["language"].default, "python")
+
+    def test_skill_renders_template(self):
+        agent = create_agent("backend_developer", role_folder="Role")
+        agent.ask = lambda prompt, **kwargs: prompt
+        prompt = agent.review_code("print(1)")
+        self.assertIn("```python\nprint(1)\n```", prompt)
+        self.assertIn("```go\nfmt.Println(1)\n```", agent.review_code("fmt.Println(1)", language="go"))
+
+    def test_skills_are_stateless_by_default(self):
+        agent = create_agent("devops_engineer", role_folder="Role")
+        agent.llm = FakeLLM()
+        agent.create_ci_cd_pipeline("a large pipeline spec")
+        agent.create_ci_cd_pipeline("a large pipeline spec")
+        self.assertEqual(agent.get_conversation_history(), [])
+        self.assertEqual(len(agent.llm.calls), 1)  # second call served from the answer cache
+        self.assertEqual(len(agent.llm.calls[0]), 2)  # role prompt + skill prompt only
+
+    def test_skill_history_opt_in(self):
+        agent = create_agent("devops_engineer", role_folder="Role")
+        agent.llm = FakeLLM()
+        agent.create_ci_cd_pipeline("spec", use_history=True)
+        self.assertEqual(len(agent.get_conversation_history()), 2)
+        agent.skill_history = True
+        agent.design_monitoring("system")
+        self.assertEqual(len(agent.get_conversation_history()), 4)
+
+    def test_unknown_skill(self):
+        agent = create_agent("cto", role_folder="Role")
+        with self.assertRaises(ValueError):
+            agent.use_skill("review_code", "x")
+
+    def test_agent_from_data_only(self):
+        manifest = {"agents": [{
+            "name": "reviewer",
+            "class_name": "ReviewerAgent",
+            "role_file": "Technical_Writer.txt",
+            "skills": {"summarize": {"params": ["text"], "template": "Summarize: {text}"}},
+        }]}
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(manifest, f)
+        self.addCleanup(os.remove, f.name)
+        agent = create_agent("reviewer", manifest_path=f.name, role_folder="Role")
+        agent.ask = lambda prompt, **kwargs: prompt
+        self.assertEqual(type(agent).__name__, "ReviewerAgent")
+        self.assertEqual(agent.summarize("notes"), "Summarize: notes")
+        self.assertEqual(agent.get_role_info()["title"], create_agent("technical_writer", role_folder="Role").get_role_info()["title"])
+
+if __name__ == '__main__':
+    unittest.main()
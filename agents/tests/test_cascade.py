@@ -0,0 +1,88 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain.schema import AIMessage, HumanMessage
+
+from utils.agent_registry import create_agent
+from utils.cascade import (
+    CascadePolicy,
+    CascadeStats,
+    ModelCascade,
+    heuristic_confidence,
+    parse_self_check,
+)
+
+GOOD_ANSWER = "Use connection pooling, add indexes on the foreign keys and cache hot reads in Redis."
+
+class ScriptedLLM:
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    def invoke(self, messages):
+        self.calls.append(messages)
+        return AIMessage(content=self.replies[min(len(self.calls), len(self.replies)) - 1])
+
+class TestCascade(unittest.TestCase):
+    def setUp(self):
+        self.stats = CascadeStats()
+        self.messages = [HumanMessage(content="How do I speed up my API?")]
+
+    def test_heuristic_confidence(self):
+        policy = CascadePolicy()
+        self.assertEqual(heuristic_confidence("ok", policy), 0.0)
+        self.assertEqual(heuristic_confidence(GOOD_ANSWER, policy), 1.0)
+        self.assertLess(heuristic_confidence("I'm not sure, but " + GOOD_ANSWER, policy), 0.6)
+
+    def test_parse_self_check(self):
+        self.assertEqual(parse_self_check("8"), 0.8)
+        self.assertEqual(parse_self_check("Score: 10/10"), 1.0)
+        self.assertIsNone(parse_self_check("great answer"))
+
+    def test_confident_small_answer_is_kept(self):
+        small, large = ScriptedLLM(GOOD_ANSWER, "9"), ScriptedLLM("large")
+        response = ModelCascade(small, large, self.stats).invoke(self.messages, CascadePolicy())
+        self.assertEqual(response.content, GOOD_ANSWER)
+        self.assertEqual(len(small.calls), 2)  # answer + self-check
+        self.assertEqual(large.calls, [])
+        self.assertEqual(self.stats.report()["answered_by_small"], 1)
+
+    def test_low_confidence_escalates(self):
+        small, large = ScriptedLLM(GOOD_ANSWER, "3"), ScriptedLLM("large answer")
+        response = ModelCascade(small, large, self.stats).invoke(self.messages, CascadePolicy(), key="a.chat")
+        self.assertEqual(response.content, "large answer")
+        report = self.stats.report()
+        self.assertEqual(report["escalated"], 1)
+        self.assertEqual(report["escalation_rate"], 1.0)
+        self.assertEqual(report["by_policy"]["a.chat"]["escalated"], 1)
+
+    def test_heuristic_check_skips_self_check(self):
+        small, large = ScriptedLLM("no"), ScriptedLLM("large answer")
+        ModelCascade(small, large, self.stats).invoke(self.messages, CascadePolicy(check="heuristic"))
+        self.assertEqual(len(small.calls), 1)
+        self.assertEqual(len(large.calls), 1)
+
+    def test_large_mode_skips_small_model(self):
+        small, large = ScriptedLLM(GOOD_ANSWER), ScriptedLLM("large answer")
+        ModelCascade(small, large, self.stats).invoke(self.messages, CascadePolicy(mode="large"))
+        self.assertEqual(small.calls, [])
+        self.assertEqual(self.stats.report()["large_direct"], 1)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            CascadePolicy(mode="medium")
+
+    def test_manifest_policies(self):
+        agent = create_agent("backend_developer", role_folder="Role", cascade=True)
+        self.assertEqual(agent.cascade_policy, CascadePolicy())
+        agent.small_llm, agent.llm = ScriptedLLM(GOOD_ANSWER, "9"), ScriptedLLM("large review")
+        self.assertEqual(agent.review_code("x = 1"), "large review")  # review_code is pinned to the large model
+        self.assertEqual(agent.design_api("todo app"), GOOD_ANSWER)
+        self.assertEqual(create_agent("it_support_l1", role_folder="Role", cascade=True).cascade_policy.threshold, 0.5)
+        self.assertIsNone(create_agent("cto", role_folder="Role").cascade_policy)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain.schema import AIMessage, HumanMessage, SystemMessage
+
+from utils.context_guard import (
+    ContextGuard,
+    ContextMetrics,
+    ContextOverflowError,
+    TokenCounter,
+    approximate_tokens,
+)
+
+def words(n):
+    return " ".join(["word"] * n)
+
+class TestContextGuard(unittest.TestCase):
+    def setUp(self):
+        self.metrics = ContextMetrics()
+
+    def guard(self, policy=("trim_history", "compact"), num_ctx=300):
+        return ContextGuard(num_ctx=num_ctx, reserve_tokens=50, policy=policy, metrics=self.metrics)
+
+    def test_approximate_tokens(self):
+        self.assertEqual(approximate_tokens(""), 0)
+        self.assertEqual(approximate_tokens("def f(x): return x"), 9)
+        self.assertEqual(TokenCounter().mode, "approximate")
+
+    def test_fits_unchanged(self):
+        messages = [SystemMessage(content="role"), HumanMessage(content="hi")]
+        self.assertIs(self.guard().fit(messages), messages)
+        self.assertEqual(self.metrics.report()["overflows"], 0)
+        self.assertEqual(self.metrics.report()["calls"], 1)
+
+    def test_trims_oldest_history_first(self):
+        messages = [SystemMessage(content="role")]
+        for i in range(6):
+            messages += [HumanMessage(content=f"q{i} " + words(30)), AIMessage(content=f"a{i} " + words(30))]
+        messages.append(HumanMessage(content="latest question"))
+        fitted = self.guard().fit(messages)
+        self.assertIsInstance(fitted[0], SystemMessage)
+        self.assertEqual(fitted[-1].content, "latest question")
+        self.assertTrue(fitted[1].content.startswith("q"))
+        self.assertNotIn("q0", " ".join(m.content[:3] for m in fitted))
+        report = self.metrics.report()
+        self.assertEqual(report["overflows"], 1)
+        self.assertGreater(report["trimmed_messages"], 0)
+        self.assertEqual(report["compacted_tokens"], 0)
+
+    def test_compacts_large_documents(self):
+        code = "\n".join(f"line_{i} = {i}" for i in range(200))
+        guard = self.guard()
+        fitted = guard.fit([SystemMessage(content="role"), HumanMessage(content=code)])
+        self.assertLessEqual(guard.counter.count_messages(fitted), guard.limit)
+        self.assertIn("line_0 = 0", fitted[-1].content)
+        self.assertIn("line_199 = 199", fitted[-1].content)
+        self.assertIn("tokens omitted", fitted[-1].content)
+        self.assertGreater(self.metrics.report()["compacted_tokens"], 0)
+
+    def test_reject_policy(self):
+        with self.assertRaises(ContextOverflowError):
+            self.guard(policy=("reject",)).fit([HumanMessage(content=words(400))])
+        self.assertEqual(self.metrics.report()["rejected"], 1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.guard(policy=("summarize",))
+
+if __name__ == '__main__':
+    unittest.main()
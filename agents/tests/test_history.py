@@ -0,0 +1,50 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain.schema import AIMessage, HumanMessage
+
+from utils.history import ConversationHistory
+
+class TestConversationHistory(unittest.TestCase):
+    def test_append_and_view(self):
+        history = ConversationHistory()
+        history.add_exchange("Hi ☕", "Hello!")
+        history.append("user", "Next")
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(list(history.view()), [("user", "Hi ☕"), ("assistant", "Hello!"), ("user", "Next")])
+        self.assertEqual(history.view(1)[0], ("assistant", "Hello!"))
+        self.assertEqual(history.view()[-1], ("user", "Next"))
+        messages = history.view(0, 2).messages()
+        self.assertIsInstance(messages[0], HumanMessage)
+        self.assertIsInstance(messages[1], AIMessage)
+        self.assertEqual(messages[0].content, "Hi ☕")
+
+    def test_views_are_stable(self):
+        history = ConversationHistory()
+        history.add_exchange("one", "two")
+        view = history.view()
+        history.add_exchange("three", "four")
+        self.assertEqual(len(view), 2)
+        history.clear()
+        self.assertEqual(view.dicts()[1], {"role": "assistant", "content": "two"})
+        self.assertEqual(len(history), 0)
+
+    def test_usage(self):
+        history = ConversationHistory()
+        history.add_exchange("ab", "cdé")
+        usage = history.usage()
+        self.assertEqual(usage["turns"], 2)
+        self.assertEqual(usage["text_bytes"], 6)
+        self.assertEqual(usage["index_bytes"], 2 * 8 + 2)
+        self.assertGreaterEqual(usage["allocated_bytes"], usage["text_bytes"] + usage["index_bytes"])
+
+    def test_rejects_unknown_role(self):
+        with self.assertRaises(ValueError):
+            ConversationHistory().append("system", "nope")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import json
+import threading
+import time
+import unittest
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx
+from langchain.schema import HumanMessage
+
+from utils.ollama_pool import NoHealthyEndpointError, OllamaPool, PooledChatOllama
+
+
+class StandInOllama:
+    """A local HTTP server answering the Ollama endpoints the pool uses."""
+
+    def __init__(self, name, available=("llama3.2:latest",), loaded=(), delay=0.0):
+        self.name = name
+        self.available = list(available)
+        self.loaded = list(loaded)
+        self.delay = delay
+        self.down = False
+        self.chats = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if stand_in.down:
+                    return self._send(503, {"error": "down"})
+                if self.path == "/api/tags":
+                    return self._send(200, {"models": [{"name": m, "model": m} for m in stand_in.available]})
+                if self.path == "/api/ps":
+                    return self._send(200, {"models": [{"name": m, "model": m} for m in stand_in.loaded]})
+                self._send(404, {"error": "not found"})
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if stand_in.down:
+                    return self._send(503, {"error": "down"})
+                model = request["model"] if ":" in request["model"] else f"{request['model']}:latest"
+                if model not in stand_in.available:
+                    return self._send(404, {"error": f"model '{request['model']}' not found"})
+                time.sleep(stand_in.delay)
+                stand_in.chats += 1
+                self._send(200, {
+                    "model": request["model"],
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "message": {"role": "assistant", "content": f"answer from {stand_in.name}"},
+                    "done": True,
+                    "done_reason": "stop",
+                })
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestOllamaPool(unittest.TestCase):
+    def setUp(self):
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.close()
+
+    def serve(self, *args, **kwargs):
+        server = StandInOllama(*args, **kwargs)
+        self.servers.append(server)
+        return server
+
+    def test_least_outstanding_selection(self):
+        pool = OllamaPool(["http://a:1", "http://b:1", "http://c:1"])
+        first = pool.select("llama3.2")
+        second = pool.select("llama3.2")
+        third = pool.select("llama3.2")
+        self.assertEqual(len({first.url, second.url, third.url}), 3)
+        pool.release(second, "llama3.2")
+        self.assertIs(pool.select("llama3.2"), second)
+
+    def test_routes_to_endpoints_with_the_model_loaded(self):
+        cold = self.serve("cold")
+        warm = self.serve("warm", loaded=("llama3.2:latest",))
+        missing = self.serve("missing", available=("mistral:latest",))
+        pool = OllamaPool([cold.url, warm.url, missing.url])
+        self.assertTrue(all(pool.check_all().values()))
+
+        chosen = {pool.select("llama3.2").url for _ in range(4)}
+        self.assertEqual(chosen, {warm.url})
+
+        # With the model unloaded everywhere, pulled beats absent.
+        warm.loaded = []
+        pool = OllamaPool([missing.url, cold.url])
+        pool.check_all()
+        self.assertEqual(pool.select("llama3.2").url, cold.url)
+
+    def test_chat_model_is_served_through_the_pool(self):
+        first, second = self.serve("first", delay=0.2), self.serve("second", delay=0.2)
+        pool = OllamaPool([first.url, second.url])
+        llm = PooledChatOllama(model="llama3.2", pool=pool)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(llm.invoke([HumanMessage(content="hi")]).content))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), ["answer from first", "answer from second"])
+        self.assertEqual(first.chats, 1)
+        self.assertEqual(second.chats, 1)
+        self.assertTrue(all(e["outstanding"] == 0 for e in pool.report()))
+
+    def test_failed_endpoint_is_ejected_and_recovers(self):
+        flaky = self.serve("flaky", loaded=("llama3.2:latest",))
+        steady = self.serve("steady", loaded=("llama3.2:latest",))
+        pool = OllamaPool([flaky.url, steady.url], max_failures=2, eject_seconds=60)
+        pool.check_all()
+        llm = PooledChatOllama(model="llama3.2", pool=pool)
+
+        flaky.down = True
+        answers = [llm.invoke([HumanMessage(content="hi")]).content for _ in range(4)]
+        self.assertEqual(set(answers), {"answer from steady"})
+        self.assertFalse(pool.endpoints[0].healthy)
+
+        flaky.down = False
+        pool.check_all()
+        self.assertTrue(pool.endpoints[0].healthy)
+        answers = {llm.invoke([HumanMessage(content="hi")]).content for _ in range(4)}
+        self.assertIn("answer from flaky", answers)
+
+    def test_unreachable_endpoint_fails_over(self):
+        steady = self.serve("steady")
+        closed = self.serve("closed")
+        closed.close()
+        self.servers.remove(closed)
+        pool = OllamaPool([closed.url, steady.url])
+
+        self.assertEqual(pool.check_all(), {closed.url: False, steady.url: True})
+        llm = PooledChatOllama(model="llama3.2", pool=pool)
+        self.assertEqual(llm.invoke([HumanMessage(content="hi")]).content, "answer from steady")
+
+    def test_no_healthy_endpoint(self):
+        pool = OllamaPool(["http://127.0.0.1:9"], eject_seconds=60)
+        self.assertEqual(pool.check_all(), {"http://127.0.0.1:9": False})
+        with self.assertRaises(NoHealthyEndpointError):
+            pool.call("llama3.2", lambda endpoint: httpx.get(endpoint.url))
+
+
+if __name__ == "__main__":
+    unittest.main()
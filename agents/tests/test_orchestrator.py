@@ -1,10 +1,44 @@
+import asyncio
+import tempfile
 import unittest
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from langchain.schema import AIMessage
+
 from orchestrator import AgentOrchestrator
+from utils.meeting import MeetingType
+
+class SlowLLM:
+    def __init__(self, delay, content="answer", error=None):
+        self.delay = delay
+        self.content = content
+        self.error = error
+        self.cancelled = False
+
+    async def ainvoke(self, messages):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return AIMessage(content=self.content)
+
+class CountingLLM:
+    def __init__(self, name, fail_on=None):
+        self.name = name
+        self.calls = 0
+        self.fail_on = fail_on
+
+    def invoke(self, messages):
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise RuntimeError("crashed")
+        return AIMessage(content=f"{self.name} answer {self.calls}")
 
 class TestOrchestrator(unittest.TestCase):
     def setUp(self):
@@ -41,5 +75,170 @@ class TestOrchestrator(unittest.TestCase):
         history = agent.get_conversation_history()
         self.assertEqual(len(history), 0)
 
+    def _slow_agents(self, delays):
+        llms = {}
+        for name, delay in delays.items():
+            llms[name] = SlowLLM(delay, content=f"{name} says hi")
+            self.orchestrator.get_agent(name).llm = llms[name]
+        return llms
+
+    def test_quorum_returns_early_and_cancels_the_rest(self):
+        llms = self._slow_agents({"backend_developer": 0.01, "devops_engineer": 0.02, "qa_engineer": 5})
+        report = self.orchestrator.quorum_consultation(
+            "Ready to ship?", ["backend_developer", "devops_engineer", "qa_engineer"], min_responses=2
+        )
+        self.assertEqual(set(report["responses"]), {"backend_developer", "devops_engineer"})
+        self.assertEqual(report["cut_off"], ["qa_engineer"])
+        self.assertTrue(report["quorum_met"])
+        self.assertLess(report["elapsed_seconds"], 1)
+        self.assertTrue(llms["qa_engineer"].cancelled)
+        self.assertEqual(self.orchestrator.get_agent("qa_engineer").get_conversation_history(), [])
+
+    def test_async_quorum_runs_inside_an_event_loop(self):
+        self._slow_agents({"backend_developer": 0.01, "devops_engineer": 0.05})
+
+        async def consult():
+            return await self.orchestrator.aquorum_consultation(
+                "Ready to ship?", ["backend_developer", "devops_engineer"], min_responses=1
+            )
+
+        report = asyncio.run(consult())
+        self.assertEqual(list(report["responses"]), ["backend_developer"])
+        self.assertEqual(report["cut_off"], ["devops_engineer"])
+
+    def test_deadline_cuts_off_slow_agents(self):
+        self._slow_agents({"backend_developer": 0.01, "qa_engineer": 5})
+        responses = self.orchestrator.multi_agent_consultation(
+            "Ready to ship?", ["backend_developer", "qa_engineer"], deadline=0.2
+        )
+        self.assertEqual(responses, {"backend_developer": "backend_developer says hi"})
+
+    def test_failures_do_not_count_towards_quorum(self):
+        self._slow_agents({"backend_developer": 0.01, "devops_engineer": 0.05})
+        self.orchestrator.get_agent("backend_developer").llm = SlowLLM(0.01, error=RuntimeError("down"))
+        report = self.orchestrator.quorum_consultation(
+            "Ready to ship?", ["backend_developer", "devops_engineer"], min_responses=1
+        )
+        self.assertEqual(report["failed"], {"backend_developer": "down"})
+        self.assertEqual(list(report["responses"]), ["devops_engineer"])
+
+class TestPromptDeduplication(unittest.TestCase):
+    # Security_Engineer.txt and Scrum_Master.txt are empty, so these two agents get identical prompts.
+    NAMES = ["security_engineer", "scrum_master", "backend_developer"]
+
+    def setUp(self):
+        self.orchestrator = AgentOrchestrator()
+        self.llms = {name: CountingLLM(name) for name in self.NAMES}
+        for name, llm in self.llms.items():
+            self.orchestrator.get_agent(name).llm = llm
+
+    def test_identical_prompts_are_generated_once(self):
+        responses = self.orchestrator.multi_agent_consultation("How do we ship safely?", self.NAMES)
+        self.assertEqual(responses["scrum_master"], responses["security_engineer"])
+        self.assertEqual(self.llms["scrum_master"].calls, 0)
+        self.assertEqual(self.llms["backend_developer"].calls, 1)
+        self.assertEqual(self.orchestrator.get_fanout_report()["last_shared_from"], {"scrum_master": "security_engineer"})
+        # The sharing agent remembers the exchange as its own.
+        history = self.orchestrator.get_agent("scrum_master").get_conversation_history()
+        self.assertEqual(history[-1]["content"], responses["security_engineer"])
+
+    def test_attribution_is_reported_per_call(self):
+        report = self.orchestrator.multi_agent_consultation(
+            "How do we ship safely?", self.NAMES, with_attribution=True
+        )
+        self.assertEqual(report["shared_from"], {"scrum_master": "security_engineer"})
+        self.assertEqual(list(report["responses"]), self.NAMES)
+
+        report = self.orchestrator.multi_agent_consultation(
+            "How do we ship safely?", ["backend_developer"], with_attribution=True
+        )
+        self.assertEqual(report["shared_from"], {})
+
+    def test_diverged_history_is_not_shared(self):
+        self.orchestrator.chat_with_agent("scrum_master", "Hello")
+        self.orchestrator.multi_agent_consultation("How do we ship safely?", self.NAMES)
+        self.assertEqual(self.llms["scrum_master"].calls, 2)
+
+    def test_quorum_reports_shared_answers(self):
+        for name in self.NAMES:
+            self.orchestrator.get_agent(name).llm = SlowLLM(0.01, content=f"{name} says hi")
+        report = self.orchestrator.quorum_consultation("How do we ship safely?", self.NAMES)
+        self.assertEqual(report["responses"]["scrum_master"], "security_engineer says hi")
+        self.assertEqual(report["shared_from"], {"scrum_master": "security_engineer"})
+
+class TestCheckpoints(unittest.TestCase):
+    WORKFLOW = [
+        {"agent": "product_manager", "action": "chat"},
+        {"agent": "backend_developer", "action": "chat"},
+        {"agent": "qa_engineer", "action": "chat"}
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _orchestrator(self, fail_on=None):
+        orchestrator = AgentOrchestrator(checkpoint_dir=self.directory.name)
+        llms = {}
+        for step in self.WORKFLOW:
+            name = step["agent"]
+            llms[name] = CountingLLM(name, fail_on.get(name) if fail_on else None)
+            orchestrator.get_agent(name).llm = llms[name]
+        return orchestrator, llms
+
+    def test_collaborative_task_resumes_from_first_incomplete_step(self):
+        orchestrator, _ = self._orchestrator(fail_on={"qa_engineer": 1})
+        with self.assertRaises(RuntimeError):
+            orchestrator.collaborative_task("Build login", self.WORKFLOW, run_id="login")
+        self.assertEqual([r.agent for r in orchestrator.get_checkpoint("login")], ["product_manager", "backend_developer"])
+
+        orchestrator, llms = self._orchestrator()
+        results = orchestrator.collaborative_task("Build login", self.WORKFLOW, run_id="login")
+        self.assertEqual(
+            [r["response"] for r in results],
+            ["product_manager answer 1", "backend_developer answer 1", "qa_engineer answer 1"]
+        )
+        self.assertEqual((llms["product_manager"].calls, llms["backend_developer"].calls), (0, 0))
+        self.assertEqual(llms["qa_engineer"].calls, 1)
+        # Memory of the replayed steps is restored.
+        history = orchestrator.get_agent("backend_developer").get_conversation_history()
+        self.assertEqual([h["role"] for h in history], ["user", "assistant"])
+        self.assertEqual(history[1]["content"], "backend_developer answer 1")
+
+    def test_resume_in_same_process_keeps_history_once(self):
+        orchestrator, llms = self._orchestrator(fail_on={"qa_engineer": 1})
+        with self.assertRaises(RuntimeError):
+            orchestrator.collaborative_task("Build login", self.WORKFLOW, run_id="login")
+
+        orchestrator.collaborative_task("Build login", self.WORKFLOW, run_id="login")
+        self.assertEqual(llms["backend_developer"].calls, 1)
+        self.assertEqual(llms["qa_engineer"].calls, 2)
+        for name in ("product_manager", "backend_developer", "qa_engineer"):
+            self.assertEqual(orchestrator.get_agent(name).history_length(), 2)
+
+    def test_changed_step_is_recomputed_with_everything_after_it(self):
+        orchestrator, _ = self._orchestrator()
+        orchestrator.collaborative_task("Build login", self.WORKFLOW, run_id="login")
+
+        orchestrator, llms = self._orchestrator()
+        orchestrator.collaborative_task("Build signup", self.WORKFLOW, run_id="login")
+        self.assertEqual([llm.calls for llm in llms.values()], [1, 1, 1])
+        self.assertEqual(len(orchestrator.get_checkpoint("login")), 3)
+
+    def test_meeting_resumes(self):
+        orchestrator, _ = self._orchestrator(fail_on={"qa_engineer": 1})
+        meeting = orchestrator.create_meeting(MeetingType.CODE_REVIEW, "Review", "Review the login PR")
+        meeting.participants = ["backend_developer", "qa_engineer"]
+        with self.assertRaises(RuntimeError):
+            orchestrator.conduct_meeting(meeting, ["Tests"], run_id="review")
+
+        orchestrator, llms = self._orchestrator()
+        meeting = orchestrator.create_meeting(MeetingType.CODE_REVIEW, "Review", "Review the login PR")
+        meeting.participants = ["backend_developer", "qa_engineer"]
+        result = orchestrator.conduct_meeting(meeting, ["Tests"], run_id="review")
+        self.assertEqual(llms["backend_developer"].calls, 0)
+        self.assertEqual(set(result["responses"]), {"backend_developer", "qa_engineer"})
+        self.assertEqual(result["summary"]["notes_count"], 2)
+
 if __name__ == '__main__':
     unittest.main()
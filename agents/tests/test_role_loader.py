@@ -4,7 +4,32 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from langchain.schema import AIMessage
+
+from utils.base_agent import BaseAgent
 from utils.role_loader import RoleLoader
+from utils.role_sections import RoleSectionIndex, parse_sections
+
+ROLE = """# Example Role
+
+## GENERAL
+**Department:** Engineering
+
+## DUTIES
+
+### Databases
+- Index design and query tuning
+
+### Frontend
+- Component libraries
+"""
+
+class KeywordEmbeddings:
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        return [1.0, 0.0] if "component" in text.lower() or "ui" in text.lower() else [0.0, 1.0]
 
 class TestRoleLoader(unittest.TestCase):
     def setUp(self):
@@ -32,5 +57,73 @@ class TestRoleLoader(unittest.TestCase):
         self.assertIn('title', metadata)
         self.assertIn('level', metadata)
 
+    def test_query_prompt_keeps_identity_and_relevant_sections(self):
+        full = self.role_loader.get_role_prompt("Software_Developer_Backend.txt")
+        prompt = self.role_loader.get_role_prompt(
+            "Software_Developer_Backend.txt", query="database indexing", budget_tokens=800
+        )
+        self.assertIn("You are an AI agent", prompt)
+        self.assertIn("# Backend Software Developer", prompt)
+        self.assertIn("Pozisyon Seviyesi", prompt)
+        self.assertIn("Database", prompt)
+        self.assertLess(len(prompt), len(full) / 2)
+
+class RecordingLLM:
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, messages):
+        self.prompts.append(messages)
+        return AIMessage(content="ok")
+
+class TestConversationSystemPrompt(unittest.TestCase):
+    def setUp(self):
+        self.agent = BaseAgent("Software_Developer_Backend.txt", role_token_budget=800)
+        self.agent.llm = RecordingLLM()
+
+    def test_chat_keeps_system_prompt_for_the_conversation(self):
+        self.agent.chat("database indexing")
+        self.agent.chat("deployment pipelines and monitoring")
+        first, second = (prompt[0].content for prompt in self.agent.llm.prompts)
+        self.assertEqual(first, second)
+        self.assertEqual(first, self.agent.system_message_for("database indexing").content)
+        self.assertNotEqual(first, self.agent.system_message_for("deployment pipelines and monitoring").content)
+
+        self.agent.clear_memory()
+        self.agent.chat("deployment pipelines and monitoring")
+        self.assertEqual(
+            self.agent.llm.prompts[-1][0].content,
+            self.agent.system_message_for("deployment pipelines and monitoring").content
+        )
+
+    def test_ask_selects_sections_per_query(self):
+        self.agent.chat("database indexing")
+        self.agent.ask("deployment pipelines and monitoring")
+        self.assertEqual(
+            self.agent.llm.prompts[-1][0].content,
+            self.agent.system_message_for("deployment pipelines and monitoring").content
+        )
+
+class TestRoleSectionIndex(unittest.TestCase):
+    def test_parse_sections(self):
+        sections = parse_sections(ROLE)
+        self.assertEqual([s.heading for s in sections], ["Example Role", "GENERAL", "DUTIES", "Databases", "Frontend"])
+        self.assertEqual(sections[3].parent, "DUTIES")
+
+    def test_select_within_budget(self):
+        index = RoleSectionIndex(ROLE)
+        selected = [s.heading for s in index.select("how do I tune a slow query", budget_tokens=100)]
+        self.assertEqual(selected, ["Example Role", "GENERAL", "Databases"])
+        rendered = index.build("how do I tune a slow query", budget_tokens=100)
+        self.assertIn("## DUTIES\n\n### Databases", rendered)
+        pinned_only = index.select("how do I tune a slow query", budget_tokens=0)
+        self.assertEqual([s.heading for s in pinned_only], ["Example Role", "GENERAL"])
+
+    def test_embedding_similarity(self):
+        index = RoleSectionIndex(ROLE, embeddings=KeywordEmbeddings(), lexical_weight=0.0)
+        selected = [s.heading for s in index.select("UI work", budget_tokens=100)]
+        self.assertIn("Frontend", selected)
+        self.assertNotIn("Databases", selected)
+
 if __name__ == '__main__':
     unittest.main()
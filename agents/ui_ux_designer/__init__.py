@@ -1,3 +0,0 @@
-from .agent import UIUXDesignerAgent
-
-__all__ = ['UIUXDesignerAgent']
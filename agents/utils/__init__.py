@@ -1,4 +1,5 @@
 from .role_loader import RoleLoader
 from .base_agent import BaseAgent
+from .agent_registry import RoleAgent, create_agent
 
-__all__ = ['RoleLoader', 'BaseAgent']
+__all__ = ['RoleLoader', 'BaseAgent', 'RoleAgent', 'create_agent']
@@ -0,0 +1,190 @@
+"""
+Agents built from agent_manifest.json instead of one module per role
+
+Each manifest entry names an agent, its role file and its specialized skills
+(prompt templates with parameters). A class per entry is generated on first
+use, so `BackendDeveloperAgent` and friends stay importable from here:
+
+    from utils.agent_registry import BackendDeveloperAgent, create_agent
+
+Adding an agent is a manifest change; no code is generated.
+"""
+import inspect
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from utils.base_agent import BaseAgent
+from utils.cascade import CascadePolicy
+
+MANIFEST_PATH = Path(__file__).parent.parent / "agent_manifest.json"
+
+
+@dataclass(frozen=True)
+class Skill:
+    name: str
+    template: str
+    params: Tuple[str, ...]
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    cascade: Dict[str, Any] = field(default_factory=dict)
+
+    def render(self, *args, **kwargs) -> str:
+        bound = self.signature().bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        values = dict(bound.arguments)
+        values.pop("self")
+        values.pop("use_history", None)
+        return self.template.format(**values)
+
+    def signature(self) -> inspect.Signature:
+        parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        parameters += [
+            inspect.Parameter(
+                param,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=self.defaults.get(param, inspect.Parameter.empty),
+                annotation=str,
+            )
+            for param in self.params
+        ]
+        parameters.append(
+            inspect.Parameter("use_history", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[bool])
+        )
+        return inspect.Signature(parameters, return_annotation=str)
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    name: str
+    class_name: str
+    role_file: str
+    skills: Dict[str, Skill] = field(default_factory=dict)
+    cascade: Dict[str, Any] = field(default_factory=dict)
+
+
+def _parse_spec(entry: Dict[str, Any]) -> AgentSpec:
+    skills = {
+        skill_name: Skill(
+            name=skill_name,
+            template=skill["template"],
+            params=tuple(skill.get("params", [])),
+            defaults=dict(skill.get("defaults", {})),
+            cascade=dict(skill.get("cascade", {})),
+        )
+        for skill_name, skill in entry.get("skills", {}).items()
+    }
+    return AgentSpec(
+        name=entry["name"],
+        class_name=entry["class_name"],
+        role_file=entry["role_file"],
+        skills=skills,
+        cascade=dict(entry.get("cascade", {})),
+    )
+
+
+@lru_cache(maxsize=None)
+def load_manifest(path: Optional[str] = None) -> Dict[str, AgentSpec]:
+    """Agent specs keyed by agent name, in manifest order."""
+    with open(path or MANIFEST_PATH, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    specs: Dict[str, AgentSpec] = {}
+    for entry in manifest["agents"]:
+        spec = _parse_spec(entry)
+        if spec.name in specs:
+            raise ValueError(f"Duplicate agent name in manifest: {spec.name}")
+        specs[spec.name] = spec
+    return specs
+
+
+class RoleAgent(BaseAgent):
+    """
+    Generic agent: a role file plus the skills its manifest entry declares
+
+    Skills are stateless by default: the prompt is sent with the role prompt
+    only and never enters conversation memory. Pass `use_history=True` to a
+    skill, or set `skill_history` on the agent, to run it through `chat`.
+
+    `cascade=True` enables the small-model-first cascade with the policy from
+    the manifest entry; a skill's own `cascade` settings override it.
+    """
+
+    spec: AgentSpec
+    skill_history: bool = False
+
+    def __init__(
+        self,
+        model_name: str = "llama3.2",
+        temperature: float = 0.7,
+        role_folder: str = "Role",
+        cascade: Union[bool, CascadePolicy, None] = None,
+        **kwargs
+    ):
+        if cascade is True:
+            cascade = CascadePolicy().merged(self.spec.cascade)
+        super().__init__(
+            role_filename=self.spec.role_file,
+            model_name=model_name,
+            temperature=temperature,
+            role_folder=role_folder,
+            cascade=cascade or None,
+            **kwargs
+        )
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    def list_skills(self) -> List[str]:
+        return list(self.spec.skills)
+
+    def use_skill(self, skill_name: str, *args, use_history: Optional[bool] = None, **kwargs) -> str:
+        if skill_name not in self.spec.skills:
+            raise ValueError(f"Agent '{self.spec.name}' has no skill '{skill_name}'. Available: {self.list_skills()}")
+        skill = self.spec.skills[skill_name]
+        prompt = skill.render(*args, **kwargs)
+        policy = self.cascade_policy.merged(skill.cascade) if self.cascade_policy else None
+        if self.skill_history if use_history is None else use_history:
+            return self.chat(prompt, policy=policy, policy_key=skill_name)
+        return self.ask(prompt, policy=policy, policy_key=skill_name)
+
+
+def _skill_method(skill: Skill):
+    def method(self, *args, use_history: Optional[bool] = None, **kwargs) -> str:
+        return self.use_skill(skill.name, *args, use_history=use_history, **kwargs)
+
+    method.__name__ = skill.name
+    method.__signature__ = skill.signature()
+    method.__doc__ = skill.template.strip().split("\n", 1)[0]
+    return method
+
+
+def _build_class(spec: AgentSpec) -> type:
+    namespace = {"spec": spec, "__module__": __name__}
+    namespace.update({name: _skill_method(skill) for name, skill in spec.skills.items()})
+    return type(spec.class_name, (RoleAgent,), namespace)
+
+
+@lru_cache(maxsize=None)
+def agent_class(agent_name: str, manifest_path: Optional[str] = None) -> type:
+    specs = load_manifest(manifest_path)
+    if agent_name not in specs:
+        raise ValueError(f"Agent '{agent_name}' not found. Available agents: {list(specs)}")
+    return _build_class(specs[agent_name])
+
+
+def list_agent_names(manifest_path: Optional[str] = None) -> List[str]:
+    return list(load_manifest(manifest_path))
+
+
+def create_agent(agent_name: str, manifest_path: Optional[str] = None, **kwargs) -> RoleAgent:
+    return agent_class(agent_name, manifest_path)(**kwargs)
+
+
+def __getattr__(class_name: str):
+    # Keeps `from utils.agent_registry import BackendDeveloperAgent` working.
+    for spec in load_manifest().values():
+        if spec.class_name == class_name:
+            return agent_class(spec.name)
+    raise AttributeError(f"module {__name__!r} has no attribute {class_name!r}")
@@ -1,72 +1,205 @@
-from langchain_ollama import ChatOllama
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
-from langchain.schema import HumanMessage, AIMessage, SystemMessage
-from typing import List, Dict, Optional
+from langchain.schema import HumanMessage, SystemMessage
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.role_loader import RoleLoader
+from utils.role_sections import DEFAULT_TOKEN_BUDGET
+from utils.context_guard import DEFAULT_NUM_CTX, DEFAULT_POLICY, ContextGuard, TokenCounter
+from utils.cascade import DEFAULT_SMALL_MODEL, CascadePolicy, ModelCascade
+from utils.ollama_pool import OllamaPool, PooledChatOllama
+from utils.fanout import prompt_fingerprint
+from utils.history import ConversationHistory
 
 class BaseAgent:
+    # Stateless answers kept per agent, keyed by the exact prompt.
+    ANSWER_CACHE_SIZE = 128
+
     def __init__(
         self,
         role_filename: str,
         model_name: str = "llama3.2",
         temperature: float = 0.7,
-        role_folder: str = "Role"
+        role_folder: str = "Role",
+        role_token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+        role_embeddings: Optional[Any] = None,
+        num_ctx: int = DEFAULT_NUM_CTX,
+        context_policy: Sequence[str] = DEFAULT_POLICY,
+        tokenizer_path: Optional[str] = None,
+        cascade: Optional[CascadePolicy] = None,
+        small_model_name: str = DEFAULT_SMALL_MODEL,
+        pool: Optional[OllamaPool] = None
     ):
         self.role_filename = role_filename
+        self.model_name = model_name
+        self.temperature = temperature
+        self.small_model_name = small_model_name
         self.role_loader = RoleLoader(role_folder)
         self.role_prompt = self.role_loader.get_role_prompt(role_filename)
         self.role_metadata = self.role_loader.get_role_metadata(role_filename)
+        # None sends the whole role file; otherwise only query-relevant sections up to this many tokens.
+        self.role_token_budget = role_token_budget
+        self.role_index = self.role_loader.get_role_index(role_filename, embeddings=role_embeddings)
+        # Sections chosen for the current conversation, keyed by its first user message.
+        self._conversation_system: Optional[Tuple[str, SystemMessage]] = None
         
-        self.llm = ChatOllama(
+        # Calls go to the least-busy healthy endpoint in the pool (OLLAMA_BASE_URLS by default).
+        self.llm = PooledChatOllama(
             model=model_name,
-            temperature=temperature
+            temperature=temperature,
+            num_ctx=num_ctx,
+            pool=pool
         )
-        
-        self.memory = ConversationBufferMemory(
-            return_messages=True,
-            memory_key="chat_history"
+        # With a cascade policy, calls try the small model first and escalate to self.llm.
+        self.cascade_policy = cascade
+        self.small_llm = PooledChatOllama(
+            model=small_model_name,
+            temperature=temperature,
+            num_ctx=num_ctx,
+            pool=pool
+        ) if cascade is not None else None
+        self.context_guard = ContextGuard(
+            num_ctx=num_ctx,
+            policy=context_policy,
+            counter=TokenCounter(tokenizer_path)
         )
         
+        # Turns packed into flat arrays; see utils.history.
+        self.memory = ConversationHistory()
+        
         self.system_message = SystemMessage(content=self.role_prompt)
+        self.answer_cache: "OrderedDict[str, str]" = OrderedDict()
     
     def get_role_info(self) -> Dict[str, str]:
         return self.role_metadata
     
-    def chat(self, user_message: str) -> str:
-        messages = [self.system_message]
+    def system_message_for(self, user_message: str) -> SystemMessage:
+        if self.role_token_budget is None:
+            return self.system_message
+        return SystemMessage(
+            content=self.role_loader.format_role_prompt(self.role_index.build(user_message, self.role_token_budget))
+        )
+    
+    def conversation_system_message(self, user_message: str) -> SystemMessage:
+        """
+        System prompt for a chat turn, chosen once per conversation
+
+        Sections are selected for the conversation's first user message and
+        kept until clear_memory(), so every turn shares the same prompt prefix
+        and Ollama can reuse its KV cache instead of re-reading the history.
+        """
+        first_message = self.memory.view()[0][1] if len(self.memory) else user_message
+        if self._conversation_system is None or self._conversation_system[0] != first_message:
+            self._conversation_system = (first_message, self.system_message_for(first_message))
+        return self._conversation_system[1]
+    
+    def _policy_key(self, policy_key: str) -> str:
+        return f"{getattr(self, 'name', Path(self.role_filename).stem)}.{policy_key}"
+    
+    def _invoke(self, messages: List[Any], policy: Optional[CascadePolicy] = None, policy_key: str = "chat"):
+        # Measure and, if needed, pack the prompt so Ollama never truncates it silently.
+        messages = self.context_guard.fit(messages)
+        if self.cascade_policy is None:
+            return self.llm.invoke(messages)
+        return ModelCascade(self.small_llm, self.llm).invoke(
+            messages, policy or self.cascade_policy, key=self._policy_key(policy_key)
+        )
+    
+    async def _ainvoke(self, messages: List[Any], policy: Optional[CascadePolicy] = None, policy_key: str = "chat"):
+        messages = self.context_guard.fit(messages)
+        if self.cascade_policy is None:
+            return await self.llm.ainvoke(messages)
+        return await ModelCascade(self.small_llm, self.llm).ainvoke(
+            messages, policy or self.cascade_policy, key=self._policy_key(policy_key)
+        )
+    
+    def _chat_messages(self, user_message: str) -> List[Any]:
+        messages = [self.conversation_system_message(user_message)]
+        messages.extend(self.memory.view().messages())
+        messages.append(HumanMessage(content=user_message))
+        return messages
+    
+    def prompt_fingerprint(self, user_message: str) -> str:
+        """Identifies what chat(user_message) would send: agents with equal fingerprints give the same answer."""
+        settings = [self.model_name, self.temperature, self.small_model_name, self.cascade_policy]
+        return prompt_fingerprint(settings, self._chat_messages(user_message))
+    
+    def chat(
+        self,
+        user_message: str,
+        policy: Optional[CascadePolicy] = None,
+        policy_key: str = "chat"
+    ) -> str:
+        response = self._invoke(self._chat_messages(user_message), policy, policy_key)
         
-        chat_history = self.memory.load_memory_variables({})
-        if chat_history.get('chat_history'):
-            messages.extend(chat_history['chat_history'])
+        self.memory.add_exchange(user_message, response.content)
         
-        messages.append(HumanMessage(content=user_message))
+        return response.content
+    
+    async def achat(
+        self,
+        user_message: str,
+        policy: Optional[CascadePolicy] = None,
+        policy_key: str = "chat"
+    ) -> str:
+        """
+        Async chat; cancelling the awaiting task closes the Ollama request
+
+        Ollama stops generating when its client disconnects, and memory is
+        only updated once a response has arrived, so a cancelled call leaves
+        no trace in the conversation.
+        """
+        response = await self._ainvoke(self._chat_messages(user_message), policy, policy_key)
         
-        response = self.llm.invoke(messages)
+        self.memory.add_exchange(user_message, response.content)
         
-        self.memory.save_context(
-            {"input": user_message},
-            {"output": response.content}
+        return response.content
+    
+    def ask(
+        self,
+        user_message: str,
+        use_cache: bool = True,
+        policy: Optional[CascadePolicy] = None,
+        policy_key: str = "ask"
+    ) -> str:
+        """
+        Answer from the role prompt and this message alone
+
+        Nothing is read from or written to conversation memory, so large
+        inputs (code, specs) are sent once and identical prompts can be
+        served from the answer cache.
+        """
+        if use_cache and user_message in self.answer_cache:
+            self.answer_cache.move_to_end(user_message)
+            return self.answer_cache[user_message]
+
+        response = self._invoke(
+            [self.system_message_for(user_message), HumanMessage(content=user_message)], policy, policy_key
         )
-        
+
+        if use_cache:
+            self.answer_cache[user_message] = response.content
+            while len(self.answer_cache) > self.ANSWER_CACHE_SIZE:
+                self.answer_cache.popitem(last=False)
         return response.content
     
     def clear_memory(self):
         self.memory.clear()
+        self._conversation_system = None
     
-    def get_conversation_history(self) -> List[Dict[str, str]]:
-        chat_history = self.memory.load_memory_variables({})
-        history = []
-        
-        if chat_history.get('chat_history'):
-            for msg in chat_history['chat_history']:
-                if isinstance(msg, HumanMessage):
-                    history.append({"role": "user", "content": msg.content})
-                elif isinstance(msg, AIMessage):
-                    history.append({"role": "assistant", "content": msg.content})
-        
-        return history
+    def get_conversation_history(self, start: int = 0) -> List[Dict[str, str]]:
+        return self.memory.view(start).dicts()
+
+    def history_length(self) -> int:
+        return len(self.memory)
+
+    def restore_history(self, history: List[Dict[str, str]]):
+        """Append turns in the get_conversation_history() format, e.g. from a checkpoint."""
+        self.memory.extend(history)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Turns held in conversation memory and the bytes they take."""
+        return self.memory.usage()
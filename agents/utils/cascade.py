@@ -0,0 +1,212 @@
+"""
+Small-model-first cascade for agent calls
+
+The small model (SmolLM2-360M, already loaded for the RAG services) answers
+first. Its answer is scored with a cheap check; when confidence is below the
+policy threshold the same prompt is escalated to the large model. Policies
+come from the agent manifest, per agent and per skill:
+
+    "cascade": {"mode": "cascade", "threshold": 0.7, "check": "self_check"}
+
+`mode` is "cascade", "small" (never escalate) or "large" (skip the small
+model). `check` is "heuristic" (free) or "self_check" (one short extra call
+to the small model).
+"""
+import re
+import threading
+import time
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, List, Optional
+
+from langchain.schema import HumanMessage, SystemMessage
+
+DEFAULT_SMALL_MODEL = "hf.co/HuggingFaceTB/SmolLM2-360M-Instruct-GGUF:Q8_0"
+DEFAULT_LARGE_MODEL = "llama3.2"
+CASCADE_MODES = ("cascade", "small", "large")
+CONFIDENCE_CHECKS = ("heuristic", "self_check")
+
+HEDGES = (
+    "i'm not sure", "i am not sure", "i don't know", "i do not know", "not certain",
+    "as an ai", "i cannot", "i can't", "unable to", "no information",
+)
+SELF_CHECK_PROMPT = """Question:
+{question}
+
+Answer:
+{answer}
+
+Does the answer fully and correctly address the question? Reply with a single number from 0 (wrong or off-topic) to 10 (complete and correct)."""
+SCORE_RE = re.compile(r"\b(10|[0-9])(?:\s*/\s*10)?\b")
+
+
+@dataclass(frozen=True)
+class CascadePolicy:
+    mode: str = "cascade"
+    threshold: float = 0.6
+    check: str = "self_check"
+    min_answer_chars: int = 40
+
+    def __post_init__(self):
+        if self.mode not in CASCADE_MODES:
+            raise ValueError(f"Unknown cascade mode {self.mode!r}, expected one of {CASCADE_MODES}")
+        if self.check not in CONFIDENCE_CHECKS:
+            raise ValueError(f"Unknown confidence check {self.check!r}, expected one of {CONFIDENCE_CHECKS}")
+
+    def merged(self, overrides: Optional[Dict[str, Any]]) -> "CascadePolicy":
+        if not overrides:
+            return self
+        known = {f.name for f in fields(self)}
+        return replace(self, **{k: v for k, v in overrides.items() if k in known})
+
+
+def heuristic_confidence(answer: str, policy: CascadePolicy) -> float:
+    """Free signals of a weak answer: too short, hedging, or looping."""
+    text = answer.strip()
+    if len(text) < policy.min_answer_chars:
+        return 0.0
+    confidence = 1.0
+    lowered = text.lower()
+    if any(hedge in lowered for hedge in HEDGES):
+        confidence -= 0.5
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if len(lines) >= 4 and len(set(lines)) / len(lines) < 0.5:
+        confidence -= 0.4
+    return max(confidence, 0.0)
+
+
+def parse_self_check(text: str) -> Optional[float]:
+    match = SCORE_RE.search(text)
+    return int(match.group(1)) / 10 if match else None
+
+
+class CascadeStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.small_answers = 0
+            self.escalations = 0
+            self.large_direct = 0
+            self.small_seconds = 0.0
+            self.large_seconds = 0.0
+            self.large_calls = 0
+            self.by_key: Dict[str, Dict[str, int]] = {}
+
+    def record(self, key: str, outcome: str, small_seconds: float = 0.0, large_seconds: float = 0.0):
+        with self._lock:
+            self.calls += 1
+            if outcome == "small":
+                self.small_answers += 1
+            elif outcome == "escalated":
+                self.escalations += 1
+            else:
+                self.large_direct += 1
+            self.small_seconds += small_seconds
+            if large_seconds:
+                self.large_seconds += large_seconds
+                self.large_calls += 1
+            counts = self.by_key.setdefault(key, {"small": 0, "escalated": 0, "large": 0})
+            counts[outcome] += 1
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            cascaded = self.small_answers + self.escalations
+            avg_large = self.large_seconds / self.large_calls if self.large_calls else 0.0
+            # Time an all-large run would have taken, minus what this run actually spent.
+            baseline = avg_large * self.calls
+            spent = self.small_seconds + self.large_seconds
+            return {
+                "calls": self.calls,
+                "answered_by_small": self.small_answers,
+                "escalated": self.escalations,
+                "large_direct": self.large_direct,
+                "escalation_rate": self.escalations / cascaded if cascaded else 0.0,
+                "avg_large_seconds": avg_large,
+                "latency_saved_seconds": baseline - spent if self.large_calls else 0.0,
+                "by_policy": {key: dict(counts) for key, counts in self.by_key.items()},
+            }
+
+
+# Shared by every agent unless one is given its own.
+cascade_stats = CascadeStats()
+
+
+class ModelCascade:
+    def __init__(self, small_llm, large_llm, stats: Optional[CascadeStats] = None):
+        self.small_llm = small_llm
+        self.large_llm = large_llm
+        self.stats = stats or cascade_stats
+
+    def _self_check_messages(self, messages: List[Any], answer: str) -> List[Any]:
+        question = str(messages[-1].content)[-2000:]
+        return [
+            SystemMessage(content="You grade answers strictly and reply with one number."),
+            HumanMessage(content=SELF_CHECK_PROMPT.format(question=question, answer=answer[:2000])),
+        ]
+
+    def confidence(self, messages: List[Any], answer: str, policy: CascadePolicy) -> float:
+        confidence = heuristic_confidence(answer, policy)
+        if policy.check == "heuristic" or confidence < policy.threshold:
+            return confidence
+        verdict = self.small_llm.invoke(self._self_check_messages(messages, answer))
+        score = parse_self_check(str(verdict.content))
+        return confidence if score is None else min(confidence, score)
+
+    async def aconfidence(self, messages: List[Any], answer: str, policy: CascadePolicy) -> float:
+        confidence = heuristic_confidence(answer, policy)
+        if policy.check == "heuristic" or confidence < policy.threshold:
+            return confidence
+        verdict = await self.small_llm.ainvoke(self._self_check_messages(messages, answer))
+        score = parse_self_check(str(verdict.content))
+        return confidence if score is None else min(confidence, score)
+
+    def invoke(self, messages: List[Any], policy: CascadePolicy, key: str = "default"):
+        if policy.mode == "large":
+            start = time.perf_counter()
+            response = self.large_llm.invoke(messages)
+            self.stats.record(key, "large", large_seconds=time.perf_counter() - start)
+            return response
+
+        start = time.perf_counter()
+        response = self.small_llm.invoke(messages)
+        if policy.mode == "small":
+            self.stats.record(key, "small", small_seconds=time.perf_counter() - start)
+            return response
+
+        confidence = self.confidence(messages, str(response.content), policy)
+        small_seconds = time.perf_counter() - start
+        if confidence >= policy.threshold:
+            self.stats.record(key, "small", small_seconds=small_seconds)
+            return response
+
+        start = time.perf_counter()
+        response = self.large_llm.invoke(messages)
+        self.stats.record(key, "escalated", small_seconds=small_seconds, large_seconds=time.perf_counter() - start)
+        return response
+
+    async def ainvoke(self, messages: List[Any], policy: CascadePolicy, key: str = "default"):
+        if policy.mode == "large":
+            start = time.perf_counter()
+            response = await self.large_llm.ainvoke(messages)
+            self.stats.record(key, "large", large_seconds=time.perf_counter() - start)
+            return response
+
+        start = time.perf_counter()
+        response = await self.small_llm.ainvoke(messages)
+        if policy.mode == "small":
+            self.stats.record(key, "small", small_seconds=time.perf_counter() - start)
+            return response
+
+        confidence = await self.aconfidence(messages, str(response.content), policy)
+        small_seconds = time.perf_counter() - start
+        if confidence >= policy.threshold:
+            self.stats.record(key, "small", small_seconds=small_seconds)
+            return response
+
+        start = time.perf_counter()
+        response = await self.large_llm.ainvoke(messages)
+        self.stats.record(key, "escalated", small_seconds=small_seconds, large_seconds=time.perf_counter() - start)
+        return response
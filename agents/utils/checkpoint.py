@@ -0,0 +1,144 @@
+"""
+Step-level checkpoints for collaborative tasks and meetings
+
+Every completed step of a run is appended to `<run_id>.jsonl` in the
+checkpoint directory (AGENT_CHECKPOINT_DIR, default
+agent_memories/checkpoints): the agent, action, input, output and the
+messages the step added to the agent's memory. Running the same run ID again
+replays finished steps from the file, restoring each agent's memory, and
+calls the LLM only from the first incomplete step on. A step whose input no
+longer matches its checkpoint (the workflow changed) is recomputed, along
+with everything after it.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+CHECKPOINT_DIR = os.environ.get("AGENT_CHECKPOINT_DIR", "agent_memories/checkpoints")
+UNSAFE_CHARS_RE = re.compile(r"[^\w.-]")
+
+
+@dataclass
+class StepRecord:
+    step: int
+    kind: str
+    agent: str
+    action: str
+    input: str
+    output: str
+    fingerprint: str
+    memory_delta: List[Dict[str, str]] = field(default_factory=list)
+    # Length of the agent's history when the step started; -1 in older checkpoints.
+    history_start: int = -1
+    completed_at: float = 0.0
+
+
+def step_fingerprint(kind: str, agent: str, action: str, step_input: str) -> str:
+    payload = json.dumps([kind, agent, action, step_input], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """Append-only JSONL file per run ID."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or CHECKPOINT_DIR)
+
+    def path(self, run_id: str) -> Path:
+        if not run_id:
+            raise ValueError("run_id must not be empty")
+        return self.directory / f"{UNSAFE_CHARS_RE.sub('_', run_id)}.jsonl"
+
+    def load(self, run_id: str) -> Dict[int, StepRecord]:
+        records: Dict[int, StepRecord] = {}
+        path = self.path(run_id)
+        if not path.exists():
+            return records
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = StepRecord(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue  # a line cut short by a crash mid-write
+                records[record.step] = record
+        return records
+
+    def append(self, run_id: str, record: StepRecord):
+        path = self.path(run_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def truncate(self, run_id: str, from_step: int):
+        """Drop the records of `from_step` and every later step."""
+        kept = [r for step, r in sorted(self.load(run_id).items()) if step < from_step]
+        path = self.path(run_id)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in kept:
+                f.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def delete(self, run_id: str):
+        self.path(run_id).unlink(missing_ok=True)
+
+    def list_runs(self) -> List[str]:
+        if not self.directory.exists():
+            return []
+        return sorted(p.stem for p in self.directory.glob("*.jsonl"))
+
+
+class CheckpointedRun:
+    def __init__(self, store: CheckpointStore, run_id: str, kind: str):
+        self.store = store
+        self.run_id = run_id
+        self.kind = kind
+        self.records = store.load(run_id)
+
+    def run_step(self, step: int, agent_name: str, agent: Any, action: str, step_input: str,
+                 compute: Callable[[], str]) -> str:
+        """Return the checkpointed output of this step, or compute and checkpoint it."""
+        fingerprint = step_fingerprint(self.kind, agent_name, action, step_input)
+        record = self.records.get(step)
+        if record is not None and record.fingerprint == fingerprint:
+            if not self._holds_delta(agent, record):
+                agent.restore_history(record.memory_delta)
+            return record.output
+        if any(s >= step for s in self.records):
+            self.store.truncate(self.run_id, step)
+            self.records = {s: r for s, r in self.records.items() if s < step}
+
+        history_before = agent.history_length()
+        output = compute()
+        record = StepRecord(
+            step=step,
+            kind=self.kind,
+            agent=agent_name,
+            action=action,
+            input=step_input,
+            output=output,
+            fingerprint=fingerprint,
+            memory_delta=agent.get_conversation_history(history_before),
+            history_start=history_before,
+            completed_at=time.time(),
+        )
+        self.store.append(self.run_id, record)
+        self.records[step] = record
+        return output
+
+    @staticmethod
+    def _holds_delta(agent: Any, record: StepRecord) -> bool:
+        """True if the agent still has this step's turns, e.g. when resuming in the same process."""
+        start, delta = record.history_start, record.memory_delta
+        if start < 0 or agent.history_length() < start + len(delta):
+            return False
+        return agent.get_conversation_history(start)[:len(delta)] == delta
@@ -0,0 +1,216 @@
+"""
+Token counting and a context-window guard for agent LLM calls
+
+Ollama silently drops whatever does not fit in `num_ctx`, after spending
+prompt-eval time on it. ContextGuard measures each prompt before the call
+and, when it would not fit, applies a packing policy:
+
+- "trim_history": drop the oldest conversation turns
+- "compact": cut the middle out of the largest messages (pasted code, documents)
+- "reject": raise ContextOverflowError
+
+Policies run in order until the prompt fits; if none make it fit the call is
+rejected. Counts come from a local tokenizer when one is configured
+(`tokenizer_path` to a HuggingFace tokenizer.json, needs `tokenizers`) and
+from a fast approximation otherwise.
+"""
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from langchain.schema import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+DEFAULT_NUM_CTX = 4096
+DEFAULT_RESERVE_TOKENS = 512  # left free for the answer
+DEFAULT_POLICY: Tuple[str, ...] = ("trim_history", "compact")
+MESSAGE_OVERHEAD_TOKENS = 4  # role markers added by the chat template
+COMPACTION_MARKER = "\n[... {omitted} tokens omitted to fit the context window ...]\n"
+MIN_COMPACTED_TOKENS = 64
+
+PIECE_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+class ContextOverflowError(ValueError):
+    def __init__(self, prompt_tokens: int, limit: int):
+        super().__init__(f"Prompt needs {prompt_tokens} tokens but only {limit} fit in the context window")
+        self.prompt_tokens = prompt_tokens
+        self.limit = limit
+
+
+def approximate_tokens(text: str) -> int:
+    """BPE-like estimate: one token per short word or symbol, more for long words."""
+    return sum(1 + len(piece) // 6 for piece in PIECE_RE.findall(text))
+
+
+@lru_cache(maxsize=None)
+def _load_tokenizer(tokenizer_path: str):
+    from tokenizers import Tokenizer
+
+    return Tokenizer.from_file(tokenizer_path)
+
+
+class TokenCounter:
+    """Counts tokens with a cached local tokenizer, or approximately."""
+
+    def __init__(self, tokenizer_path: Optional[str] = None, cache_size: int = 2048):
+        self.tokenizer_path = tokenizer_path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def mode(self) -> str:
+        return "tokenizer" if self.tokenizer_path else "approximate"
+
+    def count(self, text: str) -> int:
+        if not self.tokenizer_path:
+            return approximate_tokens(text)
+        with self._lock:
+            if text in self._cache:
+                self._cache.move_to_end(text)
+                return self._cache[text]
+        tokens = len(_load_tokenizer(self.tokenizer_path).encode(text, add_special_tokens=False).ids)
+        with self._lock:
+            self._cache[text] = tokens
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def count_messages(self, messages: Sequence[BaseMessage]) -> int:
+        return sum(self.count(str(m.content)) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+class ContextMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.prompt_tokens = 0
+            self.max_prompt_tokens = 0
+            self.overflows = 0
+            self.trimmed_messages = 0
+            self.compacted_tokens = 0
+            self.rejected = 0
+
+    def record(self, prompt_tokens: int, overflow: bool = False, trimmed: int = 0, compacted: int = 0,
+               rejected: bool = False):
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.max_prompt_tokens = max(self.max_prompt_tokens, prompt_tokens)
+            self.overflows += int(overflow)
+            self.trimmed_messages += trimmed
+            self.compacted_tokens += compacted
+            self.rejected += int(rejected)
+
+    def report(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "avg_prompt_tokens": self.prompt_tokens / self.calls if self.calls else 0.0,
+                "max_prompt_tokens": self.max_prompt_tokens,
+                "overflows": self.overflows,
+                "trimmed_messages": self.trimmed_messages,
+                "compacted_tokens": self.compacted_tokens,
+                "rejected": self.rejected,
+            }
+
+
+# Shared by every agent unless one is given its own.
+context_metrics = ContextMetrics()
+
+
+def _with_content(message: BaseMessage, content: str) -> BaseMessage:
+    return type(message)(content=content)
+
+
+class ContextGuard:
+    def __init__(
+        self,
+        num_ctx: int = DEFAULT_NUM_CTX,
+        reserve_tokens: int = DEFAULT_RESERVE_TOKENS,
+        policy: Sequence[str] = DEFAULT_POLICY,
+        counter: Optional[TokenCounter] = None,
+        metrics: Optional[ContextMetrics] = None
+    ):
+        unknown = set(policy) - {"trim_history", "compact", "reject"}
+        if unknown:
+            raise ValueError(f"Unknown packing policy steps: {sorted(unknown)}")
+        self.num_ctx = num_ctx
+        self.reserve_tokens = reserve_tokens
+        self.policy = tuple(policy)
+        self.counter = counter or TokenCounter()
+        self.metrics = metrics or context_metrics
+
+    @property
+    def limit(self) -> int:
+        return self.num_ctx - self.reserve_tokens
+
+    def fit(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        """Return messages that fit the context window, or raise ContextOverflowError."""
+        tokens = self.counter.count_messages(messages)
+        if tokens <= self.limit:
+            self.metrics.record(tokens)
+            return messages
+
+        original_tokens = tokens
+        trimmed = compacted = 0
+        for step in self.policy:
+            if step == "reject":
+                break
+            if step == "trim_history":
+                messages, trimmed = self._trim_history(messages)
+            elif step == "compact":
+                messages, compacted = self._compact(messages)
+            tokens = self.counter.count_messages(messages)
+            if tokens <= self.limit:
+                self.metrics.record(tokens, overflow=True, trimmed=trimmed, compacted=compacted)
+                return messages
+
+        self.metrics.record(original_tokens, overflow=True, trimmed=trimmed, compacted=compacted, rejected=True)
+        raise ContextOverflowError(tokens, self.limit)
+
+    def _trim_history(self, messages: List[BaseMessage]) -> Tuple[List[BaseMessage], int]:
+        """Drop the oldest turns between the system prompt and the current message."""
+        head = [m for m in messages[:1] if isinstance(m, SystemMessage)]
+        history = messages[len(head):-1]
+        current = messages[-1:]
+        dropped = 0
+        while history and self.counter.count_messages(head + history + current) > self.limit:
+            # Drop a whole user/assistant pair where possible so the transcript stays well-formed.
+            step = 2 if len(history) > 1 and isinstance(history[0], HumanMessage) and isinstance(history[1], AIMessage) else 1
+            history = history[step:]
+            dropped += step
+        return head + history + current, dropped
+
+    def _compact(self, messages: List[BaseMessage]) -> Tuple[List[BaseMessage], int]:
+        """Shrink the largest messages, keeping their beginning and end."""
+        messages = list(messages)
+        removed = 0
+        previous = None
+        while True:
+            total = self.counter.count_messages(messages)
+            excess = total - self.limit
+            if excess <= 0 or (previous is not None and total >= previous):
+                return messages, removed
+            previous = total
+            sizes = [self.counter.count(str(m.content)) for m in messages]
+            largest = max(range(len(messages)), key=sizes.__getitem__)
+            if sizes[largest] <= MIN_COMPACTED_TOKENS:
+                return messages, removed
+            keep = max(MIN_COMPACTED_TOKENS, sizes[largest] - excess - 16)
+            content = str(messages[largest].content)
+            # Characters per token for this message, so the cut lands close to the target.
+            ratio = len(content) / sizes[largest]
+            half = int(keep * ratio / 2)
+            omitted = sizes[largest] - keep
+            messages[largest] = _with_content(
+                messages[largest],
+                content[:half] + COMPACTION_MARKER.format(omitted=omitted) + content[len(content) - half:]
+            )
+            removed += omitted
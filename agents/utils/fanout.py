@@ -0,0 +1,65 @@
+"""
+Prompt deduplication for multi-agent fan-out
+
+Agents whose role files are empty (or identical) end up with byte-identical
+prompts, and asking each of them the same question produces the same
+generation several times over. Fan-out paths group agents by the fingerprint
+of their effective prompt (model settings, system prompt, history and
+message), generate once per group and share the answer, recording which
+agent's call produced it.
+"""
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List
+
+
+def prompt_fingerprint(settings: List[Any], messages: List[Any]) -> str:
+    payload = json.dumps(
+        [settings, [(message.type, str(message.content)) for message in messages]],
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def group_by_prompt(agents: Dict[str, Any], user_message: str) -> Dict[str, List[str]]:
+    """Agent names keyed by prompt fingerprint, in the order given."""
+    groups: Dict[str, List[str]] = {}
+    for name, agent in agents.items():
+        groups.setdefault(agent.prompt_fingerprint(user_message), []).append(name)
+    return groups
+
+
+class FanoutStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.prompts = 0
+            self.generated = 0
+            self.last_shared_from: Dict[str, str] = {}
+
+    def record(self, groups: Dict[str, List[str]]):
+        with self._lock:
+            self.prompts += sum(len(names) for names in groups.values())
+            self.generated += len(groups)
+            self.last_shared_from = {
+                name: names[0] for names in groups.values() for name in names[1:]
+            }
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "prompts": self.prompts,
+                "generated": self.generated,
+                "shared": self.prompts - self.generated,
+                "dedup_rate": (self.prompts - self.generated) / self.prompts if self.prompts else 0.0,
+                "last_shared_from": dict(self.last_shared_from),
+            }
+
+
+# Shared by every orchestrator unless one is given its own.
+fanout_stats = FanoutStats()
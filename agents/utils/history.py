@@ -0,0 +1,106 @@
+"""
+Compact conversation history for agents
+
+Turns are packed into three flat arrays instead of one LangChain message
+object per turn: the UTF-8 text of every turn back to back in a bytearray,
+the end offset of each turn, and a one-byte role code. Appending is
+amortized O(1), and `view()` returns a window over the arrays without
+copying them; messages are decoded from it only when a prompt is assembled.
+`usage()` reports the bytes a history holds, so many long sessions stay
+predictable.
+"""
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from langchain.schema import AIMessage, BaseMessage, HumanMessage
+
+ROLES = ("user", "assistant")
+ROLE_CODES = {role: code for code, role in enumerate(ROLES)}
+MESSAGE_CLASSES = (HumanMessage, AIMessage)
+
+
+class HistoryView:
+    """Read-only window over a ConversationHistory's arrays; later appends are not visible."""
+
+    __slots__ = ("_data", "_ends", "_roles", "_start", "_stop")
+
+    def __init__(self, data: bytearray, ends: array, roles: array, start: int, stop: int):
+        self._data = data
+        self._ends = ends
+        self._roles = roles
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def _turn(self, index: int) -> Tuple[str, str]:
+        begin = self._ends[index - 1] if index else 0
+        with memoryview(self._data) as buffer:
+            text = str(buffer[begin:self._ends[index]], "utf-8")
+        return ROLES[self._roles[index]], text
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._turn(self._start + index)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for index in range(self._start, self._stop):
+            yield self._turn(index)
+
+    def messages(self) -> List[BaseMessage]:
+        """LangChain messages for prompt assembly, decoded straight from the packed text."""
+        return [MESSAGE_CLASSES[ROLE_CODES[role]](content=text) for role, text in self]
+
+    def dicts(self) -> List[Dict[str, str]]:
+        return [{"role": role, "content": text} for role, text in self]
+
+
+class ConversationHistory:
+    __slots__ = ("_data", "_ends", "_roles")
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    def append(self, role: str, content: str):
+        if role not in ROLE_CODES:
+            raise ValueError(f"Unknown role {role!r}, expected one of {ROLES}")
+        self._data += content.encode("utf-8")
+        self._ends.append(len(self._data))
+        self._roles.append(ROLE_CODES[role])
+
+    def add_exchange(self, user_message: str, response: str):
+        self.append("user", user_message)
+        self.append("assistant", response)
+
+    def extend(self, turns: List[Dict[str, str]]):
+        for turn in turns:
+            self.append(turn["role"], turn["content"])
+
+    def clear(self):
+        # Fresh arrays rather than emptying in place, so views already handed out stay valid.
+        self._data = bytearray()
+        self._ends = array("Q")
+        self._roles = array("B")
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> HistoryView:
+        stop = len(self) if stop is None else min(stop, len(self))
+        return HistoryView(self._data, self._ends, self._roles, max(0, start), stop)
+
+    def usage(self) -> Dict[str, int]:
+        text_bytes = len(self._data)
+        index_bytes = self._ends.itemsize * len(self._ends) + self._roles.itemsize * len(self._roles)
+        return {
+            "turns": len(self),
+            "text_bytes": text_bytes,
+            "index_bytes": index_bytes,
+            # Includes the arrays' spare capacity and object headers.
+            "allocated_bytes": sys.getsizeof(self._data) + sys.getsizeof(self._ends) + sys.getsizeof(self._roles),
+        }
@@ -1,12 +1,15 @@
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+from utils.role_sections import DEFAULT_TOKEN_BUDGET, RoleSectionIndex
 
 class RoleLoader:
     def __init__(self, role_folder: str = "Role"):
         self.role_folder = Path(role_folder)
         if not self.role_folder.exists():
             raise FileNotFoundError(f"Role folder not found: {role_folder}")
+        self._indexes: Dict[str, RoleSectionIndex] = {}
     
     def load_role(self, role_filename: str) -> str:
         role_path = self.role_folder / role_filename
@@ -18,9 +21,20 @@ class RoleLoader:
         
         return content
     
-    def get_role_prompt(self, role_filename: str) -> str:
-        role_content = self.load_role(role_filename)
+    def get_role_prompt(
+        self,
+        role_filename: str,
+        query: Optional[str] = None,
+        budget_tokens: int = DEFAULT_TOKEN_BUDGET
+    ) -> str:
+        if query is None:
+            role_content = self.load_role(role_filename)
+        else:
+            role_content = self.get_role_index(role_filename).build(query, budget_tokens)
         
+        return self.format_role_prompt(role_content)
+    
+    def format_role_prompt(self, role_content: str) -> str:
         prompt = f"""You are an AI agent acting as the role defined below. Follow all the guidelines, responsibilities, and expertise areas mentioned in your role definition.
 
 {role_content}
@@ -29,6 +43,14 @@ Based on this role definition, respond to user queries with the expertise, knowl
         
         return prompt
     
+    def get_role_index(self, role_filename: str, embeddings: Optional[Any] = None) -> RoleSectionIndex:
+        """Section index of a role file, built once per loader."""
+        index = self._indexes.get(role_filename)
+        if index is None or (embeddings is not None and index.embeddings is not embeddings):
+            index = RoleSectionIndex(self.load_role(role_filename), embeddings=embeddings)
+            self._indexes[role_filename] = index
+        return index
+    
     def list_available_roles(self) -> list:
         return [f.name for f in self.role_folder.glob("*.txt")]
     
@@ -0,0 +1,183 @@
+"""
+Query-relevant selection of role file sections
+
+Role files are 13-19 KB of markdown, and sending all of it as the system
+prompt on every call costs thousands of prompt tokens. RoleSectionIndex splits
+a role file at its headings, always keeps the identity (title) and summary
+(first `##` section), and fills the rest of a token budget with the sections
+that best match the query, ranked lexically (BM25) and, when an embeddings
+model is given, by embedding similarity.
+"""
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from utils.context_guard import approximate_tokens
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+DEFAULT_TOKEN_BUDGET = 1200
+LEXICAL_WEIGHT = 0.5
+# Sections scoring below this fraction of the best match are left out even if they fit.
+MIN_RELEVANCE = 0.2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def estimate_tokens(text: str) -> int:
+    return approximate_tokens(text)
+
+
+def tokenize(text: str) -> List[str]:
+    return WORD_RE.findall(text.casefold())
+
+
+@dataclass
+class RoleSection:
+    position: int
+    level: int
+    heading: str
+    parent: Optional[str]
+    body: str
+    tokens: int = 0
+
+    @property
+    def text(self) -> str:
+        return f"{'#' * self.level} {self.heading}\n{self.body}".strip()
+
+
+def parse_sections(content: str) -> List[RoleSection]:
+    """Split markdown into sections; `###` and deeper nest under the last `##`."""
+    sections: List[RoleSection] = []
+    parent: Optional[str] = None
+    level, heading, lines = 0, "", []
+
+    def flush():
+        body = "\n".join(line for line in lines if line.strip() != "---").strip()
+        if heading or body:
+            section = RoleSection(len(sections), level, heading, parent if level > 2 else None, body)
+            section.tokens = estimate_tokens(section.text)
+            sections.append(section)
+
+    for line in content.splitlines():
+        match = HEADING_RE.match(line)
+        if not match:
+            lines.append(line)
+            continue
+        flush()
+        level, heading, lines = len(match.group(1)), match.group(2).strip(), []
+        if level <= 2:
+            parent = heading
+    flush()
+    return sections
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class RoleSectionIndex:
+    def __init__(self, content: str, embeddings: Optional[Any] = None, lexical_weight: float = LEXICAL_WEIGHT):
+        self.sections = parse_sections(content)
+        self.embeddings = embeddings
+        self.lexical_weight = lexical_weight if embeddings is not None else 1.0
+        self.pinned = self._pinned_positions()
+
+        # Heading words count twice: they name what the section is about.
+        self._terms = [
+            Counter(tokenize(f"{s.parent or ''} {s.heading} {s.heading}") + tokenize(s.body))
+            for s in self.sections
+        ]
+        self._lengths = [sum(terms.values()) for terms in self._terms]
+        self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        document_frequency = Counter(term for terms in self._terms for term in terms)
+        n = len(self.sections)
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()
+        }
+        self._section_vectors: Optional[List[List[float]]] = None
+
+    def _pinned_positions(self) -> List[int]:
+        """The title and the first `##` section (identity and summary)."""
+        pinned = [s.position for s in self.sections if s.level == 1][:1]
+        summary = next((s for s in self.sections if s.level == 2), None)
+        if summary is not None:
+            pinned.append(summary.position)
+        if not pinned and self.sections:
+            pinned.append(0)
+        return pinned
+
+    def lexical_scores(self, query: str) -> List[float]:
+        query_terms = set(tokenize(query))
+        scores = []
+        for terms, length in zip(self._terms, self._lengths):
+            score = 0.0
+            for term in query_terms:
+                tf = terms.get(term, 0)
+                if tf:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self._avg_length or 1))
+                    score += self._idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+    def embedding_scores(self, query: str) -> List[float]:
+        if self._section_vectors is None:
+            self._section_vectors = self.embeddings.embed_documents([s.text for s in self.sections])
+        query_vector = self.embeddings.embed_query(query)
+        return [max(0.0, _cosine(query_vector, vector)) for vector in self._section_vectors]
+
+    def scores(self, query: str) -> List[float]:
+        lexical = self.lexical_scores(query)
+        top = max(lexical, default=0.0)
+        combined = [score / top if top else 0.0 for score in lexical]
+        if self.embeddings is not None and self.lexical_weight < 1.0:
+            semantic = self.embedding_scores(query)
+            combined = [
+                self.lexical_weight * lex + (1 - self.lexical_weight) * sem
+                for lex, sem in zip(combined, semantic)
+            ]
+        return combined
+
+    def select(self, query: str, budget_tokens: int = DEFAULT_TOKEN_BUDGET) -> List[RoleSection]:
+        """Pinned sections plus the best-scoring sections that fit, in document order."""
+        chosen = {position for position in self.pinned}
+        used = sum(self.sections[p].tokens for p in chosen)
+        ranked = sorted(
+            ((score, s) for score, s in zip(self.scores(query), self.sections) if s.position not in chosen),
+            key=lambda pair: pair[0],
+            reverse=True,
+        )
+        threshold = max(MIN_RELEVANCE * ranked[0][0], 1e-9) if ranked else 0.0
+        for score, section in ranked:
+            if score < threshold:
+                break
+            if used + section.tokens <= budget_tokens:
+                chosen.add(section.position)
+                used += section.tokens
+        return [s for s in self.sections if s.position in chosen]
+
+    def render(self, sections: List[RoleSection]) -> str:
+        parts: List[str] = []
+        current_parent: Optional[str] = None
+        for section in sections:
+            if section.parent and section.parent != current_parent:
+                parts.append(f"## {section.parent}")
+            current_parent = section.parent if section.level > 2 else section.heading
+            parts.append(section.text)
+        return "\n\n".join(parts)
+
+    def build(self, query: str, budget_tokens: int = DEFAULT_TOKEN_BUDGET) -> str:
+        return self.render(self.select(query, budget_tokens))
+
+    def report(self, query: str, budget_tokens: int = DEFAULT_TOKEN_BUDGET) -> Dict[str, Any]:
+        selected = self.select(query, budget_tokens)
+        return {
+            "sections": [s.heading for s in selected],
+            "tokens": sum(s.tokens for s in selected),
+            "full_tokens": sum(s.tokens for s in self.sections),
+        }
@@ -0,0 +1,112 @@
+"""
+Import-time profile for the graph services.
+
+Imports a module in a fresh interpreter with ``python -X importtime`` and
+reports the per-module and per-package import cost. With ``--budget-ms``
+the script exits non-zero when the cold import exceeds the budget, so it
+can guard container cold-start time in CI:
+
+    python scripts/import_profile.py services/agents/app graph.graph --budget-ms 1500
+    python scripts/import_profile.py services/simple_agent/app graph.graph --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# (module, self_us, cumulative_us)
+ImportRecord = Tuple[str, int, int]
+
+
+def run_importtime(app_dir: Path, module: str) -> List[ImportRecord]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(app_dir), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=app_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    records = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        records.append((name.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+def summarize(records: List[ImportRecord], module: str, top: int) -> Dict:
+    total_us = next((cum for name, _, cum in reversed(records) if name == module), 0)
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in records:
+        by_package[name.split(".")[0]] += self_us
+
+    return {
+        "module": module,
+        "total_ms": total_us / 1000,
+        "module_count": len(records),
+        "top_modules": [
+            {"module": name, "self_ms": self_us / 1000, "cumulative_ms": cum / 1000}
+            for name, self_us, cum in sorted(records, key=lambda r: r[1], reverse=True)[:top]
+        ],
+        "top_packages": [
+            {"package": name, "self_ms": us / 1000}
+            for name, us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ],
+    }
+
+
+def print_report(report: Dict):
+    print("=" * 60)
+    print(f"Import profile: {report['module']}")
+    print("=" * 60)
+    print(f"Total: {report['total_ms']:.1f} ms across {report['module_count']} modules")
+    print("\nTop packages (self time):")
+    for entry in report["top_packages"]:
+        print(f"  {entry['self_ms']:9.1f} ms  {entry['package']}")
+    print("\nTop modules (self time):")
+    for entry in report["top_modules"]:
+        print(f"  {entry['self_ms']:9.1f} ms  {entry['module']} (cumulative {entry['cumulative_ms']:.1f} ms)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("app_dir", type=Path, help="Service app directory, e.g. services/agents/app")
+    parser.add_argument("module", help="Module to import, e.g. graph.graph")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh imports to run; the fastest is reported")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, help="Fail when the import takes longer than this")
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    app_dir = args.app_dir.resolve()
+    reports = [
+        summarize(run_importtime(app_dir, args.module), args.module, args.top)
+        for _ in range(max(1, args.runs))
+    ]
+    report = min(reports, key=lambda r: r["total_ms"])
+    report["budget_ms"] = args.budget_ms
+    print_report(report)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        print(f"\n✗ Import of {args.module} took {report['total_ms']:.1f} ms, budget is {args.budget_ms:.1f} ms")
+        return 1
+    if args.budget_ms is not None:
+        print(f"\n✓ Import of {args.module} is within the {args.budget_ms:.1f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import os
+import time
+from typing import Any, Dict, Optional
+
+from graph.state import GraphState
+
+# Per-request time budget, in seconds, for one run of the CRAG graph.
+DEFAULT_BUDGET_SECONDS = float(os.environ.get("GRAPH_BUDGET_SECONDS", "60"))
+
+# Upper bound on generate -> grade -> generate loops for a single request.
+MAX_GENERATIONS = int(os.environ.get("GRAPH_MAX_GENERATIONS", "3"))
+
+# Degradation path, applied in this order as the remaining budget shrinks.
+SKIP_ANSWER_GRADING_BELOW = float(os.environ.get("GRAPH_SKIP_ANSWER_GRADING_BELOW", "20"))
+SKIP_WEB_SEARCH_BELOW = float(os.environ.get("GRAPH_SKIP_WEB_SEARCH_BELOW", "15"))
+RETURN_BEST_BELOW = float(os.environ.get("GRAPH_RETURN_BEST_BELOW", "5"))
+
+SKIP_ANSWER_GRADING = "skip_answer_grading"
+SKIP_WEB_SEARCH = "skip_web_search"
+RETURN_BEST_GENERATION = "return_best_generation"
+MAX_GENERATIONS_REACHED = "max_generations_reached"
+
+
+def initial_state(question: str, budget_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """Build the graph input for a question with its deadline attached."""
+    budget = DEFAULT_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+    return {
+        "question": question,
+        "deadline": time.time() + budget,
+        "generation_attempts": 0,
+        "degradations": [],
+    }
+
+
+def remaining(state: GraphState) -> float:
+    """Seconds left before the request deadline; unbounded if none was set."""
+    deadline = state.get("deadline")
+    if deadline is None:
+        return float("inf")
+    return deadline - time.time()
+
+
+def should_skip_answer_grading(state: GraphState) -> bool:
+    return remaining(state) < SKIP_ANSWER_GRADING_BELOW
+
+
+def should_skip_web_search(state: GraphState) -> bool:
+    return remaining(state) < SKIP_WEB_SEARCH_BELOW
+
+
+def should_return_best(state: GraphState) -> bool:
+    return remaining(state) < RETURN_BEST_BELOW
@@ -1,8 +1,11 @@
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from langchain.output_parsers import PydanticOutputParser
 from langchain_core.runnables import RunnableSequence
-from langchain_ollama import OllamaLLM
+
+from graph.chains.llm import get_llm
 
 
 
@@ -15,12 +18,6 @@ class GradeAnswer(BaseModel):
 
 parser = PydanticOutputParser(pydantic_object=GradeAnswer)
 
-llm = OllamaLLM(
-        base_url="http://ollama:11434",
-        model="smollm2",
-        temperature=0,
-    )
-
 system = """You are a grader assessing whether an answer addresses / resolves a question \n 
      Give a binary score 'yes' or 'no'. Yes' means that the answer resolves the question."""
 answer_prompt = ChatPromptTemplate.from_messages(
@@ -30,4 +27,7 @@ answer_prompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-answer_grader: RunnableSequence = answer_prompt | llm | parser
+
+@lru_cache(maxsize=None)
+def get_answer_grader() -> RunnableSequence:
+    return answer_prompt | get_llm() | parser
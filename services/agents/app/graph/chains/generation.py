@@ -1,12 +1,12 @@
-from langchain import hub
+from functools import lru_cache
+
 from langchain_core.output_parsers import StrOutputParser
-from langchain_ollama import OllamaLLM
+from langchain_core.runnables import RunnableSequence
+
+from graph.chains.llm import get_llm
+from graph.prompts import get_prompt
 
-llm = OllamaLLM(
-        base_url="http://ollama:11434",
-        model="smollm2",
-        temperature=0,
-    )
-prompt = hub.pull("rlm/rag-prompt")
 
-generation_chain = prompt | llm | StrOutputParser()
+@lru_cache(maxsize=None)
+def get_generation_chain() -> RunnableSequence:
+    return get_prompt("rlm/rag-prompt") | get_llm() | StrOutputParser()
@@ -1,14 +1,12 @@
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from langchain_core.runnables import RunnableSequence
 from langchain.output_parsers import PydanticOutputParser
-from langchain_ollama import OllamaLLM
 
-llm = OllamaLLM(
-        base_url="http://ollama:11434",
-        model="smollm2",
-        temperature=0,
-    )
+from graph.chains.llm import get_llm
+
 
 
 class GradeHallucinations(BaseModel):
@@ -30,4 +28,7 @@ hallucination_prompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-hallucination_grader: RunnableSequence = hallucination_prompt | llm | parser
+
+@lru_cache(maxsize=None)
+def get_hallucination_grader() -> RunnableSequence:
+    return hallucination_prompt | get_llm() | parser
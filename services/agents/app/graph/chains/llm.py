@@ -0,0 +1,19 @@
+import os
+from functools import lru_cache
+
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://ollama:11434")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "smollm2")
+# Comma-separated Ollama servers to load-balance across; overrides OLLAMA_BASE_URL when set.
+OLLAMA_BASE_URLS = os.environ.get("OLLAMA_BASE_URLS")
+
+
+@lru_cache(maxsize=None)
+def get_llm(model: str = OLLAMA_MODEL, base_url: str = OLLAMA_BASE_URL):
+    """Return the shared OllamaLLM client for (model, base_url), or a pooled one when OLLAMA_BASE_URLS is set."""
+    if OLLAMA_BASE_URLS:
+        from graph.chains.ollama_pool import PooledOllamaLLM
+
+        return PooledOllamaLLM(model=model, temperature=0)
+    from langchain_ollama import OllamaLLM
+
+    return OllamaLLM(base_url=base_url, model=model, temperature=0)
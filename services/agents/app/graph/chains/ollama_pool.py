@@ -0,0 +1,352 @@
+"""
+Load-balanced pool of Ollama endpoints
+
+Configured from a list of base URLs (OLLAMA_BASE_URLS, comma-separated,
+falling back to OLLAMA_BASE_URL). Each request goes to the endpoint with the
+fewest requests in flight, preferring endpoints that already have the model
+loaded (/api/ps), then those that have it pulled (/api/tags). Health checks
+poll both endpoints; an endpoint that fails repeatedly is ejected for a
+while and rejoins once a check or a trial request succeeds.
+
+PooledOllamaLLM and PooledOllamaEmbeddings are drop-in OllamaLLM and
+OllamaEmbeddings that route every call through the pool and retry on another
+endpoint when one is unreachable.
+"""
+import itertools
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import httpx
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.llms import LLM
+from pydantic import BaseModel, PrivateAttr
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+HEALTH_INTERVAL_SECONDS = 15.0
+HEALTH_TIMEOUT_SECONDS = 2.0
+MAX_FAILURES = 3
+EJECT_SECONDS = 30.0
+
+
+class NoHealthyEndpointError(RuntimeError):
+    pass
+
+
+def _model_names(payload: Dict[str, Any]) -> Set[str]:
+    names = set()
+    for entry in payload.get("models", []):
+        for key in ("name", "model"):
+            if entry.get(key):
+                names.add(entry[key])
+    return names
+
+
+def _has_model(names: Set[str], model: str) -> bool:
+    return model in names or (":" not in model and f"{model}:latest" in names)
+
+
+def is_endpoint_error(error: BaseException) -> bool:
+    """Errors that say something about the endpoint rather than the request."""
+    if isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    status = getattr(error, "status_code", None)
+    return isinstance(status, int) and status >= 500
+
+
+def is_model_missing(error: BaseException) -> bool:
+    return getattr(error, "status_code", None) == 404
+
+
+class Endpoint:
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.healthy = True  # optimistic until the first check says otherwise
+        self.outstanding = 0
+        self.loaded: Set[str] = set()
+        self.available: Set[str] = set()
+        self.checked = False
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+
+    def usable(self, now: float) -> bool:
+        return self.healthy or now >= self.ejected_until
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "loaded": sorted(self.loaded),
+            "available": sorted(self.available),
+        }
+
+
+class OllamaPool:
+    def __init__(
+        self,
+        urls: Iterable[str],
+        health_interval: float = HEALTH_INTERVAL_SECONDS,
+        health_timeout: float = HEALTH_TIMEOUT_SECONDS,
+        max_failures: int = MAX_FAILURES,
+        eject_seconds: float = EJECT_SECONDS
+    ):
+        self.endpoints = [Endpoint(url) for url in dict.fromkeys(u.strip() for u in urls if u.strip())]
+        if not self.endpoints:
+            raise ValueError("OllamaPool needs at least one endpoint URL")
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # Health checks
+
+    def check(self, endpoint: Endpoint) -> bool:
+        try:
+            with httpx.Client(timeout=self.health_timeout) as client:
+                tags = client.get(f"{endpoint.url}/api/tags")
+                tags.raise_for_status()
+                ps = client.get(f"{endpoint.url}/api/ps")
+                loaded = _model_names(ps.json()) if ps.status_code == 200 else set()
+        except (httpx.HTTPError, ValueError):
+            with self._lock:
+                endpoint.healthy = False
+                endpoint.ejected_until = time.monotonic() + self.eject_seconds
+            return False
+        with self._lock:
+            endpoint.available = _model_names(tags.json())
+            endpoint.loaded = loaded
+            endpoint.checked = True
+            endpoint.healthy = True
+            endpoint.failures = 0
+            endpoint.ejected_until = 0.0
+        return True
+
+    def check_all(self) -> Dict[str, bool]:
+        return {endpoint.url: self.check(endpoint) for endpoint in self.endpoints}
+
+    def start_health_checks(self):
+        """Poll every endpoint in a daemon thread until stop_health_checks()."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.is_set():
+                self.check_all()
+                self._stop.wait(self.health_interval)
+
+        self._thread = threading.Thread(target=loop, name="ollama-pool-health", daemon=True)
+        self._thread.start()
+
+    def stop_health_checks(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.health_timeout * 2)
+
+    # Selection
+
+    def select(self, model: str, exclude: Iterable[Endpoint] = ()) -> Endpoint:
+        """Least-outstanding endpoint among the best model-availability tier."""
+        excluded = set(map(id, exclude))
+        with self._lock:
+            now = time.monotonic()
+            candidates = [e for e in self.endpoints if id(e) not in excluded and e.usable(now)]
+            if not candidates:
+                raise NoHealthyEndpointError(f"No healthy Ollama endpoint for model {model!r}")
+            tiers = (
+                [e for e in candidates if _has_model(e.loaded, model)],
+                [e for e in candidates if _has_model(e.available, model)],
+                [e for e in candidates if not e.checked],
+                candidates,
+            )
+            pool = next(tier for tier in tiers if tier)
+            offset = next(self._round_robin)
+            # Rotate before taking the minimum so ties are spread round-robin.
+            rotated = pool[offset % len(pool):] + pool[:offset % len(pool)]
+            endpoint = min(rotated, key=lambda e: e.outstanding)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, model: str, error: Optional[BaseException] = None):
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is None:
+                endpoint.failures = 0
+                endpoint.healthy = True
+                endpoint.ejected_until = 0.0
+                endpoint.loaded.add(model)  # it is loaded now that it has answered
+            elif is_model_missing(error):
+                endpoint.loaded.discard(model)
+                endpoint.available.discard(model)
+            elif is_endpoint_error(error):
+                endpoint.failures += 1
+                if endpoint.failures >= self.max_failures or isinstance(error, httpx.ConnectError):
+                    endpoint.healthy = False
+                    endpoint.ejected_until = time.monotonic() + self.eject_seconds
+
+    @contextmanager
+    def lease(self, model: str, exclude: Iterable[Endpoint] = ()):
+        endpoint = self.select(model, exclude)
+        try:
+            yield endpoint
+        except BaseException as e:
+            self.release(endpoint, model, e)
+            raise
+        self.release(endpoint, model)
+
+    @asynccontextmanager
+    async def alease(self, model: str, exclude: Iterable[Endpoint] = ()):
+        endpoint = self.select(model, exclude)
+        try:
+            yield endpoint
+        except BaseException as e:
+            self.release(endpoint, model, e)
+            raise
+        self.release(endpoint, model)
+
+    def call(self, model: str, fn: Callable[[Endpoint], Any]) -> Any:
+        """Run fn on a leased endpoint, moving to the next one when an endpoint fails."""
+        tried: List[Endpoint] = []
+        last_error: Optional[BaseException] = None
+        for _ in self.endpoints:
+            try:
+                with self.lease(model, tried) as endpoint:
+                    tried.append(endpoint)
+                    return fn(endpoint)
+            except NoHealthyEndpointError:
+                break
+            except Exception as e:
+                if not (is_endpoint_error(e) or is_model_missing(e)):
+                    raise
+                last_error = e
+        raise last_error or NoHealthyEndpointError(f"No healthy Ollama endpoint for model {model!r}")
+
+    async def acall(self, model: str, fn: Callable[[Endpoint], Any]) -> Any:
+        tried: List[Endpoint] = []
+        last_error: Optional[BaseException] = None
+        for _ in self.endpoints:
+            try:
+                async with self.alease(model, tried) as endpoint:
+                    tried.append(endpoint)
+                    return await fn(endpoint)
+            except NoHealthyEndpointError:
+                break
+            except Exception as e:
+                if not (is_endpoint_error(e) or is_model_missing(e)):
+                    raise
+                last_error = e
+        raise last_error or NoHealthyEndpointError(f"No healthy Ollama endpoint for model {model!r}")
+
+    def report(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [endpoint.snapshot() for endpoint in self.endpoints]
+
+
+def configured_urls() -> List[str]:
+    urls = os.environ.get("OLLAMA_BASE_URLS") or os.environ.get("OLLAMA_BASE_URL") or DEFAULT_BASE_URL
+    return [url for url in urls.split(",") if url.strip()]
+
+
+@lru_cache(maxsize=None)
+def get_ollama_pool() -> OllamaPool:
+    """The process-wide pool; health checks start with it when there is more than one endpoint."""
+    pool = OllamaPool(configured_urls())
+    if len(pool.endpoints) > 1:
+        pool.start_health_checks()
+    return pool
+
+
+class PooledOllamaLLM(LLM):
+    """OllamaLLM that sends each call to an endpoint chosen by an OllamaPool."""
+
+    model: str
+    temperature: Optional[float] = None
+    pool: Any = None
+
+    _clients: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @property
+    def _llm_type(self) -> str:
+        return "pooled-ollama"
+
+    def _pool(self) -> OllamaPool:
+        return self.pool or get_ollama_pool()
+
+    def _client(self, endpoint: Endpoint):
+        client = self._clients.get(endpoint.url)
+        if client is None:
+            from langchain_ollama import OllamaLLM
+
+            client = OllamaLLM(model=self.model, base_url=endpoint.url, temperature=self.temperature)
+            self._clients[endpoint.url] = client
+        return client
+
+    def _call(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        return self._pool().call(
+            self.model, lambda endpoint: self._client(endpoint).invoke(prompt, stop=stop, **kwargs)
+        )
+
+    async def _acall(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        return await self._pool().acall(
+            self.model, lambda endpoint: self._client(endpoint).ainvoke(prompt, stop=stop, **kwargs)
+        )
+
+
+class PooledOllamaEmbeddings(BaseModel, Embeddings):
+    """OllamaEmbeddings that sends each call to an endpoint chosen by an OllamaPool."""
+
+    model: str
+    pool: Any = None
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    _clients: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _pool(self) -> OllamaPool:
+        return self.pool or get_ollama_pool()
+
+    def _client(self, endpoint: Endpoint):
+        client = self._clients.get(endpoint.url)
+        if client is None:
+            from langchain_ollama import OllamaEmbeddings
+
+            client = OllamaEmbeddings(model=self.model, base_url=endpoint.url)
+            self._clients[endpoint.url] = client
+        return client
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._pool().call(self.model, lambda endpoint: self._client(endpoint).embed_documents(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._pool().call(self.model, lambda endpoint: self._client(endpoint).embed_query(text))
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self._pool().acall(self.model, lambda endpoint: self._client(endpoint).aembed_documents(texts))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self._pool().acall(self.model, lambda endpoint: self._client(endpoint).aembed_query(text))
@@ -1,13 +1,12 @@
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from langchain.output_parsers import PydanticOutputParser
-from langchain_ollama import OllamaLLM
+from langchain_core.runnables import RunnableSequence
+
+from graph.chains.llm import get_llm
 
-llm = OllamaLLM(
-        base_url="http://ollama:11434",
-        model="smollm2",
-        temperature=0,
-    )
 
 
 class GradeDocuments(BaseModel):
@@ -30,4 +29,7 @@ grade_prompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-retrieval_grader = grade_prompt | llm | parser
+
+@lru_cache(maxsize=None)
+def get_retrieval_grader() -> RunnableSequence:
+    return grade_prompt | get_llm() | parser
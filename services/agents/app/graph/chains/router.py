@@ -1,9 +1,12 @@
+from functools import lru_cache
 from typing import Literal
 
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from langchain.output_parsers import PydanticOutputParser
-from langchain_ollama import OllamaLLM
+from langchain_core.runnables import RunnableSequence
+
+from graph.chains.llm import get_llm
 
 
 
@@ -17,11 +20,6 @@ class RouteQuery(BaseModel):
     )
 
 
-llm = OllamaLLM(
-        base_url="http://ollama:11434",
-        model="smollm2",
-        temperature=0,
-    )
 parser = PydanticOutputParser(pydantic_object=RouteQuery)
 
 system = """You are an expert at routing a user question to a vectorstore or web search.
@@ -34,4 +32,7 @@ route_prompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-question_router = route_prompt | llm | parser
+
+@lru_cache(maxsize=None)
+def get_question_router() -> RunnableSequence:
+    return route_prompt | get_llm() | parser
@@ -2,17 +2,13 @@ from dotenv import load_dotenv
 
 from langgraph.graph import END, StateGraph
 
-from graph.chains.answer_grader import answer_grader
-from graph.chains.hallucination_grader import hallucination_grader
-from graph.chains.router import question_router, RouteQuery
-from graph.node_constants import RETRIEVE, GRADE_DOCUMENTS, GENERATE, WEBSEARCH
-from graph.nodes import generate, grade_documents, retrieve, web_search
+from graph.chains.router import get_question_router, RouteQuery
+from graph.node_constants import RETRIEVE, GRADE_DOCUMENTS, GENERATE, WEBSEARCH, GRADE_GENERATION, RERANK
+from graph.nodes import generate, grade_documents, grade_generation, rerank, retrieve, web_search
 from graph.state import GraphState
 
 load_dotenv()
 
-print ("asdsadas")
-
 def decide_to_generate(state):
     print("---ASSESS GRADED DOCUMENTS---")
 
@@ -26,35 +22,15 @@ def decide_to_generate(state):
         return GENERATE
 
 
-def grade_generation_grounded_in_documents_and_question(state: GraphState) -> str:
-    print("---CHECK HALLUCINATIONS---")
-    question = state["question"]
-    documents = state["documents"]
-    generation = state["generation"]
-
-    score = hallucination_grader.invoke(
-        {"documents": documents, "generation": generation}
-    )
-
-    if hallucination_grade := score.binary_score:
-        print("---DECISION: GENERATION IS GROUNDED IN DOCUMENTS---")
-        print("---GRADE GENERATION vs QUESTION---")
-        score = answer_grader.invoke({"question": question, "generation": generation})
-        if answer_grade := score.binary_score:
-            print("---DECISION: GENERATION ADDRESSES QUESTION---")
-            return "useful"
-        else:
-            print("---DECISION: GENERATION DOES NOT ADDRESS QUESTION---")
-            return "not useful"
-    else:
-        print("---DECISION: GENERATION IS NOT GROUNDED IN DOCUMENTS, RE-TRY---")
-        return "not supported"
+def decide_after_grading(state: GraphState) -> str:
+    print("---ASSESS GRADED GENERATION---")
+    return state["generation_grade"]
 
 
 def route_question(state: GraphState) -> str:
     print("---ROUTE QUESTION---")
     question = state["question"]
-    source: RouteQuery = question_router.invoke({"question": question})
+    source: RouteQuery = get_question_router().invoke({"question": question})
     if source.datasource == WEBSEARCH:
         print("---ROUTE QUESTION TO WEB SEARCH---")
         return WEBSEARCH
@@ -64,15 +40,12 @@ def route_question(state: GraphState) -> str:
 
 
 workflow = StateGraph(GraphState)
-print(1)
 workflow.add_node(RETRIEVE, retrieve)
-print(2)
+workflow.add_node(RERANK, rerank)
 workflow.add_node(GRADE_DOCUMENTS, grade_documents)
-print(3)
 workflow.add_node(GENERATE, generate)
-print(4)
 workflow.add_node(WEBSEARCH, web_search)
-print(5)
+workflow.add_node(GRADE_GENERATION, grade_generation)
 
 workflow.set_conditional_entry_point(
     route_question,
@@ -81,7 +54,8 @@ workflow.set_conditional_entry_point(
         RETRIEVE: RETRIEVE,
     },
 )
-workflow.add_edge(RETRIEVE, GRADE_DOCUMENTS)
+workflow.add_edge(RETRIEVE, RERANK)
+workflow.add_edge(RERANK, GRADE_DOCUMENTS)
 workflow.add_conditional_edges(
     GRADE_DOCUMENTS,
     decide_to_generate,
@@ -91,9 +65,10 @@ workflow.add_conditional_edges(
     },
 )
 
+workflow.add_edge(GENERATE, GRADE_GENERATION)
 workflow.add_conditional_edges(
-    GENERATE,
-    grade_generation_grounded_in_documents_and_question,
+    GRADE_GENERATION,
+    decide_after_grading,
     {
         "not supported": GENERATE,
         "useful": END,
@@ -101,7 +76,6 @@ workflow.add_conditional_edges(
     },
 )
 workflow.add_edge(WEBSEARCH, GENERATE)
-workflow.add_edge(GENERATE, END)
 
 app = workflow.compile()
 
@@ -1,13 +1,17 @@
 from typing import Any, Dict
 
-from graph.chains.retrieval_grader import retrieval_grader
+from graph import budget
+from graph.chains.retrieval_grader import get_retrieval_grader
 from graph.state import GraphState
 
 
 def grade_documents(state: GraphState) -> Dict[str, Any]:
     """
     Determines whether the retrieved documents are relevant to the question
-    If any document is not relevant, we will set a flag to run web search
+    Documents the reranker already accepted are kept without an LLM grade,
+    the remaining ones are graded one by one
+    If any document is not relevant, we will set a flag to run web search,
+    unless the request is too close to its deadline to afford one
 
     Args:
         state (dict): The current graph state
@@ -20,10 +24,10 @@ def grade_documents(state: GraphState) -> Dict[str, Any]:
     question = state["question"]
     documents = state["documents"]
 
-    filtered_docs = []
-    web_search = False
+    filtered_docs = list(state.get("relevant_documents") or [])
+    web_search = bool(state.get("reranker_dropped"))
     for d in documents:
-        score = retrieval_grader.invoke(
+        score = get_retrieval_grader().invoke(
             {"question": question, "document": d.page_content}
         )
         grade = score.binary_score
@@ -34,4 +38,10 @@ def grade_documents(state: GraphState) -> Dict[str, Any]:
             print("---GRADE: DOCUMENT NOT RELEVANT---")
             web_search = True
             continue
-    return {"documents": filtered_docs, "question": question, "web_search": web_search}
+
+    update = {"documents": filtered_docs, "question": question, "web_search": web_search}
+    if web_search and budget.should_skip_web_search(state):
+        print("---DEGRADE: SKIP WEB SEARCH---")
+        update["web_search"] = False
+        update["degradations"] = [budget.SKIP_WEB_SEARCH]
+    return update
@@ -0,0 +1,81 @@
+from typing import Any, Dict
+
+from graph import budget
+from graph.chains.answer_grader import get_answer_grader
+from graph.chains.hallucination_grader import get_hallucination_grader
+from graph.state import GraphState
+
+
+def _finish(state: GraphState, update: Dict[str, Any], degradation: str) -> Dict[str, Any]:
+    """Stop the run and hand back the best generation seen so far."""
+    best = update.get("best_generation") or state.get("best_generation") or state["generation"]
+    return {
+        **update,
+        "generation": best,
+        "generation_grade": "useful",
+        "degradations": [degradation],
+    }
+
+
+def grade_generation(state: GraphState) -> Dict[str, Any]:
+    """
+    Grades the latest generation against the documents and the question,
+    degrading along the budget path when the deadline is close
+
+    Args:
+        state (dict): The current graph state
+
+    Returns:
+        state (dict): generation_grade verdict, best generation so far and
+        any degradations that fired
+    """
+
+    question = state["question"]
+    documents = state.get("documents") or []
+    generation = state["generation"]
+    out_of_attempts = state.get("generation_attempts", 0) >= budget.MAX_GENERATIONS
+
+    if budget.should_return_best(state):
+        print("---DEGRADE: DEADLINE CLOSE, RETURN BEST GENERATION---")
+        return _finish(state, {}, budget.RETURN_BEST_GENERATION)
+
+    print("---CHECK HALLUCINATIONS---")
+    score = get_hallucination_grader().invoke(
+        {"documents": documents, "generation": generation}
+    )
+
+    if not score.binary_score:
+        print("---DECISION: GENERATION IS NOT GROUNDED IN DOCUMENTS, RE-TRY---")
+        update: Dict[str, Any] = {}
+        if not state.get("best_generation"):
+            update = {"best_generation": generation, "best_generation_grounded": False}
+        if out_of_attempts:
+            print("---DEGRADE: MAX GENERATIONS REACHED, RETURN BEST GENERATION---")
+            return _finish(state, update, budget.MAX_GENERATIONS_REACHED)
+        return {**update, "generation_grade": "not supported"}
+
+    print("---DECISION: GENERATION IS GROUNDED IN DOCUMENTS---")
+    update = {"best_generation": generation, "best_generation_grounded": True}
+
+    if budget.should_skip_answer_grading(state):
+        print("---DEGRADE: SKIP ANSWER GRADING---")
+        return {
+            **update,
+            "generation_grade": "useful",
+            "degradations": [budget.SKIP_ANSWER_GRADING],
+        }
+
+    print("---GRADE GENERATION vs QUESTION---")
+    score = get_answer_grader().invoke({"question": question, "generation": generation})
+    if score.binary_score:
+        print("---DECISION: GENERATION ADDRESSES QUESTION---")
+        return {**update, "generation_grade": "useful"}
+
+    print("---DECISION: GENERATION DOES NOT ADDRESS QUESTION---")
+    if budget.should_skip_web_search(state):
+        print("---DEGRADE: SKIP WEB SEARCH, RETURN BEST GENERATION---")
+        return _finish(state, update, budget.SKIP_WEB_SEARCH)
+    if out_of_attempts:
+        print("---DEGRADE: MAX GENERATIONS REACHED, RETURN BEST GENERATION---")
+        return _finish(state, update, budget.MAX_GENERATIONS_REACHED)
+    return {**update, "generation_grade": "not useful"}
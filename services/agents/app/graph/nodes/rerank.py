@@ -0,0 +1,55 @@
+from typing import Any, Dict
+
+from graph.retrieval import rerank as reranker
+from graph.state import GraphState
+from ingestion import get_embedding
+
+
+def rerank(state: GraphState) -> Dict[str, Any]:
+    """
+    Scores retrieved documents with lexical and embedding similarity so that
+    only uncertain ones are sent to the LLM grader
+
+    Args:
+        state (dict): The current graph state
+
+    Returns:
+        state (dict): documents left for the LLM grader, documents accepted
+        without grading and a rerank_report with the LLM calls saved
+    """
+
+    print("---RERANK---")
+    question = state["question"]
+    documents = state.get("documents") or []
+
+    embedding = get_embedding()
+    result = reranker.rerank(question, documents, embedding.embed_query, embedding.embed_documents)
+
+    report = {
+        "thresholds": {
+            "accept": reranker.ACCEPT_THRESHOLD,
+            "reject": reranker.REJECT_THRESHOLD,
+            "max_llm_grades": reranker.MAX_LLM_GRADES,
+            "lexical_weight": reranker.LEXICAL_WEIGHT,
+        },
+        "candidates": len(documents),
+        "accepted": len(result.accepted),
+        "dropped": len(result.dropped),
+        # Uncertain documents beyond max_llm_grades: left out, but not counted as misses.
+        "ungraded": len(result.ungraded),
+        "sent_to_grader": len(result.uncertain),
+        "llm_calls_saved": len(documents) - len(result.uncertain),
+        "scores": result.scores,
+    }
+    print(
+        f"---RERANK: {report['candidates']} CANDIDATES, {report['accepted']} ACCEPTED, "
+        f"{report['dropped']} DROPPED, {report['ungraded']} UNGRADED, {report['sent_to_grader']} TO GRADER "
+        f"({report['llm_calls_saved']} LLM CALLS SAVED)---"
+    )
+    return {
+        "documents": result.uncertain,
+        "relevant_documents": result.accepted,
+        # Only clear misses call for web search; ungraded overflow does not.
+        "reranker_dropped": bool(result.dropped),
+        "rerank_report": report,
+    }
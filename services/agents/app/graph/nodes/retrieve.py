@@ -1,12 +1,12 @@
 from typing import Any, Dict
 
 from graph.state import GraphState
-from ingestion import retriever
+from ingestion import get_retriever
 
 
 def retrieve(state: GraphState) -> Dict[str, Any]:
     print("---RETRIEVE---")
     question = state["question"]
 
-    documents = retriever.invoke(question)
+    documents = get_retriever().invoke(question)
     return {"documents": documents, "question": question}
@@ -1,23 +1,29 @@
 from typing import Any, Dict
 
 from langchain.schema import Document
-from langchain_community.tools import DuckDuckGoSearchResults
+from graph import budget
 from graph.state import GraphState
+from graph.tools.web_search import get_web_search, results_to_text
 
 
-web_search_tool = DuckDuckGoSearchResults(k=1, output_format="list")
-
 def web_search(state: GraphState) -> Dict[str, Any]:
     print("---WEB SEARCH---")
     question = state["question"]
-    documents = state["documents"]
+    documents = state.get("documents")
+
+    if budget.should_skip_web_search(state):
+        print("---DEGRADE: SKIP WEB SEARCH---")
+        return {
+            "documents": documents or [],
+            "question": question,
+            "degradations": [budget.SKIP_WEB_SEARCH],
+        }
 
-    docs = web_search_tool.invoke({"query": question})
-    web_results = "".join(d["title"] for d in docs)
-    web_results = Document(page_content=web_results)
+    results = get_web_search().search(question)
+    web_results = Document(page_content=results_to_text(results))
     
     if documents is not None:
         documents.append(web_results)
     else:
         documents = [web_results]
-    return {"documents": documents, "question": question}
\ No newline at end of file
+    return {"documents": documents, "question": question}
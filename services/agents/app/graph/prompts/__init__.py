@@ -0,0 +1,3 @@
+from graph.prompts.registry import get_prompt, refresh_from_hub
+
+__all__ = ["get_prompt", "refresh_from_hub"]
@@ -0,0 +1,109 @@
+"""Local prompt registry.
+
+Prompts are vendored as versioned JSON files under this package
+(``<owner>/<name>/v<N>.json``) and compiled once per process. The hub is
+only contacted by the explicit refresh command:
+
+    python -m graph.prompts refresh rlm/rag-prompt
+"""
+import argparse
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+from langchain_core.prompts import (
+    AIMessagePromptTemplate,
+    ChatPromptTemplate,
+    HumanMessagePromptTemplate,
+    SystemMessagePromptTemplate,
+)
+
+PROMPTS_DIR = Path(__file__).parent
+
+_ROLES = {
+    HumanMessagePromptTemplate: "human",
+    AIMessagePromptTemplate: "ai",
+    SystemMessagePromptTemplate: "system",
+}
+
+
+def _prompt_dir(name: str) -> Path:
+    return PROMPTS_DIR.joinpath(*name.split("/"))
+
+
+def list_versions(name: str) -> List[int]:
+    return sorted(
+        int(path.stem[1:])
+        for path in _prompt_dir(name).glob("v*.json")
+        if path.stem[1:].isdigit()
+    )
+
+
+def load_prompt_spec(name: str, version: Optional[int] = None) -> dict:
+    versions = list_versions(name)
+    if not versions:
+        raise FileNotFoundError(f"No vendored prompt found for: {name}")
+    if version is None:
+        version = versions[-1]
+    elif version not in versions:
+        raise FileNotFoundError(f"Prompt {name} has no version {version}, available: {versions}")
+
+    with open(_prompt_dir(name) / f"v{version}.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def get_prompt(name: str, version: Optional[int] = None) -> ChatPromptTemplate:
+    """Return the compiled prompt, the latest vendored version by default."""
+    spec = load_prompt_spec(name, version)
+    return ChatPromptTemplate.from_messages([tuple(m) for m in spec["messages"]])
+
+
+def _messages_from_hub(name: str) -> List[List[str]]:
+    from langchain import hub
+
+    prompt = hub.pull(name)
+    messages = []
+    for message in prompt.messages:
+        role = _ROLES.get(type(message))
+        template = getattr(getattr(message, "prompt", None), "template", None)
+        if role is None or template is None:
+            raise ValueError(f"Unsupported message in hub prompt {name}: {message!r}")
+        messages.append([role, template])
+    return messages
+
+
+def refresh_from_hub(name: str) -> Path:
+    """Pull a prompt from the hub and vendor it as a new version if it changed."""
+    messages = _messages_from_hub(name)
+    versions = list_versions(name)
+    if versions and load_prompt_spec(name)["messages"] == messages:
+        return _prompt_dir(name) / f"v{versions[-1]}.json"
+
+    version = versions[-1] + 1 if versions else 1
+    path = _prompt_dir(name) / f"v{version}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    spec = {"name": name, "version": version, "source": "hub", "messages": messages}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(spec, f, indent=2)
+        f.write("\n")
+    get_prompt.cache_clear()
+    return path
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Manage vendored prompts.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    refresh = subparsers.add_parser("refresh", help="Pull prompts from the hub.")
+    refresh.add_argument("names", nargs="+")
+    show = subparsers.add_parser("show", help="Print a vendored prompt.")
+    show.add_argument("name")
+    show.add_argument("--version", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "refresh":
+        for name in args.names:
+            print(f"{name}: {refresh_from_hub(name)}")
+    elif args.command == "show":
+        print(json.dumps(load_prompt_spec(args.name, args.version), indent=2))
@@ -0,0 +1,5 @@
+from graph.retrieval.bm25 import BM25Index
+from graph.retrieval.fusion import reciprocal_rank_fusion
+from graph.retrieval.hybrid import HybridRetriever
+
+__all__ = ["BM25Index", "HybridRetriever", "reciprocal_rank_fusion"]
@@ -0,0 +1,96 @@
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from langchain_core.documents import Document
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to was what when where which who why with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed chunk set, kept as an in-memory inverted index."""
+
+    def __init__(self, documents: List[Document], k1: float = 1.5, b: float = 0.75):
+        self.documents = documents
+        self.k1 = k1
+        self.b = b
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+
+        for doc_id, doc in enumerate(documents):
+            term_counts = Counter(tokenize(doc.page_content))
+            self.doc_lengths.append(sum(term_counts.values()))
+            for term, tf in term_counts.items():
+                self.postings.setdefault(term, []).append((doc_id, tf))
+
+        self._finalize()
+
+    def _finalize(self):
+        n = len(self.documents)
+        self.avg_doc_length = (sum(self.doc_lengths) / n) if n else 0.0
+        self.idf = {
+            term: math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self.postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
+        scores: Dict[int, float] = {}
+        avg = self.avg_doc_length or 1.0
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf[term]
+            for doc_id, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:k]
+        return [(self.documents[doc_id], score) for doc_id, score in ranked]
+
+    def save(self, path: str):
+        data = {
+            "k1": self.k1,
+            "b": self.b,
+            "documents": [
+                {"page_content": d.page_content, "metadata": d.metadata} for d in self.documents
+            ],
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        index = cls.__new__(cls)
+        index.k1 = data["k1"]
+        index.b = data["b"]
+        index.documents = [Document(**d) for d in data["documents"]]
+        index.doc_lengths = data["doc_lengths"]
+        index.postings = {
+            term: [tuple(p) for p in postings] for term, postings in data["postings"].items()
+        }
+        index._finalize()
+        return index
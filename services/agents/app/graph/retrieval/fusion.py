@@ -0,0 +1,35 @@
+from typing import Dict, List, Optional, Sequence
+
+from langchain_core.documents import Document
+
+
+def _doc_key(doc: Document) -> str:
+    return doc.page_content
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[List[Document]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+    top_n: Optional[int] = None,
+) -> List[Document]:
+    """
+    Merge ranked document lists with reciprocal rank fusion
+
+    Each document scores sum(weight / (k + rank)) over the lists it appears
+    in; duplicates across lists are collapsed by page content.
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    docs: Dict[str, Document] = {}
+
+    for ranking, weight in zip(rankings, weights):
+        for rank, doc in enumerate(ranking, start=1):
+            key = _doc_key(doc)
+            docs.setdefault(key, doc)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+
+    fused = sorted(scores, key=scores.get, reverse=True)
+    if top_n is not None:
+        fused = fused[:top_n]
+    return [docs[key] for key in fused]
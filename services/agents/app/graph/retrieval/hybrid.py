@@ -0,0 +1,27 @@
+from typing import List
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from graph.retrieval.bm25 import BM25Index
+from graph.retrieval.fusion import reciprocal_rank_fusion
+
+
+class HybridRetriever(BaseRetriever):
+    """Dense + BM25 retrieval over the same chunk set, merged with reciprocal rank fusion."""
+
+    vector_retriever: BaseRetriever
+    bm25_index: BM25Index
+    fetch_k: int = 8
+    k: int = 4
+    rrf_k: int = 60
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        dense = self.vector_retriever.invoke(query)
+        sparse = [doc for doc, _ in self.bm25_index.search(query, k=self.fetch_k)]
+        return reciprocal_rank_fusion([dense, sparse], k=self.rrf_k, top_n=self.k)
@@ -0,0 +1,99 @@
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Callable, List, NamedTuple, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+from graph.retrieval.bm25 import tokenize
+
+# Combined score = LEXICAL_WEIGHT * query-term coverage + (1 - LEXICAL_WEIGHT) * cosine.
+LEXICAL_WEIGHT = float(os.environ.get("RERANK_LEXICAL_WEIGHT", "0.4"))
+# Scores at or above ACCEPT are kept without an LLM grade, below REJECT are dropped.
+ACCEPT_THRESHOLD = float(os.environ.get("RERANK_ACCEPT", "0.75"))
+REJECT_THRESHOLD = float(os.environ.get("RERANK_REJECT", "0.35"))
+# At most this many documents between the thresholds go on to the LLM grader; the
+# rest are left out without a verdict, so they never count as misses.
+MAX_LLM_GRADES = int(os.environ.get("RERANK_MAX_LLM_GRADES", "2"))
+
+EMBEDDING_CACHE_SIZE = 4096
+
+_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+
+class RerankResult(NamedTuple):
+    accepted: List[Document]
+    uncertain: List[Document]
+    dropped: List[Document]
+    ungraded: List[Document]
+    scores: List[float]
+
+
+def _content_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def embed_documents_cached(
+    texts: Sequence[str], embed_documents: Callable[[List[str]], List[List[float]]]
+) -> np.ndarray:
+    """Embed texts in one batch, reusing vectors already computed in this process."""
+    keys = [_content_key(t) for t in texts]
+    missing = [i for i, key in enumerate(keys) if key not in _embedding_cache]
+    if missing:
+        vectors = embed_documents([texts[i] for i in missing])
+        for i, vector in zip(missing, vectors):
+            _embedding_cache[keys[i]] = np.asarray(vector, dtype=np.float32)
+            if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+    return np.stack([_embedding_cache[key] for key in keys])
+
+
+def lexical_scores(question: str, texts: Sequence[str]) -> np.ndarray:
+    """Fraction of distinct question terms present in each text."""
+    terms = sorted(set(tokenize(question)))
+    if not terms:
+        return np.zeros(len(texts), dtype=np.float32)
+    term_index = {term: i for i, term in enumerate(terms)}
+    hits = np.zeros((len(texts), len(terms)), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for token in set(tokenize(text)):
+            column = term_index.get(token)
+            if column is not None:
+                hits[row, column] = 1.0
+    return hits.mean(axis=1)
+
+
+def cosine_scores(query_vector: Sequence[float], doc_vectors: np.ndarray) -> np.ndarray:
+    query = np.asarray(query_vector, dtype=np.float32)
+    query_norm = np.linalg.norm(query) or 1.0
+    doc_norms = np.linalg.norm(doc_vectors, axis=1)
+    doc_norms[doc_norms == 0] = 1.0
+    return (doc_vectors @ query) / (doc_norms * query_norm)
+
+
+def rerank(
+    question: str,
+    documents: List[Document],
+    embed_query: Callable[[str], List[float]],
+    embed_documents: Callable[[List[str]], List[List[float]]],
+) -> RerankResult:
+    if not documents:
+        return RerankResult([], [], [], [], [])
+
+    texts = [d.page_content for d in documents]
+    scores = LEXICAL_WEIGHT * lexical_scores(question, texts) + (1 - LEXICAL_WEIGHT) * cosine_scores(
+        embed_query(question), embed_documents_cached(texts, embed_documents)
+    )
+
+    accepted, uncertain, dropped, ungraded = [], [], [], []
+    for i in np.argsort(-scores, kind="stable"):
+        if scores[i] >= ACCEPT_THRESHOLD:
+            accepted.append(documents[i])
+        elif scores[i] < REJECT_THRESHOLD:
+            dropped.append(documents[i])
+        elif len(uncertain) < MAX_LLM_GRADES:
+            uncertain.append(documents[i])
+        else:
+            ungraded.append(documents[i])
+    return RerankResult(accepted, uncertain, dropped, ungraded, [float(s) for s in scores])
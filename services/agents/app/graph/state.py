@@ -1,7 +1,8 @@
-from typing import List, TypedDict
+import operator
+from typing import Annotated, Any, Dict, List, TypedDict
 
 
-class GraphState(TypedDict):
+class GraphState(TypedDict, total=False):
     """
     Represents the state of our graph.
 
@@ -10,9 +11,27 @@ class GraphState(TypedDict):
         generation: LLM generation
         web_search: whether to add search
         documents: list of documents
+        relevant_documents: documents the reranker accepted without an LLM grade
+        reranker_dropped: whether the reranker dropped any document as a clear miss
+        rerank_report: thresholds, per-document scores and LLM calls saved by the reranker
+        deadline: wall-clock time (time.time()) by which the run must finish
+        generation_attempts: number of times the generate node has run
+        best_generation: best generation seen so far, grounded ones preferred
+        best_generation_grounded: whether best_generation passed the hallucination grader
+        generation_grade: verdict of the last grade_generation run
+        degradations: degradations that fired during the run, in order
     """
 
     question: str
     generation: str
     web_search: bool
     documents: List[str]
+    relevant_documents: List[str]
+    reranker_dropped: bool
+    rerank_report: Dict[str, Any]
+    deadline: float
+    generation_attempts: int
+    best_generation: str
+    best_generation_grounded: bool
+    generation_grade: str
+    degradations: Annotated[List[str], operator.add]
@@ -0,0 +1,242 @@
+import asyncio
+import os
+from abc import ABC, abstractmethod
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+WEB_SEARCH_PROVIDER = os.environ.get("WEB_SEARCH_PROVIDER", "duckduckgo")
+WEB_SEARCH_K = int(os.environ.get("WEB_SEARCH_K", "3"))
+WEB_SEARCH_TTL = float(os.environ.get("WEB_SEARCH_TTL", "600"))
+WEB_SEARCH_CACHE_SIZE = int(os.environ.get("WEB_SEARCH_CACHE_SIZE", "512"))
+WEB_SEARCH_FETCH_PAGES = os.environ.get("WEB_SEARCH_FETCH_PAGES", "false").lower() == "true"
+WEB_SEARCH_FETCH_TIMEOUT = float(os.environ.get("WEB_SEARCH_FETCH_TIMEOUT", "5"))
+SNIPPET_CHARS = 500
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    title: str
+    link: str = ""
+    snippet: str = ""
+
+
+class SearchProvider(ABC):
+    """Returns the top-k results for a query; implementations may block."""
+
+    @abstractmethod
+    def search(self, query: str, k: int) -> List[SearchResult]:
+        ...
+
+
+class DuckDuckGoProvider(SearchProvider):
+    def __init__(self, tool=None):
+        if tool is None:
+            from langchain_community.tools import DuckDuckGoSearchResults
+
+            tool = DuckDuckGoSearchResults(output_format="list")
+        self._tool = tool
+
+    def search(self, query: str, k: int) -> List[SearchResult]:
+        # The tool's own result count is fixed at construction; ask its API wrapper for k directly.
+        docs = self._tool.api_wrapper.results(query, k, source=self._tool.backend)
+        return [
+            SearchResult(title=d.get("title", ""), link=d.get("link", ""), snippet=d.get("snippet", ""))
+            for d in docs[:k]
+        ]
+
+
+class StaticSearchProvider(SearchProvider):
+    """Local stand-in serving canned results, for tests and benchmarks."""
+
+    def __init__(self, results: Optional[Dict[str, List[SearchResult]]] = None, latency: float = 0.0):
+        self.results = results or {}
+        self.latency = latency
+        self.calls = 0
+
+    def search(self, query: str, k: int) -> List[SearchResult]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return list(self.results.get(normalize_query(query), []))[:k]
+
+
+PROVIDERS: Dict[str, Callable[[], SearchProvider]] = {
+    "duckduckgo": DuckDuckGoProvider,
+    "static": StaticSearchProvider,
+}
+
+
+def register_provider(name: str, factory: Callable[[], SearchProvider]):
+    PROVIDERS[name] = factory
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _page_text(html: str) -> str:
+    from bs4 import BeautifulSoup
+
+    return " ".join(BeautifulSoup(html, "html.parser").get_text(" ").split())
+
+
+async def fetch_snippets(results: List[SearchResult], timeout: float = WEB_SEARCH_FETCH_TIMEOUT) -> List[SearchResult]:
+    """Fetch the linked pages concurrently and use their text as snippets."""
+    import httpx
+
+    async def fetch(client, result: SearchResult) -> SearchResult:
+        if not result.link:
+            return result
+        try:
+            response = await client.get(result.link)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return result
+        text = _page_text(response.text)[:SNIPPET_CHARS]
+        return replace(result, snippet=text or result.snippet)
+
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        return list(await asyncio.gather(*(fetch(client, r) for r in results)))
+
+
+def _run_coroutine(coro):
+    """asyncio.run, also from a thread whose event loop is already running."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class WebSearch:
+    """
+    Web search with a TTL result cache keyed by normalized query and
+    coalescing of identical in-flight queries
+    """
+
+    def __init__(self, provider: SearchProvider, k: int = WEB_SEARCH_K, ttl: float = WEB_SEARCH_TTL,
+                 cache_size: int = WEB_SEARCH_CACHE_SIZE, fetch_pages: bool = WEB_SEARCH_FETCH_PAGES):
+        self.provider = provider
+        self.k = k
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self.fetch_pages = fetch_pages
+        self._cache: "OrderedDict[str, Tuple[float, List[SearchResult]]]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def _cached(self, key: str) -> Optional[List[SearchResult]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return results
+
+    def _store(self, key: str, results: List[SearchResult]):
+        self._cache[key] = (time.monotonic() + self.ttl, results)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _claim(self, key: str) -> Tuple[Optional[List[SearchResult]], Optional[Future], bool]:
+        """Return (cached results, in-flight future, whether the caller owns the fetch)."""
+        with self._lock:
+            cached = self._cached(key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached, None, False
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return None, future, False
+            future = Future()
+            self._in_flight[key] = future
+            self.stats["misses"] += 1
+            return None, future, True
+
+    def _resolve(self, key: str, future: Future, results: Optional[List[SearchResult]], error: Optional[BaseException]):
+        with self._lock:
+            if error is None:
+                self._store(key, results)
+            self._in_flight.pop(key, None)
+        if future.done():
+            return
+        if error is None:
+            future.set_result(results)
+        else:
+            future.set_exception(error)
+
+    def search(self, query: str) -> List[SearchResult]:
+        key = normalize_query(query)
+        cached, future, owner = self._claim(key)
+        if cached is not None:
+            return cached
+        if not owner:
+            return future.result()
+
+        try:
+            results = self.provider.search(query, self.k)
+            if self.fetch_pages and results:
+                results = _run_coroutine(fetch_snippets(results))
+        except BaseException as e:
+            # Also on cancellation or interrupt, so the key never stays in flight.
+            self._resolve(key, future, None, e)
+            raise
+        self._resolve(key, future, results, None)
+        return results
+
+    async def asearch(self, query: str) -> List[SearchResult]:
+        """Async variant sharing the cache; the provider runs in a worker thread."""
+        key = normalize_query(query)
+        cached, future, owner = self._claim(key)
+        if cached is not None:
+            return cached
+        if not owner:
+            # Shielded so a cancelled waiter does not cancel the shared fetch for the others.
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            results = await asyncio.to_thread(self.provider.search, query, self.k)
+            if self.fetch_pages and results:
+                results = await fetch_snippets(results)
+        except BaseException as e:
+            # Cancellation (e.g. by asyncio.wait_for) must release the key as well.
+            self._resolve(key, future, None, e)
+            raise
+        self._resolve(key, future, results, None)
+        return results
+
+
+_instance: Optional[WebSearch] = None
+_instance_lock = threading.Lock()
+
+
+def get_web_search() -> WebSearch:
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = WebSearch(PROVIDERS[WEB_SEARCH_PROVIDER]())
+        return _instance
+
+
+def set_web_search(web_search: Optional[WebSearch]):
+    """Swap the process-wide adapter, e.g. for a StaticSearchProvider in tests."""
+    global _instance
+    with _instance_lock:
+        _instance = web_search
+
+
+def results_to_text(results: List[SearchResult]) -> str:
+    return "\n".join(
+        f"{r.title}: {r.snippet}" if r.snippet else r.title for r in results
+    )
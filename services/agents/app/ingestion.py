@@ -1,8 +1,12 @@
+from functools import lru_cache
+import os
+from typing import List
+
 from dotenv import load_dotenv
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_community.vectorstores import Chroma
-from langchain_ollama import OllamaEmbeddings
+from langchain_core.documents import Document
+
+from graph.chains.llm import OLLAMA_BASE_URL, OLLAMA_BASE_URLS
+from graph.retrieval import BM25Index, HybridRetriever
 
 load_dotenv()
 
@@ -12,31 +16,97 @@ urls = [
     "https://lilianweng.github.io/posts/2023-10-25-adv-attack-llm/",
 ]
 
-docs = [WebBaseLoader(url).load() for url in urls]
+COLLECTION_NAME = "rag-chroma"
+PERSIST_DIRECTORY = "./.chroma"
+BM25_PATH = "./.bm25/index.json"
+
+HYBRID_FETCH_K = int(os.environ.get("HYBRID_FETCH_K", "8"))
+HYBRID_TOP_K = int(os.environ.get("HYBRID_TOP_K", "4"))
+RRF_K = int(os.environ.get("RRF_K", "60"))
+
+
+@lru_cache(maxsize=None)
+def get_embedding():
+    if OLLAMA_BASE_URLS:
+        from graph.chains.ollama_pool import PooledOllamaEmbeddings
+
+        return PooledOllamaEmbeddings(model="smollm2")
+    from langchain_ollama import OllamaEmbeddings
+
+    return OllamaEmbeddings(
+        model="smollm2",
+        base_url=OLLAMA_BASE_URL,
+    )
+
+
+def load_doc_splits() -> List[Document]:
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    from langchain_community.document_loaders import WebBaseLoader
+
+    docs = [WebBaseLoader(url).load() for url in urls]
+
+    docs_list = [item for sublist in docs for item in sublist]
+
+    text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=250, chunk_overlap=0
+    )
+    return text_splitter.split_documents(docs_list)
+
+
+def build_bm25_index(doc_splits: List[Document]) -> BM25Index:
+    bm25_index = BM25Index(doc_splits)
+    bm25_index.save(BM25_PATH)
+    return bm25_index
+
+
+def ingest():
+    from langchain_community.vectorstores import Chroma
+
+    doc_splits = load_doc_splits()
+    vectorstore = Chroma.from_documents(
+        documents=doc_splits,
+        collection_name=COLLECTION_NAME,
+        embedding=get_embedding(),
+        persist_directory=PERSIST_DIRECTORY,
+    )
+    build_bm25_index(doc_splits)
+    return vectorstore
+
+
+def load_bm25_index(vectorstore) -> BM25Index:
+    """Load the persisted BM25 index, rebuilding it from the Chroma chunks if missing."""
+    if os.path.exists(BM25_PATH):
+        return BM25Index.load(BM25_PATH)
 
-docs_list = [item for sublist in docs for item in sublist]
+    stored = vectorstore.get(include=["documents", "metadatas"])
+    doc_splits = [
+        Document(page_content=text, metadata=metadata or {})
+        for text, metadata in zip(stored["documents"], stored["metadatas"])
+    ]
+    return build_bm25_index(doc_splits)
 
-text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-    chunk_size=250, chunk_overlap=0
-)
-doc_splits = text_splitter.split_documents(docs_list)
 
-embedding = OllamaEmbeddings(
-    model="smollm2",
-    base_url="http://ollama:11434" 
-)
+@lru_cache(maxsize=None)
+def get_retriever():
+    """Open the persisted indexes on first use, ingesting them if they are empty."""
+    from langchain_community.vectorstores import Chroma
 
+    vectorstore = Chroma(
+        collection_name=COLLECTION_NAME,
+        persist_directory=PERSIST_DIRECTORY,
+        embedding_function=get_embedding(),
+    )
+    if not vectorstore.get(limit=1)["ids"]:
+        vectorstore = ingest()
 
-vectorstore = Chroma.from_documents(
-     documents=doc_splits,
-     collection_name="rag-chroma",
-     embedding=embedding,
-     persist_directory="./.chroma",
- )
+    return HybridRetriever(
+        vector_retriever=vectorstore.as_retriever(search_kwargs={"k": HYBRID_FETCH_K}),
+        bm25_index=load_bm25_index(vectorstore),
+        fetch_k=HYBRID_FETCH_K,
+        k=HYBRID_TOP_K,
+        rrf_k=RRF_K,
+    )
 
-retriever = Chroma(
-    collection_name="rag-chroma",
-    persist_directory="./.chroma",
-    embedding_function=embedding,
-).as_retriever()
 
+if __name__ == "__main__":
+    ingest()
@@ -2,7 +2,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+from graph.budget import initial_state
 from graph.graph import app
 
 if __name__ == "__main__":
-    print(app.invoke(input={"question": input("Enter your question: ")}))
+    result = app.invoke(input=initial_state(input("Enter your question: ")))
+    print(result)
+    print("DEGRADATIONS:", result.get("degradations", []))
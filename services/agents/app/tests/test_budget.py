@@ -0,0 +1,105 @@
+import sys
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import graph.nodes  # noqa: F401  (the package re-exports the node functions under the module names)
+from graph import budget
+
+grade_generation_node = sys.modules["graph.nodes.grade_generation"]
+
+
+def _state(seconds_left, **extra):
+    return {
+        "question": "What is RRF?",
+        "documents": [],
+        "generation": "latest answer",
+        "deadline": time.time() + seconds_left,
+        "generation_attempts": 1,
+        **extra,
+    }
+
+
+def _grader(binary_score):
+    grader = mock.Mock()
+    grader.invoke.return_value = SimpleNamespace(binary_score=binary_score)
+    return grader
+
+
+class TestBudget(unittest.TestCase):
+    def test_initial_state_sets_deadline(self):
+        state = budget.initial_state("q", budget_seconds=30)
+        self.assertAlmostEqual(budget.remaining(state), 30, delta=1)
+        self.assertEqual((state["generation_attempts"], state["degradations"]), (0, []))
+
+    def test_no_deadline_never_degrades(self):
+        state = {"question": "q"}
+        self.assertEqual(budget.remaining(state), float("inf"))
+        self.assertFalse(budget.should_skip_answer_grading(state))
+        self.assertFalse(budget.should_skip_web_search(state))
+        self.assertFalse(budget.should_return_best(state))
+
+    def test_degradation_order(self):
+        for seconds_left, expected in [
+            (budget.SKIP_ANSWER_GRADING_BELOW + 1, (False, False, False)),
+            (budget.SKIP_WEB_SEARCH_BELOW + 1, (True, False, False)),
+            (budget.RETURN_BEST_BELOW + 1, (True, True, False)),
+            (0, (True, True, True)),
+        ]:
+            state = _state(seconds_left)
+            self.assertEqual(
+                (budget.should_skip_answer_grading(state), budget.should_skip_web_search(state),
+                 budget.should_return_best(state)),
+                expected,
+            )
+
+
+class TestGradeGeneration(unittest.TestCase):
+    def _grade(self, state, grounded=True, useful=True):
+        hallucination, answer = _grader(grounded), _grader(useful)
+        with mock.patch.object(grade_generation_node, "get_hallucination_grader", return_value=hallucination), \
+                mock.patch.object(grade_generation_node, "get_answer_grader", return_value=answer):
+            update = grade_generation_node.grade_generation(state)
+        return update, hallucination, answer
+
+    def test_exhausted_budget_returns_best_without_grading(self):
+        update, hallucination, _ = self._grade(_state(0, best_generation="earlier answer"))
+        self.assertEqual(update["generation"], "earlier answer")
+        self.assertEqual(update["generation_grade"], "useful")
+        self.assertEqual(update["degradations"], [budget.RETURN_BEST_GENERATION])
+        hallucination.invoke.assert_not_called()
+
+    def test_low_budget_skips_answer_grading(self):
+        update, _, answer = self._grade(_state(budget.SKIP_WEB_SEARCH_BELOW + 1))
+        self.assertEqual(update["generation_grade"], "useful")
+        self.assertEqual(update["degradations"], [budget.SKIP_ANSWER_GRADING])
+        answer.invoke.assert_not_called()
+
+    def test_not_useful_with_no_time_for_web_search_returns_best(self):
+        state = _state(budget.RETURN_BEST_BELOW + 1)
+        with mock.patch.object(budget, "SKIP_ANSWER_GRADING_BELOW", 0):
+            update, _, _ = self._grade(state, useful=False)
+        self.assertEqual(update["generation"], "latest answer")
+        self.assertEqual(update["degradations"], [budget.SKIP_WEB_SEARCH])
+
+    def test_max_generations_returns_first_ungrounded_answer(self):
+        state = _state(60, generation_attempts=budget.MAX_GENERATIONS, best_generation="first answer")
+        update, _, _ = self._grade(state, grounded=False)
+        self.assertEqual(update["generation"], "first answer")
+        self.assertEqual(update["degradations"], [budget.MAX_GENERATIONS_REACHED])
+
+    def test_retries_while_budget_and_attempts_remain(self):
+        update, _, _ = self._grade(_state(60), grounded=False)
+        self.assertEqual(update, {"best_generation": "latest answer", "best_generation_grounded": False,
+                                  "generation_grade": "not supported"})
+        update, _, _ = self._grade(_state(60), useful=False)
+        self.assertEqual(update["generation_grade"], "not useful")
+        self.assertNotIn("degradations", update)
+
+
+if __name__ == '__main__':
+    unittest.main()
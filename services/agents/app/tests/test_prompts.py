@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from graph.prompts.registry import get_prompt, list_versions, load_prompt_spec
+
+
+class TestPromptRegistry(unittest.TestCase):
+    def test_vendored_rag_prompt_loads_without_hub(self):
+        self.assertTrue(list_versions("rlm/rag-prompt"))
+        prompt = get_prompt("rlm/rag-prompt")
+        self.assertEqual(set(prompt.input_variables), {"context", "question"})
+        self.assertIs(get_prompt("rlm/rag-prompt"), prompt)
+
+    def test_missing_prompt_or_version(self):
+        with self.assertRaises(FileNotFoundError):
+            load_prompt_spec("rlm/does-not-exist")
+        with self.assertRaises(FileNotFoundError):
+            load_prompt_spec("rlm/rag-prompt", version=999)
+
+
+class TestLazyChains(unittest.TestCase):
+    def test_building_the_graph_creates_no_llm_client(self):
+        # In a fresh interpreter, so chains built by other tests don't count.
+        code = "import graph.graph; from graph.chains.llm import get_llm; print(get_llm.cache_info().currsize)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "0")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain_core.documents import Document
+
+import graph.nodes  # noqa: F401  (the package re-exports the node functions under the module names)
+from graph.retrieval import rerank as reranker
+
+grade_documents_node = sys.modules["graph.nodes.grade_documents"]
+rerank_node = sys.modules["graph.nodes.rerank"]
+
+# Cosine similarity of each document to the query vector [1, 0].
+SIMILARITY = {"accept": 0.95, "grade one": 0.6, "grade two": 0.55, "overflow": 0.5, "miss": 0.1}
+
+
+def _vector(similarity):
+    return [similarity, math.sqrt(1 - similarity ** 2)]
+
+
+class StubEmbeddings:
+    def embed_query(self, text):
+        return [1.0, 0.0]
+
+    def embed_documents(self, texts):
+        return [_vector(SIMILARITY[t]) for t in texts]
+
+
+def _documents(*names):
+    return [Document(page_content=name) for name in names]
+
+
+THRESHOLDS = dict(LEXICAL_WEIGHT=0.0, ACCEPT_THRESHOLD=0.75, REJECT_THRESHOLD=0.35, MAX_LLM_GRADES=2)
+
+
+class TestRerank(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(reranker, **THRESHOLDS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _rerank(self, *names):
+        embeddings = StubEmbeddings()
+        return reranker.rerank("question", _documents(*names), embeddings.embed_query, embeddings.embed_documents)
+
+    def test_threshold_buckets(self):
+        result = self._rerank("miss", "grade one", "accept", "overflow", "grade two")
+        names = lambda docs: [d.page_content for d in docs]
+        self.assertEqual(names(result.accepted), ["accept"])
+        self.assertEqual(names(result.uncertain), ["grade one", "grade two"])
+        self.assertEqual(names(result.ungraded), ["overflow"])
+        self.assertEqual(names(result.dropped), ["miss"])
+
+    def test_lexical_weight_blends_term_coverage(self):
+        embeddings = StubEmbeddings()
+        with mock.patch.object(reranker, "LEXICAL_WEIGHT", 0.5):
+            result = reranker.rerank(
+                "overflow", _documents("overflow"), embeddings.embed_query, embeddings.embed_documents
+            )
+        # Half of the cosine (0.5) plus half of the term coverage (1.0) lands exactly on ACCEPT.
+        self.assertAlmostEqual(result.scores[0], 0.75, places=5)
+        self.assertEqual(len(result.accepted), 1)
+
+    @mock.patch.object(rerank_node, "get_embedding", return_value=StubEmbeddings())
+    def test_overflow_does_not_trigger_web_search(self, _):
+        update = rerank_node.rerank(
+            {"question": "question", "documents": _documents("accept", "grade one", "grade two", "overflow")}
+        )
+        self.assertFalse(update["reranker_dropped"])
+        self.assertEqual(update["rerank_report"]["ungraded"], 1)
+        self.assertEqual(update["rerank_report"]["dropped"], 0)
+
+        grader = mock.Mock()
+        grader.invoke.return_value = SimpleNamespace(binary_score="yes")
+        with mock.patch.object(grade_documents_node, "get_retrieval_grader", return_value=grader):
+            graded = grade_documents_node.grade_documents({"question": "question", **update})
+        self.assertFalse(graded["web_search"])
+        self.assertEqual(grader.invoke.call_count, 2)
+        self.assertEqual(len(graded["documents"]), 3)
+
+    @mock.patch.object(rerank_node, "get_embedding", return_value=StubEmbeddings())
+    def test_clear_miss_triggers_web_search(self, _):
+        update = rerank_node.rerank({"question": "question", "documents": _documents("accept", "miss")})
+        self.assertTrue(update["reranker_dropped"])
+        graded = grade_documents_node.grade_documents({"question": "question", **update})
+        self.assertTrue(graded["web_search"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain_core.documents import Document
+
+from graph.retrieval.bm25 import BM25Index, tokenize
+from graph.retrieval.fusion import reciprocal_rank_fusion
+
+DOCS = [
+    Document(page_content="Qdrant is a vector database for similarity search"),
+    Document(page_content="Docker containers package an application with its dependencies"),
+    Document(page_content="Vector search with vector indexes: HNSW graphs make vector search fast"),
+]
+
+
+def _contents(docs):
+    return [d.page_content for d in docs]
+
+
+class TestBM25(unittest.TestCase):
+    def test_tokenize_drops_stopwords(self):
+        self.assertEqual(tokenize("What is the Vector DB?"), ["vector", "db"])
+
+    def test_ranks_by_term_frequency_and_rarity(self):
+        index = BM25Index(DOCS)
+        results = index.search("vector search", k=3)
+        self.assertEqual(_contents(d for d, _ in results), [DOCS[2].page_content, DOCS[0].page_content])
+        self.assertGreater(results[0][1], results[1][1])
+        self.assertEqual(_contents(d for d, _ in index.search("docker")), [DOCS[1].page_content])
+        self.assertEqual(index.search("kubernetes"), [])
+
+    def test_score_matches_okapi_formula(self):
+        index = BM25Index(DOCS, k1=1.5, b=0.75)
+        (_, score), = index.search("docker", k=1)
+        tf, length = 1, index.doc_lengths[1]
+        idf = index.idf["docker"]
+        expected = idf * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * length / index.avg_doc_length))
+        self.assertAlmostEqual(score, expected)
+
+    def test_save_and_load_round_trip(self):
+        index = BM25Index(DOCS)
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "bm25.json")
+            index.save(path)
+            loaded = BM25Index.load(path)
+        self.assertEqual(loaded.search("vector search"), index.search("vector search"))
+
+
+class TestReciprocalRankFusion(unittest.TestCase):
+    def test_documents_in_both_lists_rise(self):
+        a, b, c = (Document(page_content=t) for t in "abc")
+        fused = reciprocal_rank_fusion([[a, b], [c, b]])
+        self.assertEqual(_contents(fused), ["b", "a", "c"])
+
+    def test_ties_keep_first_seen_order(self):
+        a, b, c, d = (Document(page_content=t) for t in "abcd")
+        # a and c both score 1/61, b and d both 1/62.
+        fused = reciprocal_rank_fusion([[a, b], [c, d]])
+        self.assertEqual(_contents(fused), ["a", "c", "b", "d"])
+
+    def test_weights_and_top_n(self):
+        a, b = Document(page_content="a"), Document(page_content="b")
+        fused = reciprocal_rank_fusion([[a, b], [b, a]], weights=[1.0, 2.0], top_n=1)
+        self.assertEqual(_contents(fused), ["b"])
+
+    def test_duplicates_collapse_by_content(self):
+        first = Document(page_content="same", metadata={"source": "dense"})
+        second = Document(page_content="same", metadata={"source": "bm25"})
+        fused = reciprocal_rank_fusion([[first], [second]])
+        self.assertEqual(len(fused), 1)
+        self.assertEqual(fused[0].metadata["source"], "dense")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 app = FastAPI()
 
 @app.get("/")
-def read_root():
-    return {"message": "Hello, World!"}
\ No newline at end of file
+def read_root(response: Response):
+    response.headers["Cache-Control"] = "max-age=60"
+    return {"message": "Hello, World!"}
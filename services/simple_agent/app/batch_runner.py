@@ -0,0 +1,152 @@
+"""
+Bulk question runner for the simple_agent graph.
+
+Reads questions from a JSONL file, runs them through the compiled graph with
+bounded concurrency and streams one JSON line per answer, including per-node
+timings. Re-running with the same output file skips questions that were
+already answered, so a crashed run resumes where it stopped:
+
+    python main.py --batch ../../../requests.jsonl --output answers.jsonl --concurrency 4
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+QUESTION_FIELDS = ("question", "body", "title")
+ID_FIELDS = ("id", "request_id")
+
+
+def _question_text(record: Dict[str, Any], question_field: Optional[str]) -> str:
+    if question_field:
+        return str(record[question_field])
+    if "question" in record:
+        return str(record["question"])
+    # requests.jsonl style records carry a title and a body
+    return "\n\n".join(str(record[f]) for f in ("title", "body") if record.get(f))
+
+
+def read_questions(path: str, question_field: Optional[str] = None,
+                   id_field: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """Yield (id, question) pairs from a JSONL file, skipping blank lines."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            fields = (id_field,) if id_field else ID_FIELDS
+            record_id = next((str(record[f]) for f in fields if f in record), str(line_number))
+            yield record_id, _question_text(record, question_field)
+
+
+def completed_ids(output_path: str) -> Set[str]:
+    """IDs already answered in a previous run; a torn last line is ignored."""
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("error") is None:
+                done.add(record["id"])
+    return done
+
+
+def _end_torn_line(output_path: str):
+    """Terminate a line cut short by a crash, so the next record starts on a line of its own."""
+    if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+        return
+    with open(output_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def _result_record(record_id: str, question: str, output: Any, elapsed_ms: float) -> Dict[str, Any]:
+    if isinstance(output, Exception):
+        return {"id": record_id, "question": question, "generation": None, "timings": {},
+                "total_ms": elapsed_ms, "error": f"{type(output).__name__}: {output}"}
+    return {
+        "id": record_id,
+        "question": question,
+        "generation": output.get("generation"),
+        "timings": output.get("timings", {}),
+        "total_ms": elapsed_ms,
+        "error": None,
+    }
+
+
+async def _prefetch_retrieval(questions: List[str]):
+    """Batch-search Qdrant for the whole batch so the retrieve node hits memory."""
+    from graph.ingestion.vector_db_ingestion import get_retriever
+
+    try:
+        await get_retriever().aprefetch(questions)
+    except Exception as e:
+        print(f"---BATCH: QDRANT PREFETCH FAILED, FALLING BACK TO PER-QUESTION SEARCH ({e})---")
+
+
+def _clear_prefetched():
+    """The retriever is a process-wide singleton: drop whatever this batch prefetched but never used."""
+    from graph.ingestion.vector_db_ingestion import get_retriever
+
+    try:
+        get_retriever().clear_prefetched()
+    except Exception as e:
+        print(f"---BATCH: COULD NOT CLEAR PREFETCHED RESULTS ({e})---")
+
+
+async def run_batch(input_path: str, output_path: str, concurrency: int = 4,
+                    question_field: Optional[str] = None, id_field: Optional[str] = None,
+                    prefetch: bool = True) -> Dict[str, int]:
+    from graph.graph import app
+
+    done = completed_ids(output_path)
+    pending = [(rid, q) for rid, q in read_questions(input_path, question_field, id_field) if rid not in done]
+    print(f"---BATCH: {len(done)} ALREADY ANSWERED, {len(pending)} TO RUN---")
+    if not pending:
+        return {"skipped": len(done), "answered": 0, "failed": 0}
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(record_id: str, question: str) -> Dict[str, Any]:
+        async with semaphore:
+            # Timed from when the question gets a slot, not from batch start.
+            started = time.perf_counter()
+            try:
+                output = await app.ainvoke({"question": question})
+            except Exception as e:
+                output = e
+            return _result_record(record_id, question, output, (time.perf_counter() - started) * 1000)
+
+    answered = failed = 0
+    try:
+        if prefetch:
+            await _prefetch_retrieval([q for _, q in pending])
+
+        _end_torn_line(output_path)
+        with open(output_path, "a", encoding="utf-8") as out:
+            for finished in asyncio.as_completed([run_one(rid, q) for rid, q in pending]):
+                record = await finished
+                out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+                if record["error"] is None:
+                    answered += 1
+                else:
+                    failed += 1
+    finally:
+        if prefetch:
+            _clear_prefetched()
+
+    return {"skipped": len(done), "answered": answered, "failed": failed}
+
+
+def main(input_path: str, output_path: str, concurrency: int = 4, question_field: Optional[str] = None,
+         id_field: Optional[str] = None, prefetch: bool = True):
+    stats = asyncio.run(run_batch(input_path, output_path, concurrency, question_field, id_field, prefetch))
+    print(f"---BATCH: {stats['answered']} ANSWERED, {stats['failed']} FAILED, {stats['skipped']} SKIPPED---")
@@ -1,63 +1,182 @@
-from typing import Any, List, Mapping, Optional
+import asyncio
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
 from langchain.llms.base import LLM
-from langchain.callbacks.manager import CallbackManagerForLLMRun
-from abacusai import ApiClient
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.outputs import Generation, LLMResult
 from pydantic import Field, PrivateAttr
-import os
 
-ABACUS_API_KEY=os.environ.get("ABACUS_API_KEY")
-if not ABACUS_API_KEY:
-    raise ValueError("ABACUS_API_KEY environment variable is not set.")
+TRANSIENT_HTTP_STATUSES = {408, 409, 425, 429, 500, 502, 503, 504}
+TRANSIENT_ERROR_NAMES = {
+    "ConnectionError",
+    "ConnectTimeout",
+    "ReadTimeout",
+    "Timeout",
+    "ThrottlingError",
+    "InternalServerError",
+    "GatewayTimeoutError",
+}
+
+# One ApiClient per API key, shared by every AbacusAILLM in the process.
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+class AbacusAIError(RuntimeError):
+    """Raised when an Abacus.AI call fails; transient is True if retries were exhausted."""
+
+    def __init__(self, message: str, transient: bool = False):
+        super().__init__(message)
+        self.transient = transient
+
 
-ABACUS_PROJECT_NAME=os.environ.get("ABACUS_PROJECT_NAME")
-if not ABACUS_PROJECT_NAME:
-    raise ValueError("ABACUS_PROJECT_NAME environment variable is not set.")
+def is_transient_error(error: Exception) -> bool:
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    status = getattr(error, "http_status", None) or getattr(error, "status_code", None)
+    if status in TRANSIENT_HTTP_STATUSES:
+        return True
+    return type(error).__name__ in TRANSIENT_ERROR_NAMES
 
-ABACUS_MODEL_ID=os.environ.get("ABACUS_MODEL_ID")
-if not ABACUS_MODEL_ID:
-    raise ValueError("ABACUS_MODEL_ID environment variable is not set.")
+
+def get_shared_client(api_key: str):
+    """Return the process-wide ApiClient for api_key, created on first use."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            from abacusai import ApiClient
+
+            client = ApiClient(api_key=api_key)
+            _clients[api_key] = client
+        return client
 
 
 class AbacusAILLM(LLM):
     """Wrapper around Abacus.AI large language models using official API client."""
 
-    api_key: str = Field(default=ABACUS_API_KEY, description="Abacus.AI API key", )
-    model_name: str = Field(default=ABACUS_MODEL_ID, description="Model name to use")
+    api_key: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("ABACUS_API_KEY"), description="Abacus.AI API key"
+    )
+    model_name: Optional[str] = Field(
+        default_factory=lambda: os.environ.get("ABACUS_MODEL_ID"), description="Model name to use"
+    )
     temperature: float = Field(default=0.0, description="Sampling temperature")
     max_tokens: int = Field(default=50, description="Maximum number of tokens to generate")
+    max_retries: int = Field(default=3, description="Retries for transient failures")
+    backoff_base: float = Field(default=0.5, description="Base delay in seconds for exponential backoff")
+    backoff_max: float = Field(default=8.0, description="Upper bound in seconds for a single backoff")
+    max_concurrency: int = Field(default=4, description="Parallel requests when generating a batch")
 
     # Private attributes
-    _client: ApiClient = ApiClient(api_key=ABACUS_API_KEY)
+    _client: Any = PrivateAttr(default=None)
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _sleep: Callable[[float], None] = PrivateAttr(default=time.sleep)
 
-    def __init__(self, **kwargs):
-        """Initialize the Abacus.AI LLM wrapper."""
+    def __init__(self, client: Any = None, **kwargs):
+        """Initialize the Abacus.AI LLM wrapper; the API client is created lazily."""
         super().__init__(**kwargs)
-        self._client = ApiClient(self.api_key)
+        self._client = client
 
     @property
     def _llm_type(self) -> str:
         """Return type of LLM."""
         return "abacus_ai"
 
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    if not self.api_key:
+                        raise ValueError("ABACUS_API_KEY environment variable is not set.")
+                    self._client = get_shared_client(self.api_key)
+        return self._client
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _evaluate(self, prompt: str, stop: Optional[List[str]]) -> str:
+        response = self.client.evaluate_prompt(
+            prompt=prompt,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stop_sequences=stop if stop else None
+        )
+        return response.content
+
     def _call(
         self,
         prompt: str,
         stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Execute the call to Abacus.AI, retrying transient failures."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._evaluate(prompt, stop)
+            except Exception as e:
+                transient = is_transient_error(e)
+                if not transient or attempt == self.max_retries:
+                    raise AbacusAIError(f"Error calling Abacus.AI API: {e}", transient=transient) from e
+                self._sleep(self._backoff(attempt))
+
+    async def _acall(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
         **kwargs: Any,
     ) -> str:
-        """Execute the call to Abacus.AI using the API client."""
-        try:
-            response = self._client.evaluate_prompt(
-                prompt=prompt,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                stop_sequences=stop if stop else None
-            )
+        """Async variant of _call; the blocking client runs in a worker thread."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await asyncio.to_thread(self._evaluate, prompt, stop)
+            except Exception as e:
+                transient = is_transient_error(e)
+                if not transient or attempt == self.max_retries:
+                    raise AbacusAIError(f"Error calling Abacus.AI API: {e}", transient=transient) from e
+                await asyncio.sleep(self._backoff(attempt))
+
+    def _generate(
+        self,
+        prompts: List[str],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        """Evaluate a batch of prompts concurrently over the shared client."""
+        if len(prompts) == 1:
+            texts = [self._call(prompts[0], stop=stop, **kwargs)]
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+                texts = list(executor.map(lambda p: self._call(p, stop=stop, **kwargs), prompts))
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
+
+    async def _agenerate(
+        self,
+        prompts: List[str],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
 
-            return response.content
+        async def one(prompt: str) -> str:
+            async with semaphore:
+                return await self._acall(prompt, stop=stop, **kwargs)
 
-        except Exception as e:
-            raise Exception(f"Error calling Abacus.AI API: {str(e)}")
+        texts = await asyncio.gather(*(one(p) for p in prompts))
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
 
     @property
     def _identifying_params(self) -> Mapping[str, Any]:
@@ -69,20 +188,19 @@ class AbacusAILLM(LLM):
         }
 
 # Example usage and utility functions
-def create_abacusai_chain(api_key: str):
+def create_abacusai_chain(api_key: Optional[str] = None):
     """Create an abacusai LangChain chain using AbacusAILLM.
 
     Args:
-        api_key (str): Your Abacus.AI API key
+        api_key (str): Your Abacus.AI API key, ABACUS_API_KEY by default
 
     Returns:
-        LLMChain: A configured LangChain chain
+        RunnableSequence: A configured LangChain chain
     """
-    from langchain.chains import LLMChain
     from langchain.prompts import PromptTemplate
 
     # Initialize the LLM
-    llm = AbacusAILLM(api_key=api_key)
+    llm = AbacusAILLM(api_key=api_key) if api_key else AbacusAILLM()
 
     # Create a prompt template
     template = """Question: {question}
@@ -96,23 +214,3 @@ def create_abacusai_chain(api_key: str):
 
     # Create and return the chain
     return prompt | llm
-
-
-"""def example_usage():
-
-    # Replace with your actual API key
-    API_KEY = ABACUS_API_KEY
-
-    # Basic LLM usage
-    llm = AbacusAILLM(api_key=API_KEY)
-    response = llm("Explain the concept of machine learning in simple terms.")
-    print("Basic LLM Response:", response)
-
-
-    # Using with LangChain chain
-    chain = create_abacusai_chain(API_KEY)
-    chain_response = chain.run("What is the significance of containerization in modern software development?")
-    print("\nChain Response:", chain_response)"""
-
-    
-abacus_chain = create_abacusai_chain(ABACUS_API_KEY)
\ No newline at end of file
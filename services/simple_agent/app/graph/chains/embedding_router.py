@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.runnables import RunnableLambda
+
+from graph.chains.router import RouteQuery
+
+# Below this cosine margin between the best and second-best route, ask the LLM router.
+ROUTER_MARGIN = float(os.environ.get("ROUTER_MARGIN", "0.05"))
+ROUTER_CACHE_SIZE = int(os.environ.get("ROUTER_CACHE_SIZE", "2048"))
+
+ROUTE_EXAMPLES: Dict[str, List[str]] = {
+    "vectorstore": [
+        "SCKS document about vector databases",
+        "What does the SCKS sheet say about Docker containers?",
+        "Python best practices for data engineering from our documents",
+        "Who is the author of the document on similarity search?",
+        "Which category and tags does this internal document have?",
+        "How long is the reading time of the DevOps article?",
+    ],
+    "websearch": [
+        "What is the weather in Istanbul today?",
+        "Latest news about the stock market",
+        "Who won the football match yesterday?",
+        "Who is the president of France?",
+        "What is the population of Tokyo?",
+        "Recent release notes of the newest Python version",
+    ],
+}
+
+
+def _normalize_question(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class EmbeddingRouter:
+    """Routes by cosine similarity to per-route centroids, falling back to the LLM on small margins."""
+
+    def __init__(self, embeddings, examples: Dict[str, List[str]] = ROUTE_EXAMPLES,
+                 margin: float = ROUTER_MARGIN, cache_size: int = ROUTER_CACHE_SIZE, fallback=None):
+        self.embeddings = embeddings
+        self.examples = examples
+        self.margin = margin
+        self.cache_size = cache_size
+        self.fallback = fallback
+        self.routes = list(examples)
+        self._centroids: Optional[np.ndarray] = None
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"decisions": 0, "cache_hits": 0, "fallbacks": 0, "fallback_errors": 0, "total_ms": 0.0}
+
+    @property
+    def centroids(self) -> np.ndarray:
+        if self._centroids is None:
+            rows = []
+            for route in self.routes:
+                vectors = np.asarray(self.embeddings.embed_documents(self.examples[route]), dtype=np.float32)
+                vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+                centroid = vectors.mean(axis=0)
+                rows.append(centroid / (np.linalg.norm(centroid) + 1e-12))
+            self._centroids = np.stack(rows)
+        return self._centroids
+
+    def similarities(self, question: str) -> np.ndarray:
+        query = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
+        query /= np.linalg.norm(query) + 1e-12
+        return self.centroids @ query
+
+    def _decide(self, question: str) -> Tuple[str, bool, bool]:
+        """Returns (datasource, used_fallback, fallback_failed)."""
+        scores = self.similarities(question)
+        order = np.argsort(-scores)
+        best = self.routes[order[0]]
+        margin = float(scores[order[0]] - scores[order[1]]) if len(order) > 1 else float("inf")
+        if margin >= self.margin or self.fallback is None:
+            return best, False, False
+        try:
+            return self.fallback(question), True, False
+        except Exception as e:
+            # A failing LLM router must not fail the request; the embedding route is still a fair guess.
+            print(f"---ROUTER: FALLBACK FAILED ({e!r}), USING {best}---")
+            return best, False, True
+
+    def route(self, question: str) -> str:
+        start = time.perf_counter()
+        key = _normalize_question(question)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        fallback_failed = False
+        if cached is not None:
+            datasource, used_fallback, cache_hit = cached, False, True
+        else:
+            datasource, used_fallback, fallback_failed = self._decide(question)
+            cache_hit = False
+            # Not cached after a fallback failure, so the question gets the LLM router next time.
+            if not fallback_failed:
+                with self._lock:
+                    self._cache[key] = datasource
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.stats["decisions"] += 1
+            self.stats["cache_hits"] += int(cache_hit)
+            self.stats["fallbacks"] += int(used_fallback)
+            self.stats["fallback_errors"] += int(fallback_failed)
+            self.stats["total_ms"] += elapsed_ms
+        print(f"---ROUTER: {datasource} ({elapsed_ms:.1f} ms, fallback={used_fallback}, cached={cache_hit})---")
+        return datasource
+
+    def report(self) -> Dict[str, float]:
+        with self._lock:
+            decisions = self.stats["decisions"] or 1
+            return {
+                **self.stats,
+                "avg_ms": self.stats["total_ms"] / decisions,
+                "fallback_rate": self.stats["fallbacks"] / decisions,
+                "cache_hit_rate": self.stats["cache_hits"] / decisions,
+            }
+
+
+def _llm_fallback(question: str) -> str:
+    from graph.chains.llm_router import get_question_router as get_llm_router
+
+    return get_llm_router().invoke({"question": question}).datasource
+
+
+@lru_cache(maxsize=None)
+def get_embedding_router() -> EmbeddingRouter:
+    from graph.ingestion.vector_db_ingestion import get_embeddings
+
+    return EmbeddingRouter(get_embeddings(), fallback=_llm_fallback)
+
+
+def route_function(question: dict) -> RouteQuery:
+    return RouteQuery(datasource=get_embedding_router().route(question["question"]))
+
+
+@lru_cache(maxsize=None)
+def get_question_router() -> RunnableLambda:
+    return RunnableLambda(route_function)
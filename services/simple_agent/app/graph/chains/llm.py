@@ -0,0 +1,34 @@
+import os
+from functools import lru_cache
+
+LOCAL_LLM = os.environ.get("LOCAL_LLM", "false")
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL")
+# Comma-separated Ollama servers to load-balance across; overrides OLLAMA_BASE_URL when set.
+OLLAMA_BASE_URLS = os.environ.get("OLLAMA_BASE_URLS")
+
+
+@lru_cache(maxsize=None)
+def get_ollama_llm(model: str = OLLAMA_MODEL, base_url: str = OLLAMA_BASE_URL):
+    """Return the shared OllamaLLM client for (model, base_url), or a pooled one when OLLAMA_BASE_URLS is set."""
+    if OLLAMA_BASE_URLS:
+        from graph.chains.ollama_pool import PooledOllamaLLM
+
+        return PooledOllamaLLM(model=model, temperature=0)
+    from langchain_ollama import OllamaLLM
+
+    return OllamaLLM(base_url=base_url, model=model, temperature=0)
+
+
+@lru_cache(maxsize=None)
+def get_abacus_llm():
+    """Return the shared AbacusAILLM client, created on first use."""
+    from graph.chains.abacus_ai_wrapper import AbacusAILLM
+
+    return AbacusAILLM()
+
+
+def get_llm():
+    if LOCAL_LLM.lower() == "true":
+        return get_ollama_llm()
+    return get_abacus_llm()
@@ -1,12 +1,12 @@
+from functools import lru_cache
 from typing import Literal
 
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from langchain.output_parsers import PydanticOutputParser
 from langchain_core.output_parsers import StrOutputParser
-from langchain_ollama import OllamaLLM
-from graph.chains.abacus_ai_wrapper import AbacusAILLM
-import os
+from langchain_core.runnables import Runnable
+from graph.chains.llm import get_abacus_llm
 import json
 
 
@@ -20,15 +20,6 @@ class RouteQuery(BaseModel):
     )
 
 
-"""llm = OllamaLLM(
-        base_url=os.environ.get("OLLAMA_BASE_URL"),
-        model=os.environ.get("OLLAMA_MODEL"),
-        temperature=0,
-    )"""
-
-llm = AbacusAILLM()
-
-
 def transform_output(text: str) -> str:
     cleaned_text = text.strip().lower()
     return json.dumps({"datasource": cleaned_text})
@@ -49,8 +40,8 @@ route_prompt = ChatPromptTemplate.from_messages(
     ]
 )
 
-llm_response= route_prompt | llm | (lambda x: transform_output(x))  # Convert to JSON format
-#print("llm_response", llm_response)
-llm_parsed_response = llm_response  | parser
-#print("llm_parsed_response", llm_parsed_response)
-question_router = llm_parsed_response
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def get_question_router() -> Runnable:
+    llm_response = route_prompt | get_abacus_llm() | (lambda x: transform_output(x))  # Convert to JSON format
+    return llm_response | parser
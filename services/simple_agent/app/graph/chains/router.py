@@ -32,4 +32,8 @@ def route_function(question: str) -> RouteQuery:
 route_runnable = RunnableLambda(route_function)
 
 
-question_router = route_runnable
\ No newline at end of file
+question_router = route_runnable
+
+
+def get_question_router() -> RunnableLambda:
+    return question_router
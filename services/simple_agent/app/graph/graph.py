@@ -8,17 +8,20 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 from langgraph.graph import END, StateGraph
 from graph.node_constants import GENERATE, WEBSEARCH, RETRIEVE, BYE
-from graph.nodes.generate import generate
-from graph.nodes.web_search import web_search
-from graph.nodes.retrieve import retrieve
+from graph.nodes.generate import generate, agenerate
+from graph.nodes.web_search import web_search, aweb_search
+from graph.nodes.retrieve import retrieve, aretrieve
 from graph.state import GraphState
+from graph.timing import timed
 
 
 ROUTER_TYPE = os.environ.get("ROUTER_TYPE")
 if ROUTER_TYPE == "LLM":
-    from graph.chains.llm_router import question_router, RouteQuery
+    from graph.chains.llm_router import get_question_router, RouteQuery
+elif ROUTER_TYPE == "EMBEDDING":
+    from graph.chains.embedding_router import get_question_router, RouteQuery
 else:
-    from graph.chains.router import question_router, RouteQuery
+    from graph.chains.router import get_question_router, RouteQuery
 
 
 load_dotenv()
@@ -34,7 +37,7 @@ def check_bye(state: GraphState) -> bool:
 def route_question(state: GraphState) -> str:
     print("---ROUTE QUESTION---")
     question = state["question"]
-    source: RouteQuery = question_router.invoke({"question": question})
+    source: RouteQuery = get_question_router().invoke({"question": question})
     if source.datasource == WEBSEARCH:
         print("---ROUTE QUESTION TO WEB SEARCH---")
         return WEBSEARCH
@@ -51,9 +54,9 @@ workflow.set_conditional_entry_point(
         BYE: END,
     },
 )
-workflow.add_node(RETRIEVE, retrieve) 
-workflow.add_node(GENERATE, generate) 
-workflow.add_node(WEBSEARCH, web_search)
+workflow.add_node(RETRIEVE, timed(RETRIEVE, retrieve, aretrieve))
+workflow.add_node(GENERATE, timed(GENERATE, generate, agenerate))
+workflow.add_node(WEBSEARCH, timed(WEBSEARCH, web_search, aweb_search))
 workflow.add_edge(WEBSEARCH, GENERATE)
 workflow.add_edge(RETRIEVE, GENERATE)
 workflow.add_edge(GENERATE, END)
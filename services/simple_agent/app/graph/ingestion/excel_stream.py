@@ -0,0 +1,113 @@
+import hashlib
+import os
+from datetime import date, datetime
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+# Approximate token budget per chunk; rows are never split across chunks.
+CHUNK_TOKEN_BUDGET = int(os.environ.get("EXCEL_CHUNK_TOKENS", "256"))
+# Chunks end after "anchor" rows picked by a hash of their content, so editing,
+# adding or removing a row only changes the chunks around it; re-ingestion
+# keeps the IDs of the rest. Anchors are spaced to give chunks of about
+# ANCHOR_FRACTION of the budget on average, and the budget still caps them.
+ANCHOR_FRACTION = 0.5
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value).strip()
+
+
+def render_row(header: Sequence[str], row: Sequence[Any]) -> Optional[str]:
+    fields = [
+        f"{name}: {_format_value(value)}"
+        for name, value in zip(header, row)
+        if value is not None and _format_value(value)
+    ]
+    return "; ".join(fields) if fields else None
+
+
+def _row_hash(line: str) -> int:
+    # hashlib rather than hash(), which is salted per process.
+    return int.from_bytes(hashlib.blake2b(line.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def is_anchor(line: str, token_budget: int) -> bool:
+    """Whether a chunk ends after this row; rows are anchors with probability line tokens / target tokens."""
+    target_tokens = max(1.0, token_budget * ANCHOR_FRACTION)
+    period = max(1, round(target_tokens / estimate_tokens(line)))
+    return _row_hash(line) % period == 0
+
+
+def iter_sheet_rows(path: str) -> Iterator[Tuple[str, int, List[str], Tuple[Any, ...]]]:
+    """Yield (sheet, row number, header, values) reading the workbook in read-only mode."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            header: Optional[List[str]] = None
+            for row_number, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+                if all(v is None for v in values):
+                    continue
+                if header is None:
+                    header = [
+                        _format_value(v) if v is not None else f"column_{i + 1}"
+                        for i, v in enumerate(values)
+                    ]
+                    continue
+                yield sheet.title, row_number, header, values
+    finally:
+        workbook.close()
+
+
+def iter_row_chunks(path: str, token_budget: int = CHUNK_TOKEN_BUDGET) -> Iterator[Document]:
+    """
+    Group consecutive rows of each sheet into Documents of at most token_budget
+    tokens, each starting with the sheet name as header context
+    Boundaries follow content anchors (see is_anchor) rather than filling each
+    chunk greedily, so an edited row does not shift every later boundary
+    """
+    source = os.path.basename(path)
+    sheet_name: Optional[str] = None
+    lines: List[str] = []
+    tokens = 0
+    first_row = last_row = 0
+
+    def flush() -> Document:
+        return Document(
+            page_content=f"Sheet: {sheet_name}\n" + "\n".join(lines),
+            metadata={
+                "source": source,
+                "page_name": sheet_name,
+                "row_start": first_row,
+                "row_end": last_row,
+            },
+        )
+
+    for sheet, row_number, header, values in iter_sheet_rows(path):
+        line = render_row(header, values)
+        if line is None:
+            continue
+        line_tokens = estimate_tokens(line)
+        if lines and (sheet != sheet_name or tokens + line_tokens > token_budget):
+            yield flush()
+            lines, tokens = [], 0
+        if not lines:
+            sheet_name, first_row = sheet, row_number
+        lines.append(line)
+        tokens += line_tokens
+        last_row = row_number
+        if is_anchor(line, token_budget):
+            yield flush()
+            lines, tokens = [], 0
+
+    if lines:
+        yield flush()
@@ -1,17 +1,251 @@
-import requests
+import asyncio
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
 
 LOCAL_API_ENDPOINT = os.environ.get("LOCAL_API_ENDPOINT")
+LOCAL_API_TIMEOUT = float(os.environ.get("LOCAL_API_TIMEOUT", "5"))
+LOCAL_API_POOL_SIZE = int(os.environ.get("LOCAL_API_POOL_SIZE", "10"))
+# Responses kept per client; the least recently used URL is evicted first.
+LOCAL_API_CACHE_SIZE = int(os.environ.get("LOCAL_API_CACHE_SIZE", "256"))
+
+
+class LocalApiError(Exception):
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class LocalApiResponse:
+    status: int
+    data: Any
+    from_cache: bool = False
+
+
+@dataclass
+class _CacheEntry:
+    data: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _cache_policy(headers: Mapping[str, str]) -> Tuple[bool, float]:
+    """Return (storable, ttl seconds) from Cache-Control / Expires response headers."""
+    directives = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return False, 0.0
+    if "no-cache" in directives:
+        return True, 0.0
+    if "max-age" in directives:
+        try:
+            return True, max(0.0, float(directives["max-age"]))
+        except ValueError:
+            return False, 0.0
+    if "expires" in headers:
+        try:
+            return True, max(0.0, parsedate_to_datetime(headers["expires"]).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return False, 0.0
+    # Without freshness info, keep validators only so the next call can revalidate.
+    storable = "etag" in headers or "last-modified" in headers
+    return storable, 0.0
+
+
+class _LocalApiBase:
+    def __init__(self, base_url: Optional[str] = None, timeout: float = LOCAL_API_TIMEOUT,
+                 cache_size: int = LOCAL_API_CACHE_SIZE):
+        self.base_url = (base_url or LOCAL_API_ENDPOINT or "").rstrip("/")
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "cache_hits": 0, "revalidated": 0, "coalesced": 0}
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _fresh(self, url: str) -> Optional[LocalApiResponse]:
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._cache.move_to_end(url)
+                self.stats["cache_hits"] += 1
+                return LocalApiResponse(status=200, data=entry.data, from_cache=True)
+        return None
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._cache.get(url)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _handle(self, url: str, status: int, headers: Mapping[str, str], body: Any) -> LocalApiResponse:
+        with self._lock:
+            self.stats["requests"] += 1
+            if status == 304 and url in self._cache:
+                entry = self._cache[url]
+                _, ttl = _cache_policy(headers)
+                entry.expires_at = time.monotonic() + ttl
+                self.stats["revalidated"] += 1
+                return LocalApiResponse(status=200, data=entry.data, from_cache=True)
+
+        if status != 200:
+            raise LocalApiError(f"Local API returned {status} for {url}", status=status)
+
+        try:
+            data = body()
+        except ValueError as e:
+            # requests' and httpx's JSON decode errors are both ValueErrors.
+            raise LocalApiError(f"Local API returned invalid JSON for {url}: {e}") from e
+        storable, ttl = _cache_policy(headers)
+        with self._lock:
+            if storable:
+                self._cache[url] = _CacheEntry(
+                    data=data,
+                    expires_at=time.monotonic() + ttl,
+                    etag=headers.get("etag"),
+                    last_modified=headers.get("last-modified"),
+                )
+                self._cache.move_to_end(url)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.pop(url, None)
+        return LocalApiResponse(status=status, data=data)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class LocalApiClient(_LocalApiBase):
+    """Client for the local_api service with pooled keep-alive connections, timeouts,
+    HTTP caching and coalescing of identical concurrent GETs."""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = LOCAL_API_TIMEOUT,
+                 pool_size: int = LOCAL_API_POOL_SIZE, cache_size: int = LOCAL_API_CACHE_SIZE):
+        super().__init__(base_url, timeout, cache_size)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._in_flight: Dict[str, Future] = {}
+
+    def get(self, endpoint: str = "/") -> LocalApiResponse:
+        url = self._url(endpoint)
+        cached = self._fresh(url)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            future = self._in_flight.get(url)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[url] = future
+            else:
+                self.stats["coalesced"] += 1
+        if not owner:
+            return future.result()
+
+        try:
+            try:
+                response = self.session.get(url, headers=self._conditional_headers(url), timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                raise LocalApiError(str(e)) from e
+            result = self._handle(url, response.status_code, response.headers, response.json)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(url, None)
+        future.set_result(result)
+        return result
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncLocalApiClient(_LocalApiBase):
+    """Async variant of LocalApiClient built on a pooled httpx.AsyncClient."""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = LOCAL_API_TIMEOUT,
+                 pool_size: int = LOCAL_API_POOL_SIZE, cache_size: int = LOCAL_API_CACHE_SIZE):
+        super().__init__(base_url, timeout, cache_size)
+        import httpx
+
+        self._httpx = httpx
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    async def _fetch(self, url: str) -> LocalApiResponse:
+        try:
+            response = await self.client.get(url, headers=self._conditional_headers(url))
+        except self._httpx.HTTPError as e:
+            raise LocalApiError(str(e)) from e
+        return self._handle(url, response.status_code, response.headers, response.json)
+
+    async def get(self, endpoint: str = "/") -> LocalApiResponse:
+        url = self._url(endpoint)
+        cached = self._fresh(url)
+        if cached is not None:
+            return cached
+
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+_client: Optional[LocalApiClient] = None
+_client_lock = threading.Lock()
+
+
+def get_local_api_client() -> LocalApiClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = LocalApiClient()
+        return _client
+
 
 def call_local_api(endpoint="/"):
     try:
-        full_endpoint = f"{LOCAL_API_ENDPOINT}{endpoint}"
-        response = requests.get(full_endpoint)
-        if response.status_code == 200:
-            return response.json()["message"]
-        else:
+        return get_local_api_client().get(endpoint).data["message"]
+    except LocalApiError as e:
+        if e.status is not None:
             return {"error": "Failed to fetch data from local API"}
-    except requests.exceptions.RequestException as e:
         return {"error": str(e)}
     
     
@@ -19,4 +253,4 @@ if __name__ == "__main__":
     # Example usage
     endpoint = "/"  # Replace with your desired endpoint
     result = call_local_api(endpoint)
-    print(result)
\ No newline at end of file
+    print(result)
@@ -0,0 +1,346 @@
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from pydantic import PrivateAttr
+
+QDRANT_HOST = os.environ.get("QDRANT_HOST")
+QDRANT_PORT = int(os.environ.get("QDRANT_PORT", "6333"))
+QDRANT_GRPC_PORT = int(os.environ.get("QDRANT_GRPC_PORT", "6334"))
+QDRANT_PREFER_GRPC = os.environ.get("QDRANT_PREFER_GRPC", "true").lower() == "true"
+# "server" talks to the qdrant container; "memory" and "disk" run Qdrant in-process.
+QDRANT_MODE = os.environ.get("QDRANT_MODE", "server").lower()
+QDRANT_PATH = os.environ.get("QDRANT_PATH", "./.qdrant")
+QUERY_EMBEDDING_CACHE_SIZE = int(os.environ.get("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+
+CONTENT_PAYLOAD_KEY = "page_content"
+METADATA_PAYLOAD_KEY = "metadata"
+
+
+EMBEDDED_MODES = ("memory", "disk")
+
+
+def is_embedded() -> bool:
+    return QDRANT_MODE in EMBEDDED_MODES
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    return {
+        "host": QDRANT_HOST,
+        "port": QDRANT_PORT,
+        "grpc_port": QDRANT_GRPC_PORT,
+        "prefer_grpc": QDRANT_PREFER_GRPC,
+    }
+
+
+class _LocalClient:
+    """
+    Serializes calls to an embedded QdrantClient
+
+    Local mode keeps the collection in this process and is not safe to call
+    from several threads at once, so every method call takes one lock.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return call
+
+
+class _AsyncLocalClient:
+    """
+    Async facade over the embedded client
+
+    An AsyncQdrantClient in local mode would hold a second, separate copy of
+    the data (and cannot open an on-disk path that is already locked), so
+    async callers share the sync client and run its calls in a worker thread.
+    """
+
+    def __init__(self, client: _LocalClient):
+        self._client = client
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call
+
+
+@lru_cache(maxsize=None)
+def _get_local_client() -> _LocalClient:
+    from qdrant_client import QdrantClient
+
+    if QDRANT_MODE == "memory":
+        return _LocalClient(QdrantClient(location=":memory:"))
+    return _LocalClient(QdrantClient(path=QDRANT_PATH))
+
+
+@lru_cache(maxsize=None)
+def get_qdrant_client():
+    """Return the process-wide QdrantClient; its channel is pooled and reused by every search."""
+    if is_embedded():
+        return _get_local_client()
+
+    from qdrant_client import QdrantClient
+
+    return QdrantClient(**_client_kwargs())
+
+
+@lru_cache(maxsize=None)
+def get_async_qdrant_client():
+    """Return the process-wide AsyncQdrantClient used by the async search path."""
+    if is_embedded():
+        return _AsyncLocalClient(_get_local_client())
+
+    from qdrant_client import AsyncQdrantClient
+
+    return AsyncQdrantClient(**_client_kwargs())
+
+
+def _normalize_query(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """Wraps an Embeddings model with an LRU cache over normalized query text."""
+
+    def __init__(self, embeddings: Embeddings, maxsize: int = QUERY_EMBEDDING_CACHE_SIZE):
+        self.embeddings = embeddings
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def _put(self, key: str, vector: List[float]):
+        with self._lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = _normalize_query(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self._put(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = _normalize_query(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(text)
+            self._put(key, vector)
+        return vector
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed many queries, sending all cache misses in a single batch."""
+        keys = [_normalize_query(t) for t in texts]
+        vectors = [self._get(key) for key in keys]
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            for i, vector in zip(missing, self.embeddings.embed_documents([texts[i] for i in missing])):
+                vectors[i] = vector
+                self._put(keys[i], vector)
+        return vectors
+
+    async def aembed_queries(self, texts: List[str]) -> List[List[float]]:
+        keys = [_normalize_query(t) for t in texts]
+        vectors = [self._get(key) for key in keys]
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            embedded = await self.embeddings.aembed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
+                self._put(keys[i], vector)
+        return vectors
+
+
+def _to_document(point) -> Document:
+    payload = point.payload or {}
+    metadata = dict(payload.get(METADATA_PAYLOAD_KEY) or {})
+    metadata["_id"] = point.id
+    metadata["_score"] = point.score
+    return Document(page_content=payload.get(CONTENT_PAYLOAD_KEY, ""), metadata=metadata)
+
+
+class QdrantRetriever(BaseRetriever):
+    """Searches a Qdrant collection directly, with sync and native async paths."""
+
+    collection_name: str
+    embeddings: Embeddings
+    k: int = 3
+    search_params: Optional[Dict[str, Any]] = None
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    _prefetched: Dict[str, List[Document]] = PrivateAttr(default_factory=dict)
+
+    def _search_params(self):
+        if not self.search_params:
+            return None
+        from qdrant_client import models
+
+        return models.SearchParams(**self.search_params)
+
+    def _query_kwargs(self, vector: List[float]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "collection_name": self.collection_name,
+            "query": vector,
+            "limit": self.k,
+            "with_payload": True,
+        }
+        search_params = self._search_params()
+        if search_params is not None:
+            kwargs["search_params"] = search_params
+        return kwargs
+
+    def _batch_requests(self, vectors: List[List[float]]) -> List[Any]:
+        from qdrant_client import models
+
+        return [
+            models.QueryRequest(query=vector, limit=self.k, with_payload=True, params=self._search_params())
+            for vector in vectors
+        ]
+
+    def search_batch(self, queries: List[str]) -> List[List[Document]]:
+        """Search many queries with one batched embedding call and one Qdrant batch request."""
+        if not queries:
+            return []
+        responses = get_qdrant_client().query_batch_points(
+            collection_name=self.collection_name,
+            requests=self._batch_requests(_embed_queries(self.embeddings, queries)),
+        )
+        return [[_to_document(point) for point in response.points] for response in responses]
+
+    async def asearch_batch(self, queries: List[str]) -> List[List[Document]]:
+        if not queries:
+            return []
+        responses = await get_async_qdrant_client().query_batch_points(
+            collection_name=self.collection_name,
+            requests=self._batch_requests(await _aembed_queries(self.embeddings, queries)),
+        )
+        return [[_to_document(point) for point in response.points] for response in responses]
+
+    def prefetch(self, queries: List[str]):
+        """Batch-search queries now; later invoke/ainvoke calls for them are served from memory."""
+        for query, documents in zip(queries, self.search_batch(queries)):
+            self._prefetched[_normalize_query(query)] = documents
+
+    async def aprefetch(self, queries: List[str]):
+        for query, documents in zip(queries, await self.asearch_batch(queries)):
+            self._prefetched[_normalize_query(query)] = documents
+
+    def clear_prefetched(self):
+        """Drop prefetched results never asked for, e.g. for questions routed to web search."""
+        self._prefetched.clear()
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        prefetched = self._prefetched.pop(_normalize_query(query), None)
+        if prefetched is not None:
+            return prefetched
+        vector = self.embeddings.embed_query(query)
+        response = get_qdrant_client().query_points(**self._query_kwargs(vector))
+        return [_to_document(point) for point in response.points]
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        prefetched = self._prefetched.pop(_normalize_query(query), None)
+        if prefetched is not None:
+            return prefetched
+        vector = await self.embeddings.aembed_query(query)
+        response = await get_async_qdrant_client().query_points(**self._query_kwargs(vector))
+        return [_to_document(point) for point in response.points]
+
+
+def _embed_queries(embeddings: Embeddings, queries: List[str]) -> List[List[float]]:
+    if isinstance(embeddings, CachedQueryEmbeddings):
+        return embeddings.embed_queries(queries)
+    return embeddings.embed_documents(queries)
+
+
+async def _aembed_queries(embeddings: Embeddings, queries: List[str]) -> List[List[float]]:
+    if isinstance(embeddings, CachedQueryEmbeddings):
+        return await embeddings.aembed_queries(queries)
+    return await embeddings.aembed_documents(queries)
+
+if __name__ == "__main__":
+    # Example usage: python -m graph.ingestion.qdrant_retriever "question" --concurrency 8
+    import argparse
+    import asyncio
+    import time
+
+    from graph.ingestion.vector_db_ingestion import get_retriever
+
+    parser = argparse.ArgumentParser(description="Measure SCKS retrieval latency.")
+    parser.add_argument("question")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    retriever = get_retriever()
+
+    async def run():
+        latencies = []
+
+        async def one():
+            start = time.perf_counter()
+            await retriever.ainvoke(args.question)
+            latencies.append(time.perf_counter() - start)
+
+        for _ in range(args.rounds):
+            await asyncio.gather(*(one() for _ in range(args.concurrency)))
+        return sorted(latencies)
+
+    latencies = asyncio.run(run())
+    if is_embedded():
+        print(f"transport: embedded ({QDRANT_MODE})")
+    else:
+        print(f"transport: {'grpc' if QDRANT_PREFER_GRPC else 'rest'}")
+    print(f"requests: {len(latencies)}, concurrency: {args.concurrency}")
+    print(f"p50: {latencies[len(latencies) // 2] * 1000:.1f} ms")
+    print(f"p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms")
+    print(f"query embedding cache hits: {retriever.embeddings.hits}, misses: {retriever.embeddings.misses}")
@@ -1,24 +1,70 @@
-from langchain_qdrant import QdrantVectorStore
-from qdrant_client import QdrantClient
-from langchain_ollama import OllamaEmbeddings
+from functools import lru_cache
 import os
 
-qdrant = QdrantClient(
-    host=os.environ.get("QDRANT_HOST"),
-    port=int(os.environ.get("QDRANT_PORT"))
+from graph.ingestion.qdrant_retriever import (
+    CachedQueryEmbeddings,
+    QDRANT_MODE,
+    QdrantRetriever,
+    get_qdrant_client,
+    is_embedded,
 )
 
-embeddings = OllamaEmbeddings(
-        model=os.environ.get("OLLAMA_MODEL"),
-        base_url=os.environ.get("OLLAMA_BASE_URL"), 
+COLLECTION_NAME = "SCKS"
+RETRIEVER_K = int(os.environ.get("RETRIEVER_K", "3"))
+
+
+@lru_cache(maxsize=None)
+def get_embeddings():
+    if os.environ.get("OLLAMA_BASE_URLS"):
+        from graph.chains.ollama_pool import PooledOllamaEmbeddings
+
+        # Spread embedding calls over the same Ollama servers as the LLM.
+        return CachedQueryEmbeddings(PooledOllamaEmbeddings(model=os.environ.get("OLLAMA_MODEL")))
+    from langchain_ollama import OllamaEmbeddings
+
+    return CachedQueryEmbeddings(
+        OllamaEmbeddings(
+            model=os.environ.get("OLLAMA_MODEL"),
+            base_url=os.environ.get("OLLAMA_BASE_URL"), 
+        )
     )
 
-vector_store = QdrantVectorStore(
-    client=qdrant,
-    collection_name="SCKS",
-    embedding=embeddings,
-)
 
-retriever = vector_store.as_retriever(
-    search_kwargs={"k": 3}  # Number of results to return
-)
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_vector_store():
+    from langchain_qdrant import QdrantVectorStore
+
+    return QdrantVectorStore(
+        client=get_qdrant_client(),
+        collection_name=COLLECTION_NAME,
+        embedding=get_embeddings(),
+    )
+
+
+def ensure_embedded_collection():
+    """
+    Seed the SCKS collection when Qdrant runs in-process and it is missing
+
+    A ":memory:" store starts empty on every run and a fresh on-disk path
+    has never been set up, so there is no separate setup step to rely on.
+    """
+    if not is_embedded() or get_qdrant_client().collection_exists(COLLECTION_NAME):
+        return
+    from graph.setup.setup_sample_db import load_documents, sync_collection
+
+    print(f"---QDRANT ({QDRANT_MODE.upper()}): SEEDING {COLLECTION_NAME}---")
+    sync_collection(load_documents())
+
+
+@lru_cache(maxsize=None)
+def get_retriever():
+    from graph.setup.collection_profiles import get_profile, search_params
+
+    ensure_embedded_collection()
+    return QdrantRetriever(
+        collection_name=COLLECTION_NAME,
+        embeddings=get_embeddings(),
+        k=RETRIEVER_K,  # Number of results to return
+        # Local mode always searches exactly and warns about index parameters.
+        search_params=None if is_embedded() else search_params(get_profile()),
+    )
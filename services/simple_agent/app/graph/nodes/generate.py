@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-from graph.chains.generation import generation_chain
+from graph.chains.generation import get_generation_chain
 from graph.state import GraphState
 
 
@@ -9,5 +9,14 @@ def generate(state: GraphState) -> Dict[str, Any]:
     question = state["question"]
     documents = state["documents"]
 
-    generation = generation_chain.invoke({"context": documents, "question": question})
+    generation = get_generation_chain().invoke({"context": documents, "question": question})
+    return {"documents": documents, "question": question, "generation": generation}
+
+
+async def agenerate(state: GraphState) -> Dict[str, Any]:
+    print("---GENERATE---")
+    question = state["question"]
+    documents = state["documents"]
+
+    generation = await get_generation_chain().ainvoke({"context": documents, "question": question})
     return {"documents": documents, "question": question, "generation": generation}
@@ -1,12 +1,20 @@
 from typing import Any, Dict
 
 from graph.state import GraphState
-from graph.ingestion.vector_db_ingestion import retriever
+from graph.ingestion.vector_db_ingestion import get_retriever
 
 
 def retrieve(state: GraphState) -> Dict[str, Any]:
     print("---RETRIEVE---")
     question = state["question"]
 
-    documents = retriever.invoke(question)
+    documents = get_retriever().invoke(question)
+    return {"documents": documents, "question": question}
+
+
+async def aretrieve(state: GraphState) -> Dict[str, Any]:
+    print("---RETRIEVE---")
+    question = state["question"]
+
+    documents = await get_retriever().ainvoke(question)
     return {"documents": documents, "question": question}
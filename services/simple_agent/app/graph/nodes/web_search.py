@@ -1,19 +1,27 @@
 from typing import Any, Dict
 
 from langchain.schema import Document
-from langchain_community.tools import DuckDuckGoSearchResults
 from graph.state import GraphState
+from graph.tools.web_search import get_web_search, results_to_text
 
 
-web_search_tool = DuckDuckGoSearchResults(k=1, output_format="list")
-
 def web_search(state: GraphState) -> Dict[str, Any]:
     print("---WEB SEARCH---")
     question = state["question"]
 
-    docs = web_search_tool.invoke({"query": question})
-    web_results = "".join(d["title"] for d in docs)
-    web_results = Document(page_content=web_results)
+    results = get_web_search().search(question)
+    web_results = Document(page_content=results_to_text(results))
     
     documents = [web_results]
-    return {"documents": documents, "question": question}
\ No newline at end of file
+    return {"documents": documents, "question": question}
+
+
+async def aweb_search(state: GraphState) -> Dict[str, Any]:
+    print("---WEB SEARCH---")
+    question = state["question"]
+
+    results = await get_web_search().asearch(question)
+    web_results = Document(page_content=results_to_text(results))
+
+    documents = [web_results]
+    return {"documents": documents, "question": question}
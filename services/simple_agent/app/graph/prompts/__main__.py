@@ -0,0 +1,3 @@
+from graph.prompts.registry import main
+
+main()
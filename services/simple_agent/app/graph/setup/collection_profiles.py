@@ -0,0 +1,169 @@
+"""
+Storage and index profiles for the SCKS collection
+
+A profile fixes how the collection is stored (quantization, on-disk vectors
+and payload, HNSW graph shape) and how it is searched (`hnsw_ef`, rescoring).
+Pick one with COLLECTION_PROFILE; compare them with
+`python -m graph.setup.profile_sweep`.
+"""
+import os
+from typing import Any, Dict, NamedTuple, Optional
+
+from qdrant_client import models
+
+COLLECTION_PROFILE = os.environ.get("COLLECTION_PROFILE", "default")
+
+
+class CollectionProfile(NamedTuple):
+    name: str
+    description: str
+    # Build time
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    quantization: Optional[str] = None  # None, "scalar", "product" or "binary"
+    product_compression: str = "x16"
+    quantized_always_ram: bool = True
+    on_disk_vectors: bool = False
+    on_disk_payload: bool = False
+    # In KB. SCKS is far below Qdrant's default threshold, which would leave it unindexed;
+    # 0 would disable indexing altogether.
+    indexing_threshold: int = 1
+    # Search time
+    hnsw_ef: Optional[int] = None
+    rescore: bool = True
+    oversampling: Optional[float] = None
+
+
+PROFILES: Dict[str, CollectionProfile] = {
+    profile.name: profile
+    for profile in (
+        CollectionProfile("default", "float32 vectors in RAM, HNSW m=16"),
+        CollectionProfile(
+            "fast",
+            "smaller HNSW graph and search beam; lowest latency, some recall loss",
+            hnsw_m=8, hnsw_ef_construct=64, hnsw_ef=32,
+        ),
+        CollectionProfile(
+            "accurate",
+            "denser HNSW graph and wider search beam",
+            hnsw_m=32, hnsw_ef_construct=256, hnsw_ef=128,
+        ),
+        CollectionProfile(
+            "scalar",
+            "int8 quantized vectors in RAM, rescored against float32 originals",
+            quantization="scalar", oversampling=2.0,
+        ),
+        CollectionProfile(
+            "scalar-disk",
+            "int8 quantized vectors in RAM, originals and payload on disk",
+            quantization="scalar", on_disk_vectors=True, on_disk_payload=True, oversampling=2.0,
+        ),
+        CollectionProfile(
+            "product",
+            "product quantization (x16) in RAM, originals on disk; smallest footprint",
+            quantization="product", on_disk_vectors=True, on_disk_payload=True, oversampling=3.0,
+        ),
+        CollectionProfile(
+            "binary",
+            "1-bit quantization in RAM, originals on disk; needs high oversampling",
+            quantization="binary", on_disk_vectors=True, on_disk_payload=True, oversampling=4.0,
+        ),
+    )
+}
+
+
+def get_profile(name: Optional[str] = None) -> CollectionProfile:
+    name = name or COLLECTION_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown collection profile {name!r}, expected one of {sorted(PROFILES)}")
+    return PROFILES[name]
+
+
+def quantization_config(profile: CollectionProfile):
+    if profile.quantization is None:
+        return None
+    if profile.quantization == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8, quantile=0.99, always_ram=profile.quantized_always_ram
+            )
+        )
+    if profile.quantization == "product":
+        return models.ProductQuantization(
+            product=models.ProductQuantizationConfig(
+                compression=models.CompressionRatio(profile.product_compression),
+                always_ram=profile.quantized_always_ram,
+            )
+        )
+    if profile.quantization == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=profile.quantized_always_ram)
+        )
+    raise ValueError(f"Unknown quantization {profile.quantization!r}")
+
+
+def collection_kwargs(profile: CollectionProfile, vector_size: int) -> Dict[str, Any]:
+    """Keyword arguments for `create_collection` under this profile."""
+    return {
+        "vectors_config": models.VectorParams(
+            size=vector_size, distance=models.Distance.COSINE, on_disk=profile.on_disk_vectors
+        ),
+        "hnsw_config": models.HnswConfigDiff(m=profile.hnsw_m, ef_construct=profile.hnsw_ef_construct),
+        "quantization_config": quantization_config(profile),
+        "on_disk_payload": profile.on_disk_payload,
+        "optimizers_config": models.OptimizersConfigDiff(indexing_threshold=profile.indexing_threshold),
+    }
+
+
+def update_kwargs(profile: CollectionProfile) -> Dict[str, Any]:
+    """Keyword arguments for `update_collection` to move an existing collection to this profile."""
+    return {
+        "vectors_config": {"": models.VectorParamsDiff(on_disk=profile.on_disk_vectors)},
+        "hnsw_config": models.HnswConfigDiff(m=profile.hnsw_m, ef_construct=profile.hnsw_ef_construct),
+        "quantization_config": quantization_config(profile) or models.Disabled.DISABLED,
+        "collection_params": models.CollectionParamsDiff(on_disk_payload=profile.on_disk_payload),
+        "optimizers_config": models.OptimizersConfigDiff(indexing_threshold=profile.indexing_threshold),
+    }
+
+
+def search_params(profile: CollectionProfile) -> Optional[Dict[str, Any]]:
+    """`models.SearchParams` fields for the retriever, or None for server defaults."""
+    params: Dict[str, Any] = {}
+    if profile.hnsw_ef is not None:
+        params["hnsw_ef"] = profile.hnsw_ef
+    if profile.quantization is not None:
+        params["quantization"] = models.QuantizationSearchParams(
+            rescore=profile.rescore, oversampling=profile.oversampling
+        )
+    return params or None
+
+
+def estimate_memory(profile: CollectionProfile, points: int, vector_size: int) -> Dict[str, int]:
+    """
+    Rough RAM and disk footprint in bytes, following Qdrant's sizing guide
+
+    Qdrant exposes no per-collection memory figure, so this counts vectors,
+    quantized codes and HNSW links (payload is excluded).
+    """
+    original = points * vector_size * 4
+    if profile.quantization == "scalar":
+        quantized = points * vector_size
+    elif profile.quantization == "product":
+        quantized = original // int(profile.product_compression.lstrip("x"))
+    elif profile.quantization == "binary":
+        quantized = points * ((vector_size + 7) // 8)
+    else:
+        quantized = 0
+    links = points * profile.hnsw_m * 2 * 4
+
+    ram = links
+    disk = 0
+    if profile.on_disk_vectors:
+        disk += original
+    else:
+        ram += original
+    if profile.quantized_always_ram or not profile.on_disk_vectors:
+        ram += quantized
+    else:
+        disk += quantized
+    return {"ram_bytes": ram, "disk_bytes": disk}
@@ -0,0 +1,179 @@
+"""
+Compare collection profiles on recall, throughput and memory
+
+Copies the SCKS vectors into one scratch collection per profile, runs the
+same queries against each, and reports recall@k against exact search, QPS,
+latency percentiles and the estimated memory footprint:
+
+    python -m graph.setup.profile_sweep --profiles default,scalar,product --k 3
+    python -m graph.setup.profile_sweep --profiles fast --ef 16,32,64,128 --queries questions.txt
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from qdrant_client import models
+
+from graph.ingestion.qdrant_retriever import QDRANT_MODE, get_qdrant_client, is_embedded
+from graph.ingestion.vector_db_ingestion import COLLECTION_NAME, get_embeddings
+from graph.setup.collection_profiles import (
+    PROFILES,
+    CollectionProfile,
+    collection_kwargs,
+    estimate_memory,
+    search_params,
+)
+
+SWEEP_PREFIX = f"{COLLECTION_NAME}__sweep_"
+
+
+def load_points(client, collection: str, limit: Optional[int] = None) -> List[models.Record]:
+    points: List[models.Record] = []
+    offset = None
+    while True:
+        batch, offset = client.scroll(
+            collection_name=collection, limit=256, offset=offset, with_payload=False, with_vectors=True
+        )
+        points.extend(batch)
+        if offset is None or (limit and len(points) >= limit):
+            return points[:limit] if limit else points
+
+
+def load_queries(path: Optional[str], points: Sequence[models.Record], samples: int, seed: int) -> List[List[float]]:
+    """Embed questions from a file (one per line), or sample stored vectors as queries."""
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+        texts = [json.loads(line).get("question", line) if line.startswith("{") else line for line in lines]
+        return get_embeddings().embed_documents(texts)
+    rng = random.Random(seed)
+    return [point.vector for point in rng.sample(list(points), min(samples, len(points)))]
+
+
+def exact_neighbours(client, collection: str, queries: List[List[float]], k: int) -> List[List[Any]]:
+    exact = models.SearchParams(exact=True)
+    responses = client.query_batch_points(
+        collection_name=collection,
+        requests=[models.QueryRequest(query=q, limit=k, params=exact) for q in queries],
+    )
+    return [[point.id for point in response.points] for response in responses]
+
+
+def build_collection(client, name: str, profile: CollectionProfile, points: Sequence[models.Record],
+                     timeout: float = 300.0, poll_interval: float = 0.5):
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(collection_name=name, **collection_kwargs(profile, len(points[0].vector)))
+    for start in range(0, len(points), 256):
+        client.upsert(
+            collection_name=name,
+            points=[models.PointStruct(id=p.id, vector=p.vector) for p in points[start:start + 256]],
+            wait=True,
+        )
+    # Wait for the optimizer to finish building the HNSW graph and quantized codes; a GREEN
+    # collection with no indexed vectors would be measured as a plain scan.
+    deadline = time.monotonic() + timeout
+    while True:
+        info = client.get_collection(name)
+        if info.status == models.CollectionStatus.GREEN and (is_embedded() or (info.indexed_vectors_count or 0) > 0):
+            return info
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{name} was not indexed within {timeout:.0f}s")
+        time.sleep(poll_interval)
+
+
+def measure(client, name: str, queries: List[List[float]], truth: List[List[Any]], k: int,
+            params: Optional[Dict[str, Any]], rounds: int) -> Dict[str, float]:
+    search = models.SearchParams(**params) if params else None
+    for query in queries[:5]:  # warm-up
+        client.query_points(collection_name=name, query=query, limit=k, search_params=search)
+
+    latencies: List[float] = []
+    hits = 0
+    for _ in range(rounds):
+        for query, expected in zip(queries, truth):
+            start = time.perf_counter()
+            response = client.query_points(collection_name=name, query=query, limit=k, search_params=search)
+            latencies.append(time.perf_counter() - start)
+            hits += len({point.id for point in response.points} & set(expected))
+
+    latencies.sort()
+    return {
+        "recall": hits / (rounds * sum(len(t) for t in truth) or 1),
+        "qps": len(latencies) / sum(latencies),
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000,
+    }
+
+
+def sweep(profiles: Sequence[str], k: int = 3, ef_values: Sequence[int] = (), queries_path: Optional[str] = None,
+          samples: int = 100, rounds: int = 3, max_points: Optional[int] = None, seed: int = 0,
+          keep: bool = False) -> List[Dict[str, Any]]:
+    client = get_qdrant_client()
+    points = load_points(client, COLLECTION_NAME, max_points)
+    if not points:
+        raise RuntimeError(f"{COLLECTION_NAME} is empty; run graph/setup/setup_sample_db.py first")
+    vector_size = len(points[0].vector)
+    queries = load_queries(queries_path, points, samples, seed)
+
+    rows: List[Dict[str, Any]] = []
+    for profile_name in profiles:
+        profile = PROFILES[profile_name]
+        name = SWEEP_PREFIX + profile_name
+        print(f"---SWEEP: BUILDING {name} ({len(points)} POINTS)---")
+        build_collection(client, name, profile, points)
+        # Ground truth from the copy itself, so a capped --max-points sample stays comparable.
+        truth = exact_neighbours(client, name, queries, k)
+        for ef in list(ef_values) or [profile.hnsw_ef]:
+            params = search_params(profile._replace(hnsw_ef=ef))
+            row = {"profile": profile_name, "hnsw_ef": ef, "k": k, "points": len(points)}
+            row.update(measure(client, name, queries, truth, k, params, rounds))
+            row.update(estimate_memory(profile, len(points), vector_size))
+            rows.append(row)
+        if not keep:
+            client.delete_collection(name)
+    return rows
+
+
+def print_table(rows: List[Dict[str, Any]]):
+    print(f"{'profile':<12} {'ef':>5} {'recall@k':>9} {'qps':>9} {'p50 ms':>8} {'p95 ms':>8} {'ram MiB':>9} {'disk MiB':>9}")
+    for row in rows:
+        print(
+            f"{row['profile']:<12} {str(row['hnsw_ef'] or '-'):>5} {row['recall']:>9.3f} {row['qps']:>9.1f} "
+            f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['ram_bytes'] / 2**20:>9.2f} "
+            f"{row['disk_bytes'] / 2**20:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep SCKS collection profiles.")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="Comma-separated profile names")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--ef", default="", help="Comma-separated hnsw_ef values, overriding each profile's")
+    parser.add_argument("--queries", help="Questions to embed, one per line (plain text or JSONL)")
+    parser.add_argument("--samples", type=int, default=100, help="Stored vectors used as queries without --queries")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--max-points", type=int)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch collections")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    if is_embedded():
+        print(f"QDRANT_MODE={QDRANT_MODE}: local mode always searches exactly, so only memory estimates differ")
+
+    rows = sweep(
+        [p for p in args.profiles.split(",") if p],
+        k=args.k,
+        ef_values=[int(ef) for ef in args.ef.split(",") if ef],
+        queries_path=args.queries,
+        samples=args.samples,
+        rounds=args.rounds,
+        max_points=args.max_points,
+        keep=args.keep,
+    )
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows)
@@ -1,36 +1,218 @@
-from langchain_community.vectorstores import Qdrant
-from langchain_ollama import OllamaEmbeddings
-from qdrant_client import QdrantClient, models
-from langchain_qdrant import QdrantVectorStore
-from langchain_community.document_loaders import UnstructuredExcelLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+import hashlib
+import json
 import os
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-qdrant = QdrantClient(
-    host=os.environ.get("QDRANT_HOST"),
-    port=int(os.environ.get("QDRANT_PORT"))
-)
+from langchain_core.documents import Document
+from qdrant_client import models
 
-qdrant.recreate_collection(
-    collection_name="SCKS",
-    vectors_config=models.VectorParams(
-        size=960,  # adjust based on your model
-        distance=models.Distance.COSINE
-    )
+from graph.ingestion.qdrant_retriever import (
+    CONTENT_PAYLOAD_KEY,
+    METADATA_PAYLOAD_KEY,
+    QDRANT_MODE,
+    QDRANT_PATH,
+    get_qdrant_client,
+    is_embedded,
 )
+from graph.ingestion.excel_stream import iter_row_chunks
+from graph.setup.collection_profiles import CollectionProfile, collection_kwargs, get_profile, update_kwargs
+from graph.ingestion.vector_db_ingestion import COLLECTION_NAME, get_embeddings
+
+SCKS_PATH = os.environ.get("SCKS_PATH", "graph/setup/SCKS.xlsx")
+BATCH_SIZE = int(os.environ.get("SETUP_BATCH_SIZE", "64"))
+WORKERS = int(os.environ.get("SETUP_WORKERS", "4"))
+
+# Fixed namespace so the same content always maps to the same point ID.
+POINT_ID_NAMESPACE = uuid.UUID("6f1c2a0e-5d0b-4c1e-9a57-3f3d2b8e7c41")
+
+
+def load_documents() -> Iterable[Document]:
+    """Stream row-grouped chunks from the workbook without loading it whole."""
+    return iter_row_chunks(SCKS_PATH)
+
+
+# Payload metadata key holding record_hash(); a point whose stored hash differs gets its payload rewritten.
+RECORD_HASH_KEY = "record_hash"
+
+
+def content_hash(doc: Document) -> str:
+    sheet = doc.metadata.get("page_name", "")
+    return hashlib.sha256(f"{sheet}\x1f{doc.page_content}".encode("utf-8")).hexdigest()
+
+
+def record_hash(doc: Document) -> str:
+    """Hash of content and metadata, so a chunk that only moved (new row range) is still seen as changed."""
+    metadata = json.dumps(doc.metadata, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{doc.page_content}\x1f{metadata}".encode("utf-8")).hexdigest()
+
+
+def point_id(doc: Document, occurrence: int = 0) -> str:
+    """
+    ID derived from the content, so an unchanged chunk keeps its point and
+    vector; repeats of the same content in a sheet get one point each
+    """
+    key = content_hash(doc) if occurrence == 0 else f"{content_hash(doc)}#{occurrence}"
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, key))
+
+
+def _payload_metadata(doc: Document) -> Dict:
+    return {**doc.metadata, RECORD_HASH_KEY: record_hash(doc)}
+
+
+def detect_vector_size() -> int:
+    return len(get_embeddings().embed_query("vector size probe"))
+
 
-embeddings = OllamaEmbeddings(
-        model=os.environ.get("OLLAMA_MODEL"),
-        base_url=os.environ.get("OLLAMA_BASE_URL"), 
+def ensure_collection(client, vector_size: int, profile: Optional[CollectionProfile] = None):
+    """
+    Create the collection under a storage profile
+
+    An existing collection is moved to the profile in place; it is only
+    recreated when the embedding size changed.
+    """
+    profile = profile or get_profile()
+    if client.collection_exists(COLLECTION_NAME):
+        vectors = client.get_collection(COLLECTION_NAME).config.params.vectors
+        if vectors.size == vector_size:
+            if not is_embedded():
+                # Local mode is brute-force only and has no index settings to update.
+                client.update_collection(collection_name=COLLECTION_NAME, **update_kwargs(profile))
+            return
+        print(f"Vector size changed from {vectors.size} to {vector_size}, recreating {COLLECTION_NAME}")
+        client.delete_collection(COLLECTION_NAME)
+
+    client.create_collection(collection_name=COLLECTION_NAME, **collection_kwargs(profile, vector_size))
+
+
+def existing_points(client) -> Dict[str, Optional[str]]:
+    """Point ID -> stored record hash (None for points written before record hashes)."""
+    points_by_id: Dict[str, Optional[str]] = {}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=COLLECTION_NAME,
+            limit=1000,
+            offset=offset,
+            with_payload=[METADATA_PAYLOAD_KEY],
+            with_vectors=False,
+        )
+        for point in points:
+            metadata = (point.payload or {}).get(METADATA_PAYLOAD_KEY) or {}
+            points_by_id[str(point.id)] = metadata.get(RECORD_HASH_KEY)
+        if offset is None:
+            return points_by_id
+
+
+def _upsert_batch(client, batch: List[Tuple[str, Document]]) -> int:
+    vectors = get_embeddings().embed_documents([doc.page_content for _, doc in batch])
+    client.upsert(
+        collection_name=COLLECTION_NAME,
+        points=[
+            models.PointStruct(
+                id=pid,
+                vector=vector,
+                payload={
+                    CONTENT_PAYLOAD_KEY: doc.page_content,
+                    METADATA_PAYLOAD_KEY: _payload_metadata(doc),
+                },
+            )
+            for (pid, doc), vector in zip(batch, vectors)
+        ],
+        wait=True,
     )
+    return len(batch)
+
+
+def _update_payloads(client, batch: List[Tuple[str, Document]]) -> int:
+    """Rewrite the metadata of points whose content (and so vector) is unchanged."""
+    for pid, doc in batch:
+        client.set_payload(
+            collection_name=COLLECTION_NAME,
+            payload={METADATA_PAYLOAD_KEY: _payload_metadata(doc)},
+            points=[pid],
+            wait=True,
+        )
+    return len(batch)
 
-# Example: create a vector store
-vector_store = QdrantVectorStore(
-    client=qdrant,
-    collection_name="SCKS",
-    embedding=embeddings,
-)
 
-docs_list = UnstructuredExcelLoader("graph/setup/SCKS.xlsx", mode="elements").load()
+def sync_collection(documents: Iterable[Document], profile: Optional[CollectionProfile] = None) -> Dict[str, int]:
+    """
+    Upsert new documents, update the metadata of moved ones and delete
+    points no longer in the source
 
-vector_store.add_documents(docs_list)
\ No newline at end of file
+    Documents are consumed as a stream: only point IDs, their record hashes
+    and the batches in flight are held in memory.
+    """
+    client = get_qdrant_client()
+    ensure_collection(client, detect_vector_size(), profile)
+
+    existing = existing_points(client)
+    current: Set[str] = set()
+    occurrences: Counter = Counter()
+    batches = {_upsert_batch: [], _update_payloads: []}
+    in_flight = deque()
+    done = {_upsert_batch: 0, _update_payloads: 0}
+
+    def drain(futures):
+        for work, future in futures:
+            done[work] += future.result()
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        def submit(work):
+            in_flight.append((work, executor.submit(work, client, batches[work])))
+            batches[work] = []
+
+        for doc in documents:
+            key = content_hash(doc)
+            pid = point_id(doc, occurrences[key])
+            occurrences[key] += 1
+            current.add(pid)
+            if pid not in existing:
+                work = _upsert_batch
+            elif existing[pid] != record_hash(doc):
+                work = _update_payloads
+            else:
+                continue
+            batches[work].append((pid, doc))
+            if len(batches[work]) >= BATCH_SIZE:
+                submit(work)
+                if len(in_flight) >= 2 * WORKERS:
+                    drain([in_flight.popleft()])
+        for work, batch in list(batches.items()):
+            if batch:
+                submit(work)
+        drain(in_flight)
+
+    stale_ids = sorted(set(existing) - current)
+    if stale_ids:
+        client.delete(
+            collection_name=COLLECTION_NAME,
+            points_selector=models.PointIdsList(points=stale_ids),
+            wait=True,
+        )
+
+    upserted, updated = done[_upsert_batch], done[_update_payloads]
+    return {
+        "source": len(current),
+        "unchanged": len(current) - upserted - updated,
+        "upserted": upserted,
+        "updated": updated,
+        "deleted": len(stale_ids),
+    }
+
+
+if __name__ == "__main__":
+    if QDRANT_MODE == "memory":
+        print("QDRANT_MODE=memory keeps nothing after exit; the app seeds its own collection on startup")
+    elif is_embedded():
+        print(f"Writing {COLLECTION_NAME} to embedded Qdrant at {QDRANT_PATH}")
+    else:
+        print(f"Collection profile: {get_profile().name} ({get_profile().description})")
+    stats = sync_collection(load_documents())
+    print(
+        f"{COLLECTION_NAME}: {stats['source']} points in source, {stats['unchanged']} unchanged, "
+        f"{stats['upserted']} upserted, {stats['updated']} updated, {stats['deleted']} deleted"
+    )
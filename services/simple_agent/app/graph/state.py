@@ -1,4 +1,6 @@
-from typing import List, TypedDict
+from typing import Annotated, Dict, List, TypedDict
+
+from graph.timing import merge_timings
 
 
 class GraphState(TypedDict):
@@ -10,9 +12,11 @@ class GraphState(TypedDict):
         generation: LLM generation
         web_search: whether to add search
         documents: list of documents
+        timings: wall time in milliseconds spent in each node
     """
 
     question: str
     generation: str
     web_search: bool
     documents: List[str]
+    timings: Annotated[Dict[str, float], merge_timings]
@@ -0,0 +1,31 @@
+import time
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.runnables import RunnableLambda
+
+
+def merge_timings(left: Optional[Dict[str, float]], right: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """State reducer: add up per-node milliseconds across node runs."""
+    merged = dict(left or {})
+    for name, ms in (right or {}).items():
+        merged[name] = merged.get(name, 0.0) + ms
+    return merged
+
+
+def timed(name: str, func: Callable, afunc: Optional[Callable] = None) -> RunnableLambda:
+    """Wrap a node so that its wall time is recorded under state['timings'][name]."""
+
+    def run(state: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        update = func(state)
+        return {**update, "timings": {name: (time.perf_counter() - start) * 1000}}
+
+    if afunc is None:
+        return RunnableLambda(run, name=name)
+
+    async def arun(state: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        update = await afunc(state)
+        return {**update, "timings": {name: (time.perf_counter() - start) * 1000}}
+
+    return RunnableLambda(run, afunc=arun, name=name)
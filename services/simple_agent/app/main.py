@@ -1,18 +1,39 @@
 from dotenv import load_dotenv
+import argparse
 import os
 load_dotenv()
 
 
-from graph.graph import app, ROUTER_TYPE
+def parse_args():
+    parser = argparse.ArgumentParser(description="Ask the simple_agent graph a question.")
+    parser.add_argument("--batch", help="JSONL file of questions to answer in bulk")
+    parser.add_argument("--output", default="answers.jsonl", help="JSONL file answers are streamed to")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--question-field", help="Field holding the question, detected by default")
+    parser.add_argument("--id-field", help="Field holding the question ID, detected by default")
+    parser.add_argument("--no-prefetch", action="store_true", help="Skip the Qdrant batch prefetch")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    print("Enter your question:")
-    try:
-        print("ROUTER:" + os.environ.get("ROUTER_TYPE"))
-        print("LOCAL_LLM:" + os.environ.get("LOCAL_LLM"))
-        response = app.invoke(input={"question": input("> ")})
-        #response = app.invoke(input={"question": "who is olcay ozyilmaz?"})
-        print(response["generation"])
-        #print(app.invoke(input={"question": "who is olcay ozyilmaz?"}))
-    except Exception as e:  
-        print(f"An error occurred: {e}")    
+    args = parse_args()
+    if args.batch:
+        import batch_runner
+        batch_runner.main(args.batch, args.output, args.concurrency, args.question_field,
+                          args.id_field, prefetch=not args.no_prefetch)
+    else:
+        from graph.graph import app, ROUTER_TYPE
+
+        print("Enter your question:")
+        try:
+            print("ROUTER:" + str(os.environ.get("ROUTER_TYPE")))
+            print("LOCAL_LLM:" + str(os.environ.get("LOCAL_LLM")))
+            response = app.invoke(input={"question": input("> ")})
+            #response = app.invoke(input={"question": "who is olcay ozyilmaz?"})
+            print(response["generation"])
+            if ROUTER_TYPE == "EMBEDDING":
+                from graph.chains.embedding_router import get_embedding_router
+                print("ROUTER STATS:", get_embedding_router().report())
+            #print(app.invoke(input={"question": "who is olcay ozyilmaz?"}))
+        except Exception as e:  
+            print(f"An error occurred: {e}")
@@ -0,0 +1,87 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from graph.chains.abacus_ai_wrapper import AbacusAIError, AbacusAILLM
+
+
+class StubApiError(Exception):
+    def __init__(self, message, http_status):
+        super().__init__(message)
+        self.http_status = http_status
+
+
+class StubApiClient:
+    """Local stand-in for abacusai.ApiClient that fails a set number of times first."""
+
+    def __init__(self, failures=0, http_status=503):
+        self.failures = failures
+        self.http_status = http_status
+        self.prompts = []
+
+    def evaluate_prompt(self, prompt, temperature, max_tokens, stop_sequences=None):
+        self.prompts.append(prompt)
+        if self.failures > 0:
+            self.failures -= 1
+            raise StubApiError("stub failure", self.http_status)
+        return SimpleNamespace(content=f"answer: {prompt}")
+
+
+def make_llm(client, **kwargs):
+    llm = AbacusAILLM(client=client, api_key="test-key", model_name="test-model", **kwargs)
+    llm._sleep = lambda seconds: None
+    return llm
+
+
+class TestAbacusAILLM(unittest.TestCase):
+    def test_invoke(self):
+        llm = make_llm(StubApiClient())
+        self.assertEqual(llm.invoke("hi"), "answer: hi")
+
+    def test_missing_env_does_not_fail_at_construction(self):
+        llm = AbacusAILLM(api_key=None)
+        with self.assertRaises(ValueError):
+            llm.client
+
+    def test_retries_transient_errors(self):
+        client = StubApiClient(failures=2, http_status=503)
+        llm = make_llm(client, max_retries=3)
+        self.assertEqual(llm.invoke("hi"), "answer: hi")
+        self.assertEqual(len(client.prompts), 3)
+
+    def test_gives_up_after_max_retries(self):
+        client = StubApiClient(failures=10, http_status=429)
+        llm = make_llm(client, max_retries=2)
+        with self.assertRaises(AbacusAIError) as ctx:
+            llm.invoke("hi")
+        self.assertTrue(ctx.exception.transient)
+        self.assertEqual(len(client.prompts), 3)
+
+    def test_does_not_retry_permanent_errors(self):
+        client = StubApiClient(failures=1, http_status=400)
+        llm = make_llm(client)
+        with self.assertRaises(AbacusAIError) as ctx:
+            llm.invoke("hi")
+        self.assertFalse(ctx.exception.transient)
+        self.assertEqual(len(client.prompts), 1)
+
+    def test_batch(self):
+        client = StubApiClient()
+        llm = make_llm(client, max_concurrency=3)
+        prompts = [f"q{i}" for i in range(5)]
+        self.assertEqual(llm.batch(prompts), [f"answer: {p}" for p in prompts])
+
+    def test_async_batch_with_retry(self):
+        client = StubApiClient(failures=1)
+        llm = make_llm(client)
+        llm.backoff_base = 0.0
+        results = asyncio.run(llm.abatch(["a", "b"]))
+        self.assertEqual(sorted(results), ["answer: a", "answer: b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
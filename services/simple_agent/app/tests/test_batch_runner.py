@@ -0,0 +1,99 @@
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+import batch_runner
+from graph.ingestion.qdrant_retriever import QdrantRetriever
+
+
+class StubApp:
+    """Stands in for the compiled graph: sleeps per question and fails on demand."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.questions = []
+
+    async def ainvoke(self, state):
+        self.questions.append(state["question"])
+        await asyncio.sleep(self.delay)
+        if state["question"] in self.fail:
+            raise RuntimeError("graph failed")
+        return {"generation": f"answer to {state['question']}", "timings": {"generate": 1.0}}
+
+
+class StubEmbeddings(Embeddings):
+    def embed_documents(self, texts):
+        return [[1.0] for _ in texts]
+
+    def embed_query(self, text):
+        return [1.0]
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.input_path = str(Path(directory.name) / "questions.jsonl")
+        self.output_path = str(Path(directory.name) / "answers.jsonl")
+        with open(self.input_path, "w", encoding="utf-8") as f:
+            for i in range(4):
+                f.write(json.dumps({"id": f"q{i}", "question": f"question {i}"}) + "\n")
+
+    def _run(self, app, **kwargs):
+        graph_module = types.ModuleType("graph.graph")
+        graph_module.app = app
+        with mock.patch.dict(sys.modules, {"graph.graph": graph_module}):
+            return asyncio.run(batch_runner.run_batch(self.input_path, self.output_path, prefetch=False, **kwargs))
+
+    def _records(self):
+        with open(self.output_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_resume_skips_answered_and_retries_failed(self):
+        stats = self._run(StubApp(fail={"question 2"}))
+        self.assertEqual(stats, {"skipped": 0, "answered": 3, "failed": 1})
+        # A line torn by a crash mid-write is ignored.
+        with open(self.output_path, "a", encoding="utf-8") as f:
+            f.write('{"id": "q3", "gen')
+
+        app = StubApp()
+        stats = self._run(app)
+        self.assertEqual(stats, {"skipped": 3, "answered": 1, "failed": 0})
+        self.assertEqual(app.questions, ["question 2"])
+        self.assertEqual(batch_runner.completed_ids(self.output_path), {"q0", "q1", "q2", "q3"})
+
+    def test_total_ms_is_per_question(self):
+        started = time.perf_counter()
+        self._run(StubApp(delay=0.05), concurrency=1)
+        wall_ms = (time.perf_counter() - started) * 1000
+        records = self._records()
+        self.assertEqual(len(records), 4)
+        # Run one at a time, the last question would report the whole batch if timed from its start.
+        for record in records:
+            self.assertLess(record["total_ms"], wall_ms / 2)
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_clear_prefetched_drops_unused_results(self):
+        retriever = QdrantRetriever(collection_name="test", embeddings=StubEmbeddings())
+        with mock.patch.object(QdrantRetriever, "search_batch", return_value=[[Document(page_content="a")], [Document(page_content="b")]]):
+            retriever.prefetch(["Question A", "Question B"])
+        self.assertEqual(retriever.invoke("question a")[0].page_content, "a")
+        retriever.clear_prefetched()
+        self.assertEqual(retriever._prefetched, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
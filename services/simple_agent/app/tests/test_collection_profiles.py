@@ -0,0 +1,108 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from qdrant_client import models
+
+import graph.setup.profile_sweep as profile_sweep
+from graph.setup.collection_profiles import (
+    PROFILES, collection_kwargs, estimate_memory, get_profile, search_params, update_kwargs
+)
+
+
+class IndexingClient:
+    """Reports GREEN straight away but only counts indexed vectors from the given poll on."""
+
+    def __init__(self, indexed_from_poll):
+        self.indexed_from_poll = indexed_from_poll
+        self.polls = 0
+        self.created = {}
+
+    def collection_exists(self, name):
+        return False
+
+    def create_collection(self, collection_name, **kwargs):
+        self.created[collection_name] = kwargs
+
+    def upsert(self, **kwargs):
+        pass
+
+    def get_collection(self, name):
+        self.polls += 1
+        indexed = 10 if self.indexed_from_poll is not None and self.polls >= self.indexed_from_poll else 0
+        return SimpleNamespace(status=models.CollectionStatus.GREEN, indexed_vectors_count=indexed)
+
+
+POINTS = [models.Record(id=i, vector=[float(i), 1.0]) for i in range(10)]
+
+
+class TestCollectionProfiles(unittest.TestCase):
+    def test_every_profile_indexes_small_collections(self):
+        # 0 disables vector indexing in Qdrant; every profile must build its HNSW index.
+        for profile in PROFILES.values():
+            for kwargs in (collection_kwargs(profile, 384), update_kwargs(profile)):
+                self.assertGreater(kwargs["optimizers_config"].indexing_threshold, 0, profile.name)
+
+    def test_profile_maps_to_collection_config(self):
+        kwargs = collection_kwargs(PROFILES["product"], 384)
+        self.assertEqual(kwargs["vectors_config"].size, 384)
+        self.assertEqual(kwargs["vectors_config"].distance, models.Distance.COSINE)
+        self.assertTrue(kwargs["vectors_config"].on_disk)
+        self.assertTrue(kwargs["on_disk_payload"])
+        self.assertIsInstance(kwargs["quantization_config"], models.ProductQuantization)
+        self.assertEqual(kwargs["quantization_config"].product.compression, models.CompressionRatio.X16)
+
+        kwargs = collection_kwargs(PROFILES["accurate"], 384)
+        self.assertEqual((kwargs["hnsw_config"].m, kwargs["hnsw_config"].ef_construct), (32, 256))
+        self.assertIsNone(kwargs["quantization_config"])
+        self.assertFalse(kwargs["vectors_config"].on_disk)
+
+        self.assertIsInstance(collection_kwargs(PROFILES["scalar"], 8)["quantization_config"], models.ScalarQuantization)
+        self.assertIsInstance(collection_kwargs(PROFILES["binary"], 8)["quantization_config"], models.BinaryQuantization)
+
+    def test_update_disables_quantization_for_unquantized_profiles(self):
+        self.assertEqual(update_kwargs(PROFILES["default"])["quantization_config"], models.Disabled.DISABLED)
+        self.assertTrue(update_kwargs(PROFILES["scalar-disk"])["collection_params"].on_disk_payload)
+
+    def test_search_params(self):
+        self.assertIsNone(search_params(PROFILES["default"]))
+        self.assertEqual(search_params(PROFILES["fast"]), {"hnsw_ef": 32})
+        quantization = search_params(PROFILES["binary"])["quantization"]
+        self.assertTrue(quantization.rescore)
+        self.assertEqual(quantization.oversampling, 4.0)
+
+    def test_get_profile(self):
+        self.assertIs(get_profile("scalar"), PROFILES["scalar"])
+        with self.assertRaises(ValueError):
+            get_profile("huge")
+
+    def test_quantization_shrinks_estimated_ram(self):
+        names = ("default", "scalar", "scalar-disk", "binary")
+        ram = {name: estimate_memory(PROFILES[name], 10_000, 384)["ram_bytes"] for name in names}
+        # In-RAM scalar keeps the float32 originals too; moving them to disk is what saves memory.
+        self.assertGreater(ram["scalar"], ram["default"])
+        self.assertGreater(ram["default"], ram["scalar-disk"])
+        self.assertGreater(ram["scalar-disk"], ram["binary"])
+        self.assertEqual(estimate_memory(PROFILES["default"], 10_000, 384)["disk_bytes"], 0)
+
+    @mock.patch.object(profile_sweep, "is_embedded", return_value=False)
+    def test_build_waits_for_indexed_vectors(self, _):
+        client = IndexingClient(indexed_from_poll=3)
+        info = profile_sweep.build_collection(client, "sweep_default", PROFILES["default"], POINTS, poll_interval=0)
+        self.assertGreater(info.indexed_vectors_count, 0)
+        self.assertEqual(client.polls, 3)
+
+    @mock.patch.object(profile_sweep, "is_embedded", return_value=False)
+    def test_build_fails_when_never_indexed(self, _):
+        client = IndexingClient(indexed_from_poll=None)
+        with self.assertRaises(TimeoutError):
+            profile_sweep.build_collection(client, "sweep_default", PROFILES["default"], POINTS, timeout=0.05,
+                                           poll_interval=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
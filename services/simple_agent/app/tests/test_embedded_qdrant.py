@@ -0,0 +1,98 @@
+import asyncio
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+import graph.ingestion.qdrant_retriever as qdrant_retriever
+from graph.ingestion.qdrant_retriever import QdrantRetriever
+
+
+class KeywordEmbeddings(Embeddings):
+    """Two-dimensional embeddings: docker-ish text vs everything else."""
+
+    def _embed(self, text):
+        return [1.0, 0.0] if "docker" in text.lower() else [0.0, 1.0]
+
+    def embed_documents(self, texts):
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+DOCUMENTS = [
+    Document(page_content="Docker runs containers"),
+    Document(page_content="Qdrant stores vectors"),
+]
+
+
+def _clear_clients():
+    for factory in (qdrant_retriever._get_local_client, qdrant_retriever.get_qdrant_client,
+                    qdrant_retriever.get_async_qdrant_client):
+        factory.cache_clear()
+
+
+class EmbeddedQdrantTestCase(unittest.TestCase):
+    mode = "memory"
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        patches = [
+            mock.patch.object(qdrant_retriever, "QDRANT_MODE", self.mode),
+            mock.patch.object(qdrant_retriever, "QDRANT_PATH", self.path),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        _clear_clients()
+        self.addCleanup(_clear_clients)
+        self.addCleanup(shutil.rmtree, self.path, True)
+
+        from graph.setup.setup_sample_db import sync_collection
+
+        with mock.patch("graph.setup.setup_sample_db.get_embeddings", lambda: KeywordEmbeddings()):
+            self.stats = sync_collection(iter(DOCUMENTS))
+        self.retriever = QdrantRetriever(collection_name="SCKS", embeddings=KeywordEmbeddings(), k=1)
+
+
+class TestMemoryMode(EmbeddedQdrantTestCase):
+    def test_sync_and_search_in_process(self):
+        self.assertTrue(qdrant_retriever.is_embedded())
+        self.assertEqual(self.stats["upserted"], 2)
+        docs = self.retriever.invoke("what is docker")
+        self.assertEqual(docs[0].page_content, "Docker runs containers")
+
+    def test_async_path_shares_the_same_store(self):
+        docs = asyncio.run(self.retriever.ainvoke("how are vectors stored"))
+        self.assertEqual(docs[0].page_content, "Qdrant stores vectors")
+
+    def test_batch_search(self):
+        results = self.retriever.search_batch(["docker?", "vectors?"])
+        self.assertEqual([r[0].page_content for r in results],
+                         ["Docker runs containers", "Qdrant stores vectors"])
+
+
+class TestDiskMode(EmbeddedQdrantTestCase):
+    mode = "disk"
+
+    def test_collection_persists_across_clients(self):
+        qdrant_retriever.get_qdrant_client().close()
+        _clear_clients()
+        from graph.setup.setup_sample_db import sync_collection
+
+        with mock.patch("graph.setup.setup_sample_db.get_embeddings", lambda: KeywordEmbeddings()):
+            stats = sync_collection(iter(DOCUMENTS))
+        self.assertEqual(stats["unchanged"], 2)
+        self.assertEqual(stats["upserted"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from graph.chains.embedding_router import EmbeddingRouter
+
+
+EXAMPLES = {"vectorstore": ["docs"], "websearch": ["news"]}
+
+
+class KeywordEmbeddings:
+    """"docs" and "news" point in orthogonal directions; anything else sits halfway."""
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        if "docs" in text:
+            return [1.0, 0.0]
+        if "news" in text:
+            return [0.0, 1.0]
+        return [1.0, 1.0]
+
+
+class TestEmbeddingRouter(unittest.TestCase):
+    def test_clear_margin_skips_fallback(self):
+        calls = []
+        router = EmbeddingRouter(KeywordEmbeddings(), EXAMPLES, margin=0.1, fallback=calls.append)
+        self.assertEqual(router.route("latest news"), "websearch")
+        self.assertEqual(calls, [])
+
+    def test_small_margin_uses_fallback(self):
+        router = EmbeddingRouter(KeywordEmbeddings(), EXAMPLES, margin=0.1, fallback=lambda q: "websearch")
+        self.assertEqual(router.route("something else"), "websearch")
+        self.assertEqual(router.report()["fallbacks"], 1)
+
+    def test_failing_fallback_returns_best_route_uncached(self):
+        calls = []
+
+        def fallback(question):
+            calls.append(question)
+            raise ConnectionError("LLM router unavailable")
+
+        router = EmbeddingRouter(KeywordEmbeddings(), EXAMPLES, margin=0.1, fallback=fallback)
+        self.assertIn(router.route("something else"), EXAMPLES)
+        router.route("something else")
+        self.assertEqual(len(calls), 2)
+        report = router.report()
+        self.assertEqual((report["fallbacks"], report["fallback_errors"], report["cache_hits"]), (0, 2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
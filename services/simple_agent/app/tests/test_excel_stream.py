@@ -0,0 +1,62 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from openpyxl import Workbook
+
+from graph.ingestion.excel_stream import estimate_tokens, iter_row_chunks
+
+BUDGET = 64
+
+
+def _write_workbook(path, rows):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Docs"
+    sheet.append(["id", "title", "summary"])
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def _rows(count):
+    return [[i, f"Document {i}", f"Notes about topic {i * 7 % 13} and item {i}"] for i in range(count)]
+
+
+class TestRowChunks(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = str(Path(directory.name) / "docs.xlsx")
+
+    def _chunks(self, rows):
+        _write_workbook(self.path, rows)
+        return [doc.page_content for doc in iter_row_chunks(self.path, token_budget=BUDGET)]
+
+    def test_chunks_respect_budget_and_keep_every_row(self):
+        rows = _rows(200)
+        chunks = self._chunks(rows)
+        self.assertGreater(len(chunks), 10)
+        for chunk in chunks:
+            body = chunk.split("\n", 1)[1]
+            self.assertTrue(chunk.startswith("Sheet: Docs\n"))
+            self.assertLessEqual(sum(estimate_tokens(line) for line in body.split("\n")), BUDGET)
+        self.assertEqual(sum(chunk.count("\n") for chunk in chunks), len(rows))
+
+    def test_edit_only_changes_nearby_chunks(self):
+        rows = _rows(200)
+        before = self._chunks(rows)
+        rows[20][2] = "Rewritten notes that are considerably longer than the original ones were"
+        rows.insert(120, [999, "Inserted", "A new row in the middle"])
+        after = self._chunks(rows)
+        # Greedy packing would shift every boundary after row 20; anchors resynchronise right away.
+        changed = len(set(after) - set(before))
+        self.assertLessEqual(changed, 6)
+        self.assertEqual(after[-1], before[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
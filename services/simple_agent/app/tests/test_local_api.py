@@ -0,0 +1,143 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import graph.ingestion.local_api as local_api
+from graph.ingestion.local_api import AsyncLocalApiClient, LocalApiClient, LocalApiError
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the local_api service."""
+
+    protocol_version = "HTTP/1.1"
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/not-json":
+            body = b"<html>maintenance</html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        time.sleep(0.1)
+        body = json.dumps({"message": "Hello, World!"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/cached"):
+            self.send_header("Cache-Control", "max-age=60")
+        elif self.path == "/etag":
+            self.send_header("ETag", '"v1"')
+        else:
+            self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLocalApiClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        StubHandler.hits = 0
+
+    def test_caches_by_max_age(self):
+        client = LocalApiClient(self.base_url)
+        self.assertEqual(client.get("/cached").data["message"], "Hello, World!")
+        self.assertTrue(client.get("/cached").from_cache)
+        self.assertEqual(StubHandler.hits, 1)
+
+    def test_no_store_is_not_cached(self):
+        client = LocalApiClient(self.base_url)
+        client.get("/")
+        client.get("/")
+        self.assertEqual(StubHandler.hits, 2)
+
+    def test_revalidates_with_etag(self):
+        client = LocalApiClient(self.base_url)
+        client.get("/etag")
+        response = client.get("/etag")
+        self.assertTrue(response.from_cache)
+        self.assertEqual(client.stats["revalidated"], 1)
+
+    def test_error_status(self):
+        client = LocalApiClient(self.base_url)
+        with self.assertRaises(LocalApiError) as ctx:
+            client.get("/missing")
+        self.assertEqual(ctx.exception.status, 404)
+
+    def test_non_json_body_is_a_local_api_error(self):
+        client = LocalApiClient(self.base_url)
+        with self.assertRaises(LocalApiError):
+            client.get("/not-json")
+        with mock.patch.object(local_api, "_client", client):
+            result = local_api.call_local_api("/not-json")
+        self.assertIn("invalid JSON", result["error"])
+
+    def test_cache_is_bounded(self):
+        client = LocalApiClient(self.base_url, cache_size=2)
+        for path in ("/cached?a", "/cached?b", "/cached?a", "/cached?c"):
+            client.get(path)
+        self.assertEqual(list(client._cache), [f"{self.base_url}/cached?a", f"{self.base_url}/cached?c"])
+        self.assertEqual(StubHandler.hits, 3)
+
+    def test_coalesces_concurrent_calls(self):
+        client = LocalApiClient(self.base_url)
+        threads = [threading.Thread(target=client.get, args=("/",)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLess(StubHandler.hits, 5)
+
+    def test_async_client(self):
+        async def run():
+            client = AsyncLocalApiClient(self.base_url)
+            try:
+                responses = await asyncio.gather(*(client.get("/cached") for _ in range(4)))
+                responses.append(await client.get("/cached"))
+            finally:
+                await client.aclose()
+            return responses
+
+        responses = asyncio.run(run())
+        self.assertEqual(StubHandler.hits, 1)
+        self.assertTrue(responses[-1].from_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from graph.chains.ollama_pool import OllamaPool, PooledOllamaEmbeddings
+
+
+class StandInOllama:
+    """A local HTTP server answering the Ollama endpoints used for embeddings."""
+
+    def __init__(self, value, down=False):
+        self.down = down
+        self.embeds = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if stand_in.down:
+                    return self._send(503, {"error": "down"})
+                models = [{"name": "smollm2:latest", "model": "smollm2:latest"}]
+                self._send(200, {"models": models})
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if stand_in.down:
+                    return self._send(503, {"error": "down"})
+                stand_in.embeds += 1
+                inputs = request["input"] if isinstance(request["input"], list) else [request["input"]]
+                self._send(200, {"model": request["model"], "embeddings": [[value, 0.0] for _ in inputs]})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestPooledOllamaEmbeddings(unittest.TestCase):
+    def setUp(self):
+        self.down = StandInOllama(1.0, down=True)
+        self.up = StandInOllama(2.0)
+        self.addCleanup(self.down.close)
+        self.addCleanup(self.up.close)
+        self.pool = OllamaPool([self.down.url, self.up.url])
+
+    def test_embeddings_skip_failed_endpoint(self):
+        embeddings = PooledOllamaEmbeddings(model="smollm2", pool=self.pool)
+        self.assertEqual(embeddings.embed_documents(["a", "b"]), [[2.0, 0.0], [2.0, 0.0]])
+        self.assertEqual(embeddings.embed_query("c"), [2.0, 0.0])
+        self.assertEqual(self.up.embeds, 2)
+        self.assertFalse(self.pool.check_all()[self.down.url])
+
+
+if __name__ == '__main__':
+    unittest.main()
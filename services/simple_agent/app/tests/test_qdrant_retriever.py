@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain_core.embeddings import Embeddings
+
+import graph.ingestion.qdrant_retriever as qdrant_retriever
+from graph.ingestion.qdrant_retriever import CachedQueryEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.query_calls = []
+        self.document_calls = []
+
+    def embed_query(self, text):
+        self.query_calls.append(text)
+        return [float(len(text))]
+
+    def embed_documents(self, texts):
+        self.document_calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class TestCachedQueryEmbeddings(unittest.TestCase):
+    def test_normalized_repeat_is_a_hit(self):
+        inner = CountingEmbeddings()
+        embeddings = CachedQueryEmbeddings(inner)
+        first = embeddings.embed_query("What is Docker?")
+        second = embeddings.embed_query("  what is   DOCKER? ")
+        self.assertEqual(first, second)
+        self.assertEqual(len(inner.query_calls), 1)
+        self.assertEqual((embeddings.hits, embeddings.misses), (1, 1))
+
+    def test_least_recently_used_is_evicted(self):
+        inner = CountingEmbeddings()
+        embeddings = CachedQueryEmbeddings(inner, maxsize=2)
+        for text in ("a", "b", "a", "c", "a", "b"):
+            embeddings.embed_query(text)
+        self.assertEqual(inner.query_calls, ["a", "b", "c", "b"])
+
+    def test_batch_sends_only_misses_in_one_call(self):
+        inner = CountingEmbeddings()
+        embeddings = CachedQueryEmbeddings(inner)
+        embeddings.embed_query("cached")
+        vectors = embeddings.embed_queries(["Cached", "new one", "another"])
+        self.assertEqual(vectors, [[6.0], [7.0], [7.0]])
+        self.assertEqual(inner.document_calls, [["new one", "another"]])
+        self.assertEqual(asyncio.run(embeddings.aembed_queries(["new one"])), [[7.0]])
+        self.assertEqual(len(inner.document_calls), 1)
+
+    def test_documents_are_not_cached(self):
+        inner = CountingEmbeddings()
+        embeddings = CachedQueryEmbeddings(inner)
+        embeddings.embed_documents(["x"])
+        embeddings.embed_documents(["x"])
+        self.assertEqual(len(inner.document_calls), 2)
+
+
+class TestClientSelection(unittest.TestCase):
+    def setUp(self):
+        self._clear()
+        self.addCleanup(self._clear)
+
+    def _clear(self):
+        for factory in (qdrant_retriever._get_local_client, qdrant_retriever.get_qdrant_client,
+                        qdrant_retriever.get_async_qdrant_client):
+            factory.cache_clear()
+
+    def _server_clients(self, prefer_grpc):
+        with mock.patch.object(qdrant_retriever, "QDRANT_MODE", "server"), \
+                mock.patch.object(qdrant_retriever, "QDRANT_PREFER_GRPC", prefer_grpc), \
+                mock.patch.object(qdrant_retriever, "QDRANT_HOST", "qdrant"), \
+                mock.patch("qdrant_client.QdrantClient") as sync_client, \
+                mock.patch("qdrant_client.AsyncQdrantClient") as async_client:
+            clients = (qdrant_retriever.get_qdrant_client(), qdrant_retriever.get_qdrant_client(),
+                       qdrant_retriever.get_async_qdrant_client())
+        return clients, sync_client, async_client
+
+    def test_server_mode_prefers_grpc_and_reuses_one_client(self):
+        (first, second, _), sync_client, async_client = self._server_clients(prefer_grpc=True)
+        self.assertIs(first, second)
+        sync_client.assert_called_once_with(
+            host="qdrant", port=qdrant_retriever.QDRANT_PORT, grpc_port=qdrant_retriever.QDRANT_GRPC_PORT, prefer_grpc=True
+        )
+        self.assertTrue(async_client.call_args.kwargs["prefer_grpc"])
+
+    def test_rest_when_grpc_disabled(self):
+        _, sync_client, async_client = self._server_clients(prefer_grpc=False)
+        self.assertFalse(sync_client.call_args.kwargs["prefer_grpc"])
+        self.assertFalse(async_client.call_args.kwargs["prefer_grpc"])
+
+    def test_embedded_mode_shares_one_local_client(self):
+        with mock.patch.object(qdrant_retriever, "QDRANT_MODE", "memory"):
+            client = qdrant_retriever.get_qdrant_client()
+            async_client = qdrant_retriever.get_async_qdrant_client()
+        self.assertIsInstance(client, qdrant_retriever._LocalClient)
+        self.assertIs(async_client._client, client)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from langchain_core.documents import Document
+
+import graph.ingestion.qdrant_retriever as qdrant_retriever
+from graph.ingestion.qdrant_retriever import CONTENT_PAYLOAD_KEY, METADATA_PAYLOAD_KEY
+from test_embedded_qdrant import KeywordEmbeddings, _clear_clients
+
+
+def _chunk(text, row_start, row_end, sheet="Docs"):
+    return Document(
+        page_content=f"Sheet: {sheet}\n{text}",
+        metadata={"source": "SCKS.xlsx", "page_name": sheet, "row_start": row_start, "row_end": row_end},
+    )
+
+
+class SyncTestCase(unittest.TestCase):
+    def setUp(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, True)
+        for patch in (
+            mock.patch.object(qdrant_retriever, "QDRANT_MODE", "memory"),
+            mock.patch.object(qdrant_retriever, "QDRANT_PATH", path),
+            mock.patch("graph.setup.setup_sample_db.get_embeddings", lambda: KeywordEmbeddings()),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        _clear_clients()
+        self.addCleanup(_clear_clients)
+
+    def sync(self, documents):
+        from graph.setup.setup_sample_db import sync_collection
+
+        return sync_collection(iter(documents))
+
+    def stored(self):
+        from graph.setup.setup_sample_db import COLLECTION_NAME
+
+        points, _ = qdrant_retriever.get_qdrant_client().scroll(
+            collection_name=COLLECTION_NAME, limit=100, with_payload=True
+        )
+        return sorted(
+            (p.payload[CONTENT_PAYLOAD_KEY], p.payload[METADATA_PAYLOAD_KEY]["row_start"],
+             p.payload[METADATA_PAYLOAD_KEY]["row_end"])
+            for p in points
+        )
+
+
+class TestSync(SyncTestCase):
+    def test_added_changed_and_removed_rows(self):
+        stats = self.sync([_chunk("a: docker", 2, 2), _chunk("a: vectors", 3, 3), _chunk("a: old", 4, 4)])
+        self.assertEqual((stats["source"], stats["upserted"], stats["deleted"]), (3, 3, 0))
+
+        stats = self.sync([_chunk("a: docker", 2, 2), _chunk("a: vectors, edited", 3, 3), _chunk("a: added", 5, 5)])
+        self.assertEqual(
+            (stats["unchanged"], stats["upserted"], stats["updated"], stats["deleted"]), (1, 2, 0, 2)
+        )
+        self.assertEqual([row[0] for row in self.stored()], [
+            "Sheet: Docs\na: added", "Sheet: Docs\na: docker", "Sheet: Docs\na: vectors, edited",
+        ])
+
+    def test_same_text_on_another_sheet_is_another_point(self):
+        one, two = _chunk("a: docker", 2, 2, sheet="One"), _chunk("a: docker", 2, 2, sheet="Two")
+        two.page_content = one.page_content
+        stats = self.sync([one, two])
+        self.assertEqual((stats["source"], stats["upserted"]), (2, 2))
+
+    def test_moved_chunk_gets_new_row_range(self):
+        self.sync([_chunk("a: docker", 2, 3), _chunk("a: vectors", 4, 5)])
+
+        stats = self.sync([_chunk("a: new row", 2, 2), _chunk("a: docker", 3, 4), _chunk("a: vectors", 5, 6)])
+        self.assertEqual(
+            (stats["upserted"], stats["updated"], stats["unchanged"], stats["deleted"]), (1, 2, 0, 0)
+        )
+        self.assertEqual(self.stored(), [
+            ("Sheet: Docs\na: docker", 3, 4),
+            ("Sheet: Docs\na: new row", 2, 2),
+            ("Sheet: Docs\na: vectors", 5, 6),
+        ])
+
+        stats = self.sync([_chunk("a: new row", 2, 2), _chunk("a: docker", 3, 4), _chunk("a: vectors", 5, 6)])
+        self.assertEqual((stats["upserted"], stats["updated"], stats["unchanged"]), (0, 0, 3))
+
+    def test_identical_chunks_keep_their_own_points(self):
+        stats = self.sync([_chunk("a: same", 2, 2), _chunk("a: same", 7, 7)])
+        self.assertEqual((stats["source"], stats["upserted"]), (2, 2))
+        self.assertEqual([row[1] for row in self.stored()], [2, 7])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import asyncio
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from graph.tools.web_search import (
+    DuckDuckGoProvider, SearchProvider, SearchResult, StaticSearchProvider, WebSearch, results_to_text
+)
+
+
+RESULTS = {"what is docker": [SearchResult(title="Docker", link="", snippet="Containers")]}
+
+
+class TestWebSearch(unittest.TestCase):
+    def test_cache_by_normalized_query(self):
+        provider = StaticSearchProvider(RESULTS)
+        search = WebSearch(provider, fetch_pages=False)
+        first = search.search("What is Docker")
+        second = search.search("  what IS   docker ")
+        self.assertEqual(first, second)
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(search.stats["hits"], 1)
+
+    def test_ttl_expiry(self):
+        provider = StaticSearchProvider(RESULTS)
+        search = WebSearch(provider, ttl=0, fetch_pages=False)
+        search.search("what is docker")
+        search.search("what is docker")
+        self.assertEqual(provider.calls, 2)
+
+    def test_coalesces_concurrent_queries(self):
+        provider = StaticSearchProvider(RESULTS, latency=0.2)
+        search = WebSearch(provider, fetch_pages=False)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(search.search("what is docker")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(len(results), 5)
+
+    def test_async_search(self):
+        provider = StaticSearchProvider(RESULTS, latency=0.1)
+        search = WebSearch(provider, fetch_pages=False)
+
+        async def run():
+            return await asyncio.gather(*(search.asearch("what is docker") for _ in range(3)))
+
+        results = asyncio.run(run())
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(results_to_text(results[0]), "Docker: Containers")
+
+    def test_cancelled_owner_releases_the_query(self):
+        provider = StaticSearchProvider(RESULTS, latency=0.3)
+        search = WebSearch(provider, fetch_pages=False)
+
+        async def run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(search.asearch("what is docker"), 0.05)
+            return await asyncio.wait_for(search.asearch("what is docker"), 2)
+
+        self.assertEqual(results_to_text(asyncio.run(run())), "Docker: Containers")
+
+    def test_sync_search_inside_running_loop(self):
+        search = WebSearch(StaticSearchProvider(RESULTS), fetch_pages=True)
+
+        async def run():
+            return search.search("what is docker")
+
+        self.assertEqual(results_to_text(asyncio.run(run())), "Docker: Containers")
+
+
+class StubDuckDuckGoWrapper:
+    def __init__(self):
+        self.calls = []
+
+    def results(self, query, max_results, source=None):
+        self.calls.append((query, max_results, source))
+        return [{"title": f"Result {i}", "link": f"https://example.com/{i}", "snippet": "text"} for i in range(10)]
+
+
+class StubDuckDuckGoTool:
+    backend = "auto"
+
+    def __init__(self):
+        self.api_wrapper = StubDuckDuckGoWrapper()
+
+
+class TestSearchProvider(unittest.TestCase):
+    def test_provider_without_search_fails_on_creation(self):
+        class Incomplete(SearchProvider):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestDuckDuckGoProvider(unittest.TestCase):
+    def test_requests_k_results(self):
+        tool = StubDuckDuckGoTool()
+        results = DuckDuckGoProvider(tool).search("what is docker", 3)
+        self.assertEqual(tool.api_wrapper.calls, [("what is docker", 3, "auto")])
+        self.assertEqual([r.title for r in results], ["Result 0", "Result 1", "Result 2"])
+        self.assertEqual(results[0].link, "https://example.com/0")
+
+
+if __name__ == '__main__':
+    unittest.main()